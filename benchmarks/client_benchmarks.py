@@ -0,0 +1,283 @@
+'''
+Measures the throughput, per-request latency + peak memory of VaultClient's bulk operations against
+a local mock vault (see mock_vault.py), so that performance regressions can be caught + compared
+across releases without touching a real vault.
+
+Usage: python benchmarks/client_benchmarks.py [--runs 3] [--scenarios get_molecules,post_slurps_data]
+											  [--save results.json] [--baseline results.json --max-regression 0.2]
+											  [mock vault settings, e.g. --latency 0.05 --rate-429 0.01]
+
+Each scenario is run in a fresh interpreter, so that its peak resident memory (RSS) is measured
+independently. Reports objects (or requests) per second, p50 + p99 request latency and peak RSS.
+
+Exits with status 1 if a scenario fails, or if --baseline is set and a scenario's throughput, p99 latency
+or peak RSS is worse than the baseline's by more than --max-regression (a fraction, e.g. 0.2 = 20%).
+
+'''
+
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from mock_vault import MockVault, addArguments, getSettings
+
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+# Scenarios: each is called with a VaultClient (+ the keyword arguments returned by its setup function,
+# which is not timed), and returns the # of objects (or requests) it processed.
+
+def getMolecules(vault):
+
+	return len(vault.getMolecules(asDataFrame=False))
+
+
+def getMoleculesExport(vault):
+
+	vault.setMaxPagedObjects(0) # Forces an asynchronous export.
+
+	return len(vault.getMolecules(asDataFrame=False))
+
+
+def getProtocolData(vault):
+
+	return len(vault.getProtocolData(1))
+
+
+def putBatchesLoop(vault, count=500):
+
+	for i in range(count): vault.putBatches(i + 1, {"name": f"batch {i}"})
+
+	return count
+
+
+def putBatchesBulk(vault, count=500):
+
+	results = list(vault.putBatchesBulk(((i + 1, {"name": f"batch {i}"}) for i in range(count)), maxWorkers=10))
+
+	assert all(error is None for _, _, error in results), [error for _, _, error in results if error]
+
+	return count
+
+
+def writeSlurpsFile(folder, rows=200000):
+
+	fileName = os.path.join(folder, "readouts.csv")
+
+	with open(fileName, "w") as f:
+
+		f.write("Molecule Name,Run Date,IC50,Note\n")
+		for i in range(rows): f.write(f"MOL-{i % 5000 + 1},2024-01-01,{i * 0.001:.3f},note {i}\n")
+
+	return {"fileName": fileName, "rows": rows}
+
+
+def postSlurpsData(vault, fileName, rows):
+
+	vault.postSlurpsData(fileName, project=1, mappingTemplate=1)
+
+	return rows
+
+
+scenarios = {
+
+	"get_molecules": getMolecules,
+	"get_molecules_export": getMoleculesExport,
+	"get_protocol_data": getProtocolData,
+	"put_batches_loop": putBatchesLoop,
+	"put_batches_bulk": putBatchesBulk,
+	"post_slurps_data": postSlurpsData
+}
+
+setups = {"post_slurps_data": writeSlurpsFile}
+
+
+def getPeakRSS():
+	"""
+	:return (float or None): the peak resident memory of this process in MB, or None if unavailable
+							 (e.g. on Windows).
+	"""
+
+	try: import resource
+
+	except ImportError: return None
+
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+	return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024 # bytes on macOS, KB on Linux.
+
+
+def getPercentile(values, q):
+
+	if not values: return None
+
+	values = sorted(values)
+
+	return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def runScenario(name, URL):
+	"""
+	:Description: runs a single scenario in this process (see measureScenario()).
+
+	:return (dict): the scenario's duration, # of objects + the duration of each request.
+	"""
+
+	sys.path.insert(0, srcDir)
+
+	from cdd_python_sdk.VaultClient import VaultClient
+
+	latencies = []
+
+	def recordLatency(event):
+
+		if event["event"] == "request": latencies.append(event["request"])
+
+	vault = VaultClient(1, "benchmark")
+	vault.URL = URL
+	vault.setMetrics(hooks=[recordLatency])
+
+	with tempfile.TemporaryDirectory() as folder:
+
+		kwargs = setups[name](folder) if name in setups else {}
+
+		start = time.perf_counter()
+		count = scenarios[name](vault, **kwargs)
+		duration = time.perf_counter() - start
+
+	vault.close()
+
+	return {"duration": duration, "count": count, "latencies": latencies, "polls": vault.getPollCount(), "peakRSS": getPeakRSS()}
+
+
+def measureScenario(name, URL):
+	"""
+	:Description: runs a single scenario in a fresh interpreter, which prints its results as json.
+	"""
+
+	command = [sys.executable, os.path.abspath(__file__), "--run-scenario", name, "--url", URL]
+
+	process = subprocess.run(command, capture_output=True, text=True)
+
+	if process.returncode != 0: raise RuntimeError(f"Scenario '{name}' failed:\n{process.stderr}")
+
+	return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def summarize(runs):
+	"""
+	:return (dict): median throughput, p50 + p99 latency (over every request in every run) + peak RSS.
+	"""
+
+	latencies = [latency for run in runs for latency in run["latencies"]]
+	peaks = [run["peakRSS"] for run in runs if run["peakRSS"] is not None]
+
+	return {
+
+		"throughput": statistics.median(run["count"] / run["duration"] for run in runs),
+		"duration": statistics.median(run["duration"] for run in runs),
+		"requests": statistics.median(len(run["latencies"]) for run in runs),
+		"polls": statistics.median(run["polls"] for run in runs),
+		"p50": getPercentile(latencies, 0.50),
+		"p99": getPercentile(latencies, 0.99),
+		"peakRSS": max(peaks) if peaks else None
+	}
+
+
+def compare(results, baseline, maxRegression):
+	"""
+	:Description: compares results against a baseline (both from summarize(), by scenario).
+
+	:return (list): a description of each regression larger than 'maxRegression'.
+	"""
+
+	regressions = []
+
+	for name, result in results.items():
+
+		if name not in baseline: continue
+
+		previous = baseline[name]
+
+		if result["throughput"] < previous["throughput"] * (1 - maxRegression):
+
+			regressions.append(f"{name}: throughput {result['throughput']:.1f}/s vs {previous['throughput']:.1f}/s")
+
+		for key, unit in [("p99", "s"), ("peakRSS", " MB")]:
+
+			if result[key] is None or previous.get(key) is None: continue
+
+			if result[key] > previous[key] * (1 + maxRegression):
+
+				regressions.append(f"{name}: {key} {result[key]:.3f}{unit} vs {previous[key]:.3f}{unit}")
+
+	return regressions
+
+
+def main():
+
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--runs", type=int, default=3)
+	parser.add_argument("--scenarios", default=",".join(scenarios), help="comma-separated scenario names")
+	parser.add_argument("--save", help="file to write the results to, as json")
+	parser.add_argument("--baseline", help="results previously written with --save, to compare against")
+	parser.add_argument("--max-regression", type=float, default=0.2)
+	parser.add_argument("--run-scenario", help=argparse.SUPPRESS)
+	parser.add_argument("--url", help=argparse.SUPPRESS)
+	addArguments(parser)
+	args = parser.parse_args()
+
+	if args.run_scenario: # Child process, see measureScenario().
+
+		print(json.dumps(runScenario(args.run_scenario, args.url)))
+		return
+
+	names = args.scenarios.split(",")
+	unknown = [name for name in names if name not in scenarios]
+	assert not unknown, f"Unknown scenarios: {unknown}. Valid scenarios: {list(scenarios)}"
+
+	settings = getSettings(args)
+	results = {}
+
+	with MockVault(**settings) as mock:
+
+		for name in names:
+
+			results[name] = summarize([measureScenario(name, mock.URL) for _ in range(args.runs)])
+
+	print(f"{'scenario':<24}{'objects/s':>12}{'requests':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak MB':>10}")
+
+	for name, result in results.items():
+
+		p50, p99 = (f"{result[k] * 1000:.1f}" if result[k] is not None else "-" for k in ("p50", "p99"))
+		peak = f"{result['peakRSS']:.1f}" if result["peakRSS"] is not None else "-"
+
+		print(f"{name:<24}{result['throughput']:>12.1f}{result['requests']:>10.0f}{p50:>10}{p99:>10}{peak:>10}")
+
+	if args.save:
+
+		with open(args.save, "w") as f: json.dump({"settings": settings, "results": results}, f, indent=4)
+
+	if args.baseline:
+
+		with open(args.baseline) as f: baseline = json.load(f)
+
+		if baseline["settings"] != settings: print("WARNING: baseline was measured with different mock vault settings.")
+
+		regressions = compare(results, baseline["results"], args.max_regression)
+
+		for regression in regressions: print(f"FAIL: {regression}")
+
+		sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+
+	main()
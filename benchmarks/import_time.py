@@ -0,0 +1,70 @@
+'''
+Measures how long it takes to import cdd_python_sdk in a fresh interpreter, and checks that
+importing the client does not import heavy optional modules (pandas, numpy, pyarrow, aiohttp).
+
+Usage: python benchmarks/import_time.py [--runs 10] [--max-ms 500]
+
+Exits with status 1 if the median import time exceeds --max-ms, or if a heavy module is imported.
+
+'''
+
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+srcDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+heavyModules = ["pandas", "numpy", "pyarrow", "aiohttp"]
+
+script = f"""
+import sys, time
+start = time.perf_counter()
+import cdd_python_sdk.VaultClient
+elapsed = time.perf_counter() - start
+print(elapsed * 1000, ",".join(m for m in {heavyModules!r} if m in sys.modules))
+"""
+
+
+def measureImport():
+	"""
+	:return (tuple): the import time in milliseconds, and the heavy modules it imported.
+	"""
+
+	env = {**os.environ, "PYTHONPATH": os.pathsep.join([srcDir, os.environ.get("PYTHONPATH", "")])}
+
+	output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True).stdout
+
+	elapsed, _, modules = output.strip().partition(" ")
+
+	return float(elapsed), [m for m in modules.split(",") if m]
+
+
+def main():
+
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--runs", type=int, default=10)
+	parser.add_argument("--max-ms", type=float, default=500.0)
+	args = parser.parse_args()
+
+	results = [measureImport() for _ in range(args.runs)]
+
+	times = [elapsed for elapsed, _ in results]
+	modules = sorted({m for _, imported in results for m in imported})
+
+	median = statistics.median(times)
+
+	print(f"import cdd_python_sdk.VaultClient: median {median:.1f} ms, min {min(times):.1f} ms, max {max(times):.1f} ms ({args.runs} runs)")
+
+	if modules: print(f"FAIL: heavy modules imported at startup: {', '.join(modules)}")
+	if median > args.max_ms: print(f"FAIL: median import time exceeds {args.max_ms:.0f} ms")
+
+	sys.exit(1 if modules or median > args.max_ms else 0)
+
+
+if __name__ == "__main__":
+
+	main()
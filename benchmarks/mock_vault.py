@@ -0,0 +1,336 @@
+'''
+Local stand-in for the CDD Vault API, used by the client benchmarks (see client_benchmarks.py).
+
+Emulates the endpoints the client uses for bulk reads + writes, with configurable latency,
+payload size, rate of 429 (Too Many Requests) responses and asynchronous export + slurp durations:
+
+	GET  /molecules, /protocols/{id}/data, /readout_rows   (synchronous pages, or async=true exports)
+	GET  /export_progress/{id}, /exports/{id}
+	POST /slurps, GET /slurps/{id}, GET /protocols?slurp={id}
+	POST /files, GET /files/{id}
+	PUT + POST to any other endpoint (e.g. /batches/{id}), which echo the request's id.
+
+Usage: python benchmarks/mock_vault.py [--port 0] [--latency 0.02] [--rate-429 0.0] ...
+
+Prints the vault's base URL (e.g. "http://127.0.0.1:8123/api/v1/vaults/1") once the server is listening.
+
+'''
+
+
+import argparse
+import base64
+import json
+import random
+import re
+import threading
+import time
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+
+class MockVault(object):
+	"""
+	:Description: threaded HTTP server emulating a single CDD Vault. Objects are generated once,
+				  deterministically from 'seed', and pre-encoded so that serving a page costs
+				  little CPU compared to the client parsing it.
+
+	:latency (float): seconds each request waits before responding.
+
+	:payloadBytes (int): size of the padding string added to each molecule + readout row.
+
+	:rate429 (float): fraction of requests answered with 429 (Too Many Requests) + "Retry-After: 0".
+
+	:exportSeconds (float): time from starting an asynchronous export until it is finished.
+
+	:slurpSeconds (float): time from uploading a slurp until it is committed.
+	"""
+
+	def __init__(self, port=0, latency=0.02, payloadBytes=200, molecules=5000, readouts=5000,
+				 rate429=0.0, exportSeconds=1.0, slurpSeconds=1.0, fileBytes=1024 * 1024, seed=0):
+
+		self.latency = latency
+		self.rate429 = rate429
+		self.exportSeconds = exportSeconds
+		self.slurpSeconds = slurpSeconds
+		self.fileBytes = fileBytes
+
+		self.random = random.Random(seed)
+		self.lock = threading.Lock()
+
+		padding = "x" * payloadBytes
+
+		self.objects = {
+
+			"molecules": [json.dumps({"id": i, "class": "molecule", "name": f"MOL-{i}",
+									  "smiles": "CC(=O)Oc1ccccc1C(=O)O", "registration_type": "CHEMICAL_STRUCTURE",
+									  "batches": [{"id": 10 * i, "name": f"MOL-{i}-001"}],
+									  "padding": padding}).encode() for i in range(1, molecules + 1)],
+
+			"readouts": [json.dumps({"id": i, "run": 100 + i % 10, "batch": 10 * (i % molecules + 1), "protocol": 1,
+									 "readouts": {"101": {"value": self.random.uniform(0, 100), "outlier": False},
+												  "102": f"note {i}"},
+									 "padding": padding}).encode() for i in range(1, readouts + 1)]
+		}
+
+		self.exports = {} # id: (entity, CSV format?, finish time)
+		self.slurps = {} # id: commit time
+		self.nextID = 1
+
+		self.server = ThreadingHTTPServer(("127.0.0.1", port), self.makeHandler())
+		self.server.daemon_threads = True
+
+		self.URL = f"http://127.0.0.1:{self.server.server_address[1]}/api/v1/vaults/1"
+
+
+	def __enter__(self):
+
+		self.start()
+
+		return self
+
+
+	def __exit__(self, *args):
+
+		self.stop()
+
+
+	def start(self):
+
+		# Polls for shutdown often, so that stopping the server (e.g. between tests) is quick:
+
+		threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+
+
+	def stop(self):
+
+		self.server.shutdown()
+		self.server.server_close()
+
+
+	def getID(self):
+
+		with self.lock:
+
+			self.nextID += 1
+
+			return self.nextID
+
+
+	def getPage(self, entity, query):
+		"""
+		:return (bytes): a synchronous GET response for 'entity', honouring 'offset' + 'page_size'.
+		"""
+
+		objects = self.objects[entity]
+
+		offset = int(query.get("offset", 0))
+		pageSize = int(query.get("page_size", 50))
+
+		return (b'{"count": %d, "offset": %d, "page_size": %d, "objects": [' % (len(objects), offset, pageSize)
+				+ b", ".join(objects[offset:offset + pageSize]) + b"]}")
+
+
+	def startExport(self, entity, query):
+
+		exportID = self.getID()
+
+		self.exports[exportID] = (entity, "format" in query, time.monotonic() + self.exportSeconds)
+
+		return json.dumps({"id": exportID, "status": "new"}).encode()
+
+
+	def getExport(self, exportID):
+
+		entity, asCSV, _ = self.exports[exportID]
+		objects = self.objects[entity]
+
+		if asCSV:
+
+			rows = (json.loads(o) for o in objects)
+			return ("id,run,batch,value\n" + "".join(f'{r["id"]},{r["run"]},{r["batch"]},{r["readouts"]["101"]["value"]}\n'
+													  for r in rows)).encode()
+
+		return b'{"count": %d, "objects": [' % len(objects) + b", ".join(objects) + b"]}"
+
+
+	def handle(self, verb, path, queryString, body, headers=None):
+		"""
+		:Description: handles a single request, see respond(). Subclasses may override this to record
+					  requests, or to replace the responses to some of them.
+
+					  Successful GET responses honour a "Range: bytes={start}-" request header.
+
+		:headers (dict): optional. The request's headers.
+
+		:return (tuple): status code, response body (bytes) + optionally a dict of extra headers.
+		"""
+
+		query = {k: v[0] for k, v in parse_qs(queryString).items()}
+
+		status, response, *extra = self.respond(verb, path, query, body)
+
+		match = re.fullmatch(r"bytes=(\d+)-", (headers or {}).get("Range", ""))
+
+		if verb == "GET" and status == 200 and match:
+
+			start = int(match.group(1))
+
+			return 206, response[start:], {"Content-Range": f"bytes {start}-{len(response) - 1}/{len(response)}"}
+
+		return (status, response, *extra)
+
+
+	def respond(self, verb, path, query, body):
+		"""
+		:Description: routes a single request.
+
+		:return (tuple): status code + response body (bytes).
+		"""
+
+		if self.rate429 and self.random.random() < self.rate429: return 429, b'{"error": "Too Many Requests"}'
+
+		path = re.sub(r"^/api/v1/vaults/\d+", "", path)
+
+		entity = {"/molecules": "molecules", "/readout_rows": "readouts"}.get(path)
+		if re.fullmatch(r"/protocols/\d+/data", path): entity = "readouts"
+
+		if verb == "GET" and entity:
+
+			if query.get("async") == "true" or "format" in query: return 200, self.startExport(entity, query)
+
+			return 200, self.getPage(entity, query)
+
+		match = re.fullmatch(r"/export_progress/(\d+)", path)
+		if match:
+
+			exportID = int(match.group(1))
+			status = "finished" if time.monotonic() >= self.exports[exportID][2] else "started"
+
+			return 200, json.dumps({"id": exportID, "status": status}).encode()
+
+		match = re.fullmatch(r"/exports/(\d+)", path)
+		if match: return 200, self.getExport(int(match.group(1)))
+
+		if path == "/slurps" and verb == "POST":
+
+			slurpID = self.getID()
+			self.slurps[slurpID] = time.monotonic() + self.slurpSeconds
+
+			return 200, json.dumps({"id": slurpID, "state": "new"}).encode()
+
+		match = re.fullmatch(r"/slurps/(\d+)", path)
+		if match:
+
+			slurpID = int(match.group(1))
+			state = "committed" if time.monotonic() >= self.slurps[slurpID] else "processing"
+
+			return 200, json.dumps({"id": slurpID, "state": state}).encode()
+
+		if path == "/protocols" and "slurp" in query:
+
+			return 200, json.dumps({"count": 1, "objects": [{"id": 1, "name": "Benchmark protocol",
+															  "runs": [{"id": 101, "slurp": int(query["slurp"])}]}]}).encode()
+
+		match = re.fullmatch(r"/files/(\d+)", path)
+		if match and verb == "GET":
+
+			contents = base64.b64encode(bytes(range(256)) * (self.fileBytes // 256)).decode()
+
+			return 200, json.dumps({"id": int(match.group(1)), "name": f"file{match.group(1)}.bin", "contents": contents}).encode()
+
+		if path == "/files" and verb == "POST": return 200, json.dumps({"id": self.getID(), "size": len(body)}).encode()
+
+		if verb in ("PUT", "POST"):
+
+			match = re.search(r"/(\d+)$", path)
+			objectID = int(match.group(1)) if match else self.getID()
+
+			return 200, json.dumps({"id": objectID, "modified_at": "2024-01-01T00:00:00.000Z"}).encode()
+
+		return 404, b'{"error": "Not Found"}'
+
+
+	def makeHandler(self):
+
+		vault = self
+
+		class Handler(BaseHTTPRequestHandler):
+
+			protocol_version = "HTTP/1.1" # Keep-alive, as with the real API.
+			wbufsize = 1 << 16 # Sends headers + body together, avoiding delayed ACK stalls.
+
+			def log_message(self, *args): pass
+
+			def handleRequest(self):
+
+				split = urlsplit(self.path)
+
+				length = int(self.headers.get("Content-Length") or 0)
+				body = self.rfile.read(length) if length else b""
+
+				if vault.latency: time.sleep(vault.latency)
+
+				status, response, *headers = vault.handle(self.command, split.path, split.query, body, dict(self.headers))
+
+				headers = {"Content-Type": "application/json", **(headers[0] if headers else {})}
+				if status == 429: headers.setdefault("Retry-After", "0")
+
+				headers.setdefault("Content-Length", str(len(response)))
+
+				self.send_response(status)
+				for name, value in headers.items(): self.send_header(name, value)
+				self.end_headers()
+
+				self.wfile.write(response)
+
+			do_GET = do_POST = do_PUT = do_DELETE = handleRequest
+
+		return Handler
+
+
+def addArguments(parser):
+	"""
+	:Description: adds the mock server's settings to an argparse parser, see getSettings().
+	"""
+
+	parser.add_argument("--latency", type=float, default=0.02, help="seconds each request waits before responding")
+	parser.add_argument("--payload-bytes", type=int, default=200, help="padding added to each molecule + readout row")
+	parser.add_argument("--molecules", type=int, default=5000)
+	parser.add_argument("--readouts", type=int, default=5000)
+	parser.add_argument("--rate-429", type=float, default=0.0, help="fraction of requests answered with 429")
+	parser.add_argument("--export-seconds", type=float, default=1.0)
+	parser.add_argument("--slurp-seconds", type=float, default=1.0)
+	parser.add_argument("--file-bytes", type=int, default=1024 * 1024, help="size of each file returned by GET /files/{id}")
+	parser.add_argument("--seed", type=int, default=0)
+
+
+def getSettings(args):
+	"""
+	:return (dict): MockVault keyword arguments from parsed command line arguments (see addArguments()).
+	"""
+
+	return {"latency": args.latency, "payloadBytes": args.payload_bytes, "molecules": args.molecules,
+			"readouts": args.readouts, "rate429": args.rate_429, "exportSeconds": args.export_seconds,
+			"slurpSeconds": args.slurp_seconds, "fileBytes": args.file_bytes, "seed": args.seed}
+
+
+def main():
+
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--port", type=int, default=0)
+	addArguments(parser)
+	args = parser.parse_args()
+
+	vault = MockVault(port=args.port, **getSettings(args))
+
+	print(vault.URL, flush=True)
+
+	try: vault.server.serve_forever()
+
+	except KeyboardInterrupt: vault.server.server_close()
+
+
+if __name__ == "__main__":
+
+	main()
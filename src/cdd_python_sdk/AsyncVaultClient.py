@@ -0,0 +1,1141 @@
+'''
+______________________________________________________________________________________________________________________________________________
+Copyright © 2022 Workflow Informatics - Distribution of this software without written permission of Workflow Informatics is prohibited.
+
+This SOFTWARE PRODUCT is provided by Workflow Informatics "as is" and "with all faults."
+
+Workflow Informatics makes no representations or warranties of any kind concerning the safety, suitability, inaccuracies, typographical errors, or other harmful components of this SOFTWARE PRODUCT.
+
+You are solely responsible for determining whether this SOFTWARE PRODUCT is compatible with your equipment and other software installed on your equipment.
+
+You are solely responsible for the protection of your equipment and backup of your data.
+
+Workflow Informatics will not be liable for any damages you may suffer in connection with using or modifying this SOFTWARE PRODUCT
+______________________________________________________________________________________________________________________________________________
+
+asyncio counterpart of VaultClient. Every API method is exposed as a coroutine and sent through
+a shared aiohttp session, so that many requests can be in flight under a single event loop.
+
+Requires the optional 'aiohttp' dependency: pip install cdd_python_sdk[async]
+
+'''
+
+
+import datetime as dt
+
+import asyncio
+import aiohttp
+import json
+import os
+import base64
+import time
+import zipfile
+
+from io import StringIO
+
+from .VaultClient import VaultClient, KwargSpec, LazyModule, appendToDocString, splitIDList
+
+pd = LazyModule("pandas")
+
+
+class RetryResponse(object):
+	"""
+	:Description: adapts an aiohttp response to the 'status_code' + 'headers' attributes
+				  of a requests response, as expected by RetryPolicy.
+	"""
+
+	def __init__(self, response):
+
+		self.status_code = response.status
+		self.headers = response.headers
+
+
+class AsyncVaultClient(object):
+
+	def __init__(self, vaultNum, apiKey, maxConcurrency=100, limitPerHost=0, keepAlive=True):
+
+		self.setVaultNumAndURL(vaultNum)
+		self.setAPIKey(apiKey)
+
+		self.setMaxSyncObjects()
+		self.setMaxPagedObjects()
+		self.setIDSharding()
+		self.setPollingStrategy()
+		self.setRetryPolicy()
+		self.setRateLimit()
+		self.setMetrics()
+		self.setSession(maxConcurrency, limitPerHost, keepAlive)
+
+
+	def __str__(self):
+
+		return f'Async client for Vault ID: {self.vaultNum} instantiated {str(dt.datetime.now())}'
+
+
+	async def __aenter__(self):
+
+		return self
+
+
+	async def __aexit__(self, excType, excValue, traceback):
+
+		await self.close()
+
+
+	# Attributes + query-string validation are shared with VaultClient, so that both
+	# clients accept + reject exactly the same keyword arguments:
+
+	setVaultNumAndURL = VaultClient.setVaultNumAndURL
+	getVaultNum = VaultClient.getVaultNum
+	getURL = VaultClient.getURL
+	setAPIKey = VaultClient.setAPIKey
+	getAPIKey = VaultClient.getAPIKey
+	setMaxSyncObjects = VaultClient.setMaxSyncObjects
+	setMaxPagedObjects = VaultClient.setMaxPagedObjects
+	setIDSharding = VaultClient.setIDSharding
+	getShardedKwarg = VaultClient.getShardedKwarg
+	getShardSize = VaultClient.getShardSize
+	mergeShards = VaultClient.mergeShards
+	isIncomplete = VaultClient.isIncomplete
+	setPollingStrategy = VaultClient.setPollingStrategy
+	getPollingStrategy = VaultClient.getPollingStrategy
+	getPollCount = VaultClient.getPollCount
+	setRetryPolicy = VaultClient.setRetryPolicy
+	setRateLimit = VaultClient.setRateLimit
+	getValidKwargs = VaultClient.getValidKwargs
+	buildQueryString = VaultClient.buildQueryString
+	setMetrics = VaultClient.setMetrics
+	recordMetrics = VaultClient.recordMetrics
+	getEndpoint = VaultClient.getEndpoint
+	recordPoll = VaultClient.recordPoll
+	toDataFrame = VaultClient.toDataFrame
+	getProjection = VaultClient.getProjection
+	selectObjects = VaultClient.selectObjects
+
+
+	def setSession(self, maxConcurrency=100, limitPerHost=0, keepAlive=True):
+		"""
+		:Description: sets the connection limits used for the aiohttp session. The session
+					  itself is created lazily by getSession(), since it must be bound to
+					  the running event loop.
+
+		:maxConcurrency (int): the maximum # of requests in flight at once. Also used as the
+							   total connection limit of the session.
+
+		:limitPerHost (int): the maximum # of open connections per host (0 for no limit).
+
+		:keepAlive (bool): if False, connections are closed after every request.
+		"""
+
+		self.maxConcurrency = maxConcurrency
+		self.limitPerHost = limitPerHost
+		self.keepAlive = keepAlive
+
+		self.session = None
+		self.semaphore = None
+
+
+	async def getSession(self):
+		"""
+		:Description: returns the aiohttp session used to send requests to CDD Vault,
+					  creating it (and the concurrency semaphore) on first use.
+
+		:return (aiohttp.ClientSession):
+		"""
+
+		if self.session is None or self.session.closed:
+
+			connector = aiohttp.TCPConnector(limit=self.maxConcurrency,
+											 limit_per_host=self.limitPerHost,
+											 force_close=not self.keepAlive)
+
+			self.session = aiohttp.ClientSession(connector=connector)
+			self.semaphore = asyncio.Semaphore(self.maxConcurrency)
+
+		return self.session
+
+
+	async def close(self):
+		"""
+		:Description: closes the aiohttp session + releases all pooled connections.
+
+					  Also called automatically when the client is used as an async
+					  context manager, e.g. 'async with AsyncVaultClient(vaultNum, apiKey) as vault:'.
+		"""
+
+		if self.session is not None: await self.session.close()
+
+
+	async def sendRequest(self, method, URL, asText=False, asBytes=False, filePath=None, chunkSize=1024 * 1024, **kwargs):
+		"""
+		:Description: general coroutine for sending requests to CDD Vault, bounded by the
+					  client's concurrency semaphore. Applies the same rate limit + retry policy
+					  as VaultClient.sendRequest(). Connections dropped partway through a response
+					  body are also retried.
+
+					  Reports the same metrics as VaultClient (see setMetrics()), except that the 
+					  time to first byte includes the time spent opening a new connection, 
+					  which is not recorded separately.
+
+		:filePath (str): optional. If set, the response body is streamed to this file in chunks of up to
+						 'chunkSize' bytes, and the # of bytes written is returned.
+		"""
+
+		session = await self.getSession()
+
+		headers = {"X-CDD-Token": self.apiKey}
+
+		instrumented = self.metrics is not None or bool(self.metricHooks)
+		if instrumented: endpoint = self.getEndpoint(URL)
+
+		attempt = 0
+
+		while True:
+
+			attempt += 1
+
+			if self.rateLimiter: await asyncio.sleep(self.rateLimiter.reserve())
+
+			try:
+				async with self.semaphore:
+
+					start = time.perf_counter()
+
+					async with session.request(method, URL, headers=headers, **kwargs) as response:
+
+						ttfb = time.perf_counter() - start
+
+						retryable = response.status >= 400 and self.retryPolicy.isRetryable(method, attempt, RetryResponse(response))
+
+						if not retryable:
+
+							if instrumented and not response.ok:
+
+								self.recordMetrics("request", endpoint, {"ttfb": ttfb, "request": ttfb}, {"requests": 1}, 
+												   method=method, status=response.status)
+
+							response.raise_for_status()
+
+							if filePath is not None:
+
+								received = 0
+
+								with open(filePath, "wb") as f: # Rewritten from the start by each attempt.
+
+									async for chunk in response.content.iter_chunked(chunkSize):
+
+										f.write(chunk)
+										received += len(chunk)
+
+							else:
+								body = await response.read()
+								received = len(body)
+
+							if instrumented:
+
+								duration = time.perf_counter() - start
+
+								self.recordMetrics("request", endpoint, 
+												   {"ttfb": ttfb, "download": duration - ttfb, "request": duration}, 
+												   {"requests": 1, "bytes_received": received},
+												   method=method, status=response.status)
+
+							if filePath is not None: return received
+
+							if asBytes: return body
+
+							text = body.decode(response.get_encoding())
+
+							if asText: return text
+
+							start = time.perf_counter()
+
+							data = json.loads(text) if text.strip() else None
+
+							if instrumented: self.recordMetrics("json", endpoint, timings={"json_decode": time.perf_counter() - start})
+
+							return data
+
+						if instrumented:
+
+							self.recordMetrics("request", endpoint, {"ttfb": ttfb, "request": ttfb}, {"requests": 1}, 
+											   method=method, status=response.status)
+
+						delay = self.retryPolicy.getDelay(attempt, RetryResponse(response))
+
+			except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+
+				if instrumented: 
+					
+					self.recordMetrics("error", endpoint, counts={"request_errors": 1}, method=method, error=type(e).__name__)
+
+				if not self.retryPolicy.isRetryable(method, attempt): raise
+
+				delay = self.retryPolicy.getDelay(attempt)
+
+			if instrumented: self.recordMetrics("retry", endpoint, counts={"retries": 1}, method=method)
+
+			await asyncio.sleep(delay)
+
+
+	async def sendGetRequest(self, URL, asText=False, asBytes=False):
+
+		return await self.sendRequest("GET", URL, asText=asText, asBytes=asBytes)
+
+
+	async def sendPostRequest(self, URL, jsonObj):
+		"""
+		:Description: general coroutine for sending POST requests to CDD vault.
+
+					  'jsonObj' must either be a valid json object, or a string
+					  file path pointing to a valid json file.
+		"""
+
+		if isinstance(jsonObj, str):
+
+			with open(jsonObj, "r") as f: jsonObj = json.load(f)
+
+		return await self.sendRequest("POST", URL, json=jsonObj)
+
+
+	async def sendPutRequest(self, URL, jsonObj):
+		"""
+		:Description: general coroutine for sending PUT requests to CDD vault.
+
+					  'jsonObj' must either be a valid json object, or a string
+					  file path pointing to a valid json file.
+		"""
+
+		if isinstance(jsonObj, str):
+
+			with open(jsonObj, "r") as f: jsonObj = json.load(f)
+
+		return await self.sendRequest("PUT", URL, json=jsonObj)
+
+
+	async def sendDeleteRequest(self, URL):
+
+		return await self.sendRequest("DELETE", URL)
+
+
+	async def sendSyncAndAsyncGets(self, suffix, kwargs, valid_kwargs):
+		"""
+		:Description: coroutine version of VaultClient.sendSyncAndAsyncGets().
+		"""
+
+		sharded = self.getShardedKwarg(kwargs, valid_kwargs)
+		if sharded is not None: return await self.sendShardedGets(suffix, kwargs, valid_kwargs, *sharded)
+
+		kwargs["page_size"] = self.maxSyncObjects
+		queryString = self.buildQueryString(kwargs, valid_kwargs)
+
+		URL = self.URL + suffix + queryString
+
+		objects = await self.sendGetRequest(URL)
+
+		if self.isIncomplete(objects) and objects["count"] <= self.maxPagedObjects:
+
+			pages = await self.getPages(suffix, kwargs, valid_kwargs, objects["count"])
+			objects = objects["objects"] + [obj for page in pages for obj in page]
+
+		elif self.isIncomplete(objects):
+
+			kwargs["async"] = "true"
+			queryString = self.buildQueryString(kwargs, valid_kwargs)
+			URL = self.URL + suffix + queryString
+
+			exportID = (await self.sendGetRequest(URL))["id"]
+			objects = await self.getAsyncExport(exportID, statusUpdates=False, key=suffix, size=objects["count"])
+
+		else: objects = objects["objects"]
+
+		return objects
+
+
+	async def sendShardedGets(self, suffix, kwargs, valid_kwargs, key, ids):
+		"""
+		:Description: coroutine version of VaultClient.sendShardedGets(). The remaining shards are 
+					  requested concurrently, bounded by the client's concurrency limit.
+		"""
+
+		async def getShard(shard):
+
+			return await self.sendSyncAndAsyncGets(suffix, {**kwargs, key: shard}, valid_kwargs)
+
+		first = splitIDList(ids, self.maxSyncObjects, self.maxShardLength)[0]
+		results = [await getShard(first)]
+
+		shards = splitIDList(ids[len(first):], self.getShardSize(first, len(results[0])), self.maxShardLength)
+
+		results.extend(await asyncio.gather(*[getShard(shard) for shard in shards]))
+
+		self.recordMetrics("shards", self.getEndpoint(suffix), counts={"shards": len(shards) + 1})
+
+		return self.mergeShards(results)
+
+
+	async def getPages(self, suffix, kwargs, valid_kwargs, count):
+		"""
+		:Description: coroutine version of VaultClient.iterPages(), returning the list of objects 
+					  on every page after the first, in order.
+		"""
+
+		valid_kwargs = KwargSpec(valid_kwargs).withKeys("offset")
+
+		async def getPage(offset):
+
+			pageKwargs = {**kwargs, "page_size": self.maxSyncObjects, "offset": offset}
+			queryString = self.buildQueryString(pageKwargs, valid_kwargs)
+
+			return (await self.sendGetRequest(self.URL + suffix + queryString))["objects"]
+
+		offsets = range(self.maxSyncObjects, count, self.maxSyncObjects)
+
+		return await asyncio.gather(*[getPage(offset) for offset in offsets])
+
+
+	@appendToDocString(helpDoc="get_api_execution_metrics.txt")
+	async def getAPIExecutionMetrics(self, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getAPIExecutionMetrics().
+		"""
+
+		helpDoc = "get_api_execution_metrics.txt"
+		valid_kwargs = self.getValidKwargs(helpDoc)
+
+		queryString = self.buildQueryString(kwargs, valid_kwargs)
+
+		URL = self.URL + "/api_executions" + queryString
+
+		return await self.sendGetRequest(URL)
+
+
+	async def getAsyncExport(self, exportID, interval=None, asText=False, asBytes=False, statusUpdates=True,
+																						key=None, size=None, filePath=None):
+		"""
+		:Description: coroutine version of VaultClient.getAsyncExport().
+
+					  Cancelling the awaiting task deletes the in-progress export in CDD Vault
+					  before the cancellation is propagated.
+		"""
+
+		strategy = self.getPollingStrategy(interval)
+		start = time.monotonic()
+		pollNumber = 0
+
+		try:
+			URL = self.URL + f"/export_progress/{exportID}"
+
+			nonErrorStates = ["new", "started", "finished"]
+
+			while True:
+
+				response = await self.sendGetRequest(URL)
+				pollNumber += 1
+				self.recordPoll("/exports")
+
+				if statusUpdates: print(response)
+				status = response["status"]
+
+				assert status in nonErrorStates, f"Export status '{status}' indicates the export has failed to complete."
+
+				if status == "finished": break
+
+				await asyncio.sleep(strategy.getDelay(pollNumber, time.monotonic() - start, key, size))
+
+			strategy.record(key, time.monotonic() - start, size)
+
+			self.recordMetrics("export", key or "/exports", timings={"export_wait": time.monotonic() - start})
+
+		except asyncio.CancelledError: # Cancels in-progress asynchronous export.
+
+			delResponse = await asyncio.shield(self.deleteExport(exportID))
+			if statusUpdates: print(delResponse)
+
+			raise
+
+
+		# Get export data:
+
+		if filePath is not None: return await self.downloadExport(exportID, filePath)
+
+		URL = self.URL + f"/exports/{exportID}"
+
+		if asText: return await self.sendGetRequest(URL, asText=asText)
+
+		elif asBytes: return await self.sendGetRequest(URL, asBytes=asBytes)
+
+		return (await self.sendGetRequest(URL))["objects"]
+
+
+	async def downloadExport(self, exportID, filePath, chunkSize=1024 * 1024):
+		"""
+		:Description: coroutine version of VaultClient.downloadExport(), streaming the data for a finished 
+					  asynchronous export to 'filePath' in chunks. A download whose connection drops is 
+					  restarted from the beginning, rather than resumed.
+
+		:return (int): the # of bytes written.
+		"""
+
+		return await self.sendRequest("GET", self.URL + f"/exports/{exportID}", filePath=filePath, chunkSize=chunkSize)
+
+
+	async def getBatchMoveJobs(self, batchMoveJobID=None):
+		"""
+		:Description: coroutine version of VaultClient.getBatchMoveJobs().
+		"""
+
+		suffix = "/batch_move_jobs"
+		if batchMoveJobID:
+			suffix += f"/{batchMoveJobID}"
+
+		return await self.sendGetRequest(self.URL + suffix)
+
+
+	@appendToDocString(helpDoc="get_batches.txt")
+	async def getBatches(self, asDataFrame=True, select=None, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getBatches().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_batches.txt")
+
+		if select is not None:
+
+			fields = await self.getFields(asDataFrame=False) if set(select) - {"id"} else None
+			paths, types = self.getProjection("batch", select, fields, kwargs, valid_kwargs)
+
+			batches = await self.sendSyncAndAsyncGets("/batches", kwargs, valid_kwargs)
+
+			return self.selectObjects(batches, paths, types, asDataFrame, "/batches")
+
+		batches = await self.sendSyncAndAsyncGets("/batches", kwargs, valid_kwargs)
+
+		if asDataFrame: batches = self.toDataFrame(batches, "/batches")
+
+		return batches
+
+
+	@appendToDocString(helpDoc="get_collections.txt")
+	async def getCollections(self, asDataFrame=True, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getCollections().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_collections.txt")
+
+		collections = await self.sendSyncAndAsyncGets("/collections", kwargs, valid_kwargs)
+
+		if asDataFrame: collections = self.toDataFrame(collections, "/collections")
+
+		return collections
+
+
+	async def getDatasets(self, asDataFrame=True):
+		"""
+		:Description: coroutine version of VaultClient.getDatasets().
+		"""
+
+		datasets = await self.sendGetRequest(self.URL + "/data_sets")
+		if asDataFrame: datasets = self.toDataFrame(datasets, "/data_sets")
+
+		return datasets
+
+
+	@appendToDocString(helpDoc="get_ELN_entries.txt")
+	async def getELNEntries(self, asDataFrame=True,
+							exportPath=None, unzipELNEntries=False, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getELNEntries().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_ELN_entries.txt")
+
+		if exportPath is None:
+
+			URL = self.URL + "/eln/entries" + self.buildQueryString(kwargs, valid_kwargs)
+
+			elnEntries = (await self.sendGetRequest(URL))["objects"]
+			if asDataFrame: elnEntries = self.toDataFrame(elnEntries, "/eln/entries")
+
+			return elnEntries
+
+
+		URL = self.URL + "/eln/entries?async=true&" + self.buildQueryString(kwargs, valid_kwargs)[1:]
+
+		exportID = (await self.sendGetRequest(URL))["id"]
+		await self.getAsyncExport(exportID=exportID, key="/eln/entries", filePath=exportPath)
+
+		if unzipELNEntries:
+
+			directory = os.path.splitext(exportPath)[0]
+			with zipfile.ZipFile(exportPath, "r") as z:
+
+				z.extractall(directory)
+
+
+	async def getFields(self, asDataFrame=True):
+		"""
+		:Description: coroutine version of VaultClient.getFields().
+		"""
+
+		fields = await self.sendGetRequest(self.URL + "/fields")
+		if asDataFrame:
+
+			fields = {k:self.toDataFrame(fields[k], "/fields") for k in fields}
+
+		return fields
+
+
+	async def getFile(self, fileID, destFolder=None):
+		"""
+		:Description: coroutine version of VaultClient.getFile().
+		"""
+
+		response = await self.sendGetRequest(self.URL + f"/files/{fileID}")
+
+		contents = base64.b64decode(response["contents"])
+
+		if destFolder:
+
+			destPath = os.path.join(destFolder, response["name"])
+
+			with open(destPath, "wb") as f: f.write(contents)
+
+		return contents
+
+
+	@appendToDocString(helpDoc="get_sample_inventory.txt")
+	async def getInventorySamples(self, asDataFrame=True, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getInventorySamples().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_sample_inventory.txt")
+
+		samples = await self.sendSyncAndAsyncGets("/inventory_samples", kwargs, valid_kwargs)
+
+		if asDataFrame: samples = self.toDataFrame(samples, "/inventory_samples")
+
+		return samples
+
+
+	async def getInventoryLocations(self, asDataFrame=True):
+		"""
+		:Description: coroutine version of VaultClient.getInventoryLocations().
+		"""
+
+		locations = await self.sendGetRequest(self.URL + "/inventory_locations")
+		if asDataFrame: locations = self.toDataFrame(locations, "/inventory_locations")
+
+		return locations
+
+
+	async def getMappingTemplates(self, id=None, asDataFrame=True):
+		"""
+		:Description: coroutine version of VaultClient.getMappingTemplates().
+		"""
+
+		if id is None:
+
+			response = await self.sendGetRequest(self.URL + "/mapping_templates")
+			if asDataFrame: response = self.toDataFrame(response, "/mapping_templates")
+
+		else: response = await self.sendGetRequest(self.URL + f"/mapping_templates/{id}")
+
+		return response
+
+
+	async def getMoleculeImage(self, molID, filePath=None):
+		"""
+		:Description: coroutine version of VaultClient.getMoleculeImage().
+		"""
+
+		exportID = (await self.sendGetRequest(self.URL + f"/molecules/{molID}/image"))["id"]
+
+		molImage = await self.getAsyncExport(exportID=exportID, asBytes=True, key="/molecules/image")
+
+		if filePath:
+
+			with open(filePath, "wb") as f: f.write(molImage)
+
+		return molImage
+
+
+	@appendToDocString(helpDoc="get_molecules.txt")
+	async def getMolecules(self, asDataFrame=True, select=None, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getMolecules().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_molecules.txt")
+
+		if select is not None:
+
+			fields = await self.getFields(asDataFrame=False) if set(select) - {"id"} else None
+			paths, types = self.getProjection("molecule", select, fields, kwargs, valid_kwargs)
+
+			molecules = await self.sendSyncAndAsyncGets("/molecules", kwargs, valid_kwargs)
+
+			return self.selectObjects(molecules, paths, types, asDataFrame, "/molecules")
+
+		molecules = await self.sendSyncAndAsyncGets("/molecules", kwargs, valid_kwargs)
+
+		if asDataFrame: molecules = self.toDataFrame(molecules, "/molecules")
+
+		return molecules
+
+
+	@appendToDocString(helpDoc="get_plates.txt")
+	async def getPlates(self, asDataFrame=True, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getPlates().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_plates.txt")
+
+		plates = await self.sendSyncAndAsyncGets("/plates", kwargs, valid_kwargs)
+
+		if asDataFrame: plates = self.toDataFrame(plates, "/plates")
+
+		return plates
+
+
+	async def getPlot(self, batchID, protocolID, size="small", destFolder=None):
+		"""
+		:Description: coroutine version of VaultClient.getPlot().
+		"""
+
+		assert size in ["small", "medium", "large"], "Not a valid value."
+
+		URL = self.URL + f"/batches/{batchID}/protocols/{protocolID}/plot" + f"?{size}"
+
+		response = await self.sendGetRequest(URL=URL)
+		print(response)
+
+
+	@appendToDocString(helpDoc="get_protocols.txt")
+	async def getProtocols(self, asDataFrame=True, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getProtocols().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_protocols.txt")
+
+		protocols = await self.sendSyncAndAsyncGets("/protocols", kwargs, valid_kwargs)
+
+		if asDataFrame: protocols = self.toDataFrame(protocols, "/protocols")
+
+		return protocols
+
+
+	@appendToDocString(helpDoc="get_protocol_data.txt")
+	async def getProtocolData(self, id=None, asDataFrame=True, statusUpdates=True, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getProtocolData().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_protocol_data.txt")
+
+		suffix = f"/protocols/{id}/data"
+
+		if "format" in kwargs: # Special behavior for when 'format' arg is included.
+
+			kwargs = {k:v for k,v in kwargs.items() if k in ["format", "runs"]}
+			URL = self.URL + suffix + self.buildQueryString(kwargs, valid_kwargs)
+
+			exportID = (await self.sendGetRequest(URL))["id"]
+
+			return await self.getAsyncExport(exportID, statusUpdates=statusUpdates, asText=True, key=suffix)
+
+
+		data = await self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
+
+		if asDataFrame: data = self.toDataFrame(data, suffix)
+
+		return data
+
+
+	async def getProjects(self, asDataFrame=True):
+		"""
+		:Description: coroutine version of VaultClient.getProjects().
+		"""
+
+		projects = await self.sendGetRequest(self.URL + "/projects")
+		if asDataFrame: projects = self.toDataFrame(projects, "/projects")
+
+		return projects
+
+
+	@appendToDocString(helpDoc="get_readout_rows.txt")
+	async def getReadoutRows(self, asDataFrame=True, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getReadoutRows().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_readout_rows.txt")
+
+		readoutRows = await self.sendSyncAndAsyncGets("/readout_rows", kwargs, valid_kwargs)
+		if asDataFrame: readoutRows = self.toDataFrame(readoutRows, "/readout_rows")
+
+		return readoutRows
+
+
+	@appendToDocString(helpDoc="get_runs.txt")
+	async def getRun(self, runID=None, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getRun().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_runs.txt")
+
+		if runID is not None: return await self.sendGetRequest(self.URL + f"/runs/{runID}")
+
+		URL = self.URL + "/runs" + self.buildQueryString(kwargs, valid_kwargs)
+
+		return await self.sendGetRequest(URL)
+
+
+	@appendToDocString(helpDoc="get_saved_searches.txt")
+	async def getSavedSearches(self, searchID=None, format="csv", zip=False, filePath=None,
+										asDataFrame=True, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getSavedSearches().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_saved_searches.txt")
+
+		if searchID is None:
+
+			savedSearches = await self.sendGetRequest(self.URL + "/searches")
+
+			if asDataFrame: savedSearches = self.toDataFrame(savedSearches, "/searches")
+
+			return savedSearches
+
+
+		# Perform saved search using the specified ID + retrieve search results:
+
+		localZip = {True: "true", False: "false"}.get(zip)
+
+		kwargs.update({"format": format, "zip": localZip})
+
+		suffix = f"/searches/{searchID}"
+		URL = self.URL + suffix + self.buildQueryString(kwargs, valid_kwargs)
+
+		exportID = (await self.sendGetRequest(URL))["id"]
+
+		rawData = await self.getAsyncExport(exportID, asBytes=True, key=suffix)
+
+		if filePath or zip or format == "sdf":
+
+			assert filePath is not None, "Must specify a destination path."
+
+			with open(filePath, "wb") as f: f.write(rawData)
+			return
+
+		if format == "csv": return pd.read_csv(StringIO(rawData.decode("utf-8")))
+
+		return pd.read_excel(rawData)
+
+
+	@appendToDocString(helpDoc="get_users.txt")
+	async def getUsers(self, **kwargs):
+		"""
+		:Description: coroutine version of VaultClient.getUsers().
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_users.txt")
+
+		URL = self.URL + "/users" + self.buildQueryString(kwargs, valid_kwargs)
+
+		return await self.sendGetRequest(URL)
+
+
+	async def getVaults(self, asDataFrame=True):
+		"""
+		:Description: coroutine version of VaultClient.getVaults(), using this client's API key + session.
+		"""
+
+		URL = "https://app.collaborativedrug.com/api/v1/vaults"
+
+		vaults = await self.sendGetRequest(URL)
+
+		if asDataFrame: vaults = pd.DataFrame(vaults)
+
+		return vaults
+
+
+	@appendToDocString(helpDoc="post_batch_move_job.txt")
+	async def postBatchMoveJob(self, data=None):
+		"""
+		:Description: coroutine version of VaultClient.postBatchMoveJob().
+		"""
+
+		return await self.sendPostRequest(self.URL + "/batch_move_jobs", data)
+
+
+	@appendToDocString(helpDoc="post_batches.txt")
+	async def postBatches(self, data=None):
+		"""
+		:Description: coroutine version of VaultClient.postBatches().
+		"""
+
+		return await self.sendPostRequest(self.URL + "/batches", data)
+
+
+	async def postELNEntries(self, project, title=None, eln_fields={}):
+		"""
+		:Description: coroutine version of VaultClient.postELNEntries().
+		"""
+
+		data = {
+				"title": title,
+				"project": project,
+				"eln_fields": eln_fields
+		}
+
+		return await self.sendPostRequest(self.URL + "/eln/entries", data)
+
+
+	async def postFiles(self, objectType, objectID, fileName):
+		"""
+		:Description: coroutine version of VaultClient.postFiles().
+		"""
+
+		validObjects = ["molecule", "protocol", "run", "eln_entry"]
+
+		assert objectType in validObjects, f"\n'{objectType}' is not a valid CDD class object for attaching files.\nValid options include: {validObjects}."
+
+		if not os.path.exists(fileName): raise FileNotFoundError(fileName)
+
+		with open(fileName, "rb") as f:
+
+			form = aiohttp.FormData()
+			form.add_field("file", f, filename=os.path.basename(fileName))
+			form.add_field("resource_class", objectType)
+			form.add_field("resource_id", str(objectID))
+
+			return await self.sendRequest("POST", self.URL + "/files", data=form)
+
+
+	@appendToDocString(helpDoc="post_inventory_samples.txt")
+	async def postInventorySamples(self, data):
+		"""
+		:Description: coroutine version of VaultClient.postInventorySamples().
+		"""
+
+		return await self.sendPostRequest(self.URL + "/inventory_samples", data)
+
+
+	@appendToDocString(helpDoc="post_molecules.txt")
+	async def postMolecules(self, data):
+		"""
+		:Description: coroutine version of VaultClient.postMolecules().
+		"""
+
+		return await self.sendPostRequest(self.URL + "/molecules", data)
+
+
+	async def postSlurpsData(self, fileName, project, mappingTemplate=None, runs=None, autoreject=None, ambiguous_events_resolution=None, suspicious_events_resolution=None, interval=None):
+		"""
+		:Description: coroutine version of VaultClient.postSlurpsData().
+		"""
+
+		jsonObj = {"project": project}
+
+		if mappingTemplate: jsonObj["mapping_template"] = mappingTemplate
+		if runs:
+
+			validKeys = ["run_date", "place", "person", "conditions"]
+			for k in runs:
+
+				assert k in validKeys, f"'{k}' is not a valid key for a run detail object."
+
+			jsonObj["runs"] = runs
+
+		if autoreject:
+			jsonObj["autoreject"] = autoreject
+		if ambiguous_events_resolution:
+			jsonObj["ambiguous_events_resolution"] = ambiguous_events_resolution
+		if suspicious_events_resolution:
+			jsonObj["suspicious_events_resolution"] = suspicious_events_resolution
+
+
+		# Send request to initiate bulk upload:
+
+		with open(fileName, "rb") as f:
+
+			form = aiohttp.FormData()
+			form.add_field("file", f, filename=os.path.basename(fileName))
+			form.add_field("json", json.dumps(jsonObj))
+
+			response = await self.sendRequest("POST", self.URL + "/slurps", data=form)
+
+
+		# Check status of bulk upload until completed:
+
+		slurpID = response["id"]
+		state = response["state"]
+
+		URL = self.URL + f"/slurps/{slurpID}"
+
+		strategy = self.getPollingStrategy(interval)
+		start = time.monotonic()
+		pollNumber = 0
+
+		while state not in ["committed", "canceled", "rejected", "invalid"]:
+
+			await asyncio.sleep(strategy.getDelay(pollNumber + 1, time.monotonic() - start, "/slurps"))
+
+			response = await self.sendGetRequest(URL)
+			pollNumber += 1
+			self.recordPoll("/slurps")
+
+			state = response["state"]
+
+		strategy.record("/slurps", time.monotonic() - start)
+
+		self.recordMetrics("slurp", "/slurps", timings={"slurp_wait": time.monotonic() - start})
+
+		assert state == "committed", response
+
+
+		# Get protocol + run information for successful imports using slurps ID:
+
+		return await self.sendGetRequest(self.URL + f"/protocols?slurp={slurpID}")
+
+
+	@appendToDocString(helpDoc="post_batches.txt")
+	async def putBatches(self, id, data):
+		"""
+		:Description: coroutine version of VaultClient.putBatches().
+		"""
+
+		return await self.sendPutRequest(self.URL + f"/batches/{id}", data)
+
+
+	@appendToDocString(helpDoc="put_eln_entries.txt")
+	async def putELNEntries(self, entryID, data):
+		"""
+		:Description: coroutine version of VaultClient.putELNEntries().
+		"""
+
+		return await self.sendPutRequest(self.URL + f"/eln/entries/{entryID}", data)
+
+
+	async def putInventorySamples(self, sampleID, data):
+		"""
+		:Description: coroutine version of VaultClient.putInventorySamples().
+		"""
+
+		return await self.sendPutRequest(self.URL + f"/inventory_samples/{sampleID}", data)
+
+
+	@appendToDocString(helpDoc="put_molecules.txt")
+	async def putMolecules(self, id, data):
+		"""
+		:Description: coroutine version of VaultClient.putMolecules().
+		"""
+
+		return await self.sendPutRequest(self.URL + f"/molecules/{id}", data)
+
+
+	@appendToDocString(helpDoc="put_plates.txt")
+	async def putPlates(self, id, data):
+		"""
+		:Description: coroutine version of VaultClient.putPlates().
+		"""
+
+		return await self.sendPutRequest(self.URL + f"/plates/{id}", data)
+
+
+	async def putReadoutRows(self, id, data):
+		"""
+		:Description: coroutine version of VaultClient.putReadoutRows().
+		"""
+
+		return await self.sendPutRequest(self.URL + f"/readout_rows/{id}", data)
+
+
+	async def putRuns(self, id, data):
+		"""
+		:Description: coroutine version of VaultClient.putRuns().
+		"""
+
+		return await self.sendPutRequest(self.URL + f"/runs/{id}", data)
+
+
+	async def deleteBatchMoveJob(self, batchMoveJobID):
+		"""
+		:Description: coroutine version of VaultClient.deleteBatchMoveJob().
+		"""
+
+		return await self.sendDeleteRequest(self.URL + f"/batch_move_jobs/{batchMoveJobID}")
+
+
+	async def deleteBatches(self, id):
+		"""
+		:Description: coroutine version of VaultClient.deleteBatches().
+		"""
+
+		return await self.putBatches(id, data={"projects": []})
+
+
+	async def deleteCollections(self, id):
+		"""
+		:Description: coroutine version of VaultClient.deleteCollections().
+		"""
+
+		return await self.sendDeleteRequest(self.URL + f"/collections/{id}")
+
+
+	async def deleteExport(self, id):
+		"""
+		:Description: coroutine version of VaultClient.deleteExport().
+		"""
+
+		return await self.sendDeleteRequest(self.URL + f"/exports/{id}")
+
+
+	async def deleteFiles(self, fileID):
+		"""
+		:Description: coroutine version of VaultClient.deleteFiles().
+		"""
+
+		return await self.sendDeleteRequest(self.URL + f"/files/{fileID}")
+
+
+	async def deleteMolecules(self, id):
+		"""
+		:Description: coroutine version of VaultClient.deleteMolecules().
+		"""
+
+		return await self.putMolecules(id, data={"projects": []})
+
+
+	async def deletePlates(self, id):
+		"""
+		:Description: coroutine version of VaultClient.deletePlates().
+		"""
+
+		return await self.sendDeleteRequest(self.URL + f"/plates/{id}")
+
+
+	async def deleteReadoutRows(self, id):
+		"""
+		:Description: coroutine version of VaultClient.deleteReadoutRows().
+		"""
+
+		return await self.sendDeleteRequest(self.URL + f"/readout_rows/{id}")
+
+
+	async def deleteRuns(self, id, slurps=False):
+		"""
+		:Description: coroutine version of VaultClient.deleteRuns().
+		"""
+
+		if slurps: suffix = f"/runs?slurp={id}"
+		else: suffix = f"/runs/{id}"
+
+		return await self.sendDeleteRequest(self.URL + suffix)
@@ -0,0 +1,251 @@
+'''
+______________________________________________________________________________________________________________________________________________
+Copyright © 2022 Workflow Informatics - Distribution of this software without written permission of Workflow Informatics is prohibited.
+
+This SOFTWARE PRODUCT is provided by Workflow Informatics "as is" and "with all faults."
+
+Workflow Informatics makes no representations or warranties of any kind concerning the safety, suitability, inaccuracies, typographical errors, or other harmful components of this SOFTWARE PRODUCT.
+
+You are solely responsible for determining whether this SOFTWARE PRODUCT is compatible with your equipment and other software installed on your equipment.
+
+You are solely responsible for the protection of your equipment and backup of your data.
+
+Workflow Informatics will not be liable for any damages you may suffer in connection with using or modifying this SOFTWARE PRODUCT
+______________________________________________________________________________________________________________________________________________
+
+In-process latency + traffic metrics for CDD Vault API calls. See VaultClient.setMetrics().
+
+Metrics are kept per endpoint (e.g. "/protocols/{id}/data") in a MetricsRegistry of histograms
++ counters, which can be exported in the Prometheus text format.
+
+'''
+
+
+import bisect
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+# Upper bounds (in seconds) of the histogram buckets used for timings:
+
+defaultBuckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class Histogram(object):
+	"""
+	:Description: cumulative histogram of observed values, in the style of a Prometheus histogram.
+	"""
+
+	def __init__(self, buckets=defaultBuckets):
+
+		self.buckets = tuple(sorted(buckets))
+
+		self.counts = [0] * (len(self.buckets) + 1) # The last bucket is +Inf.
+		self.sum = 0.0
+		self.count = 0
+
+
+	def observe(self, value):
+
+		self.counts[bisect.bisect_left(self.buckets, value)] += 1
+		self.sum += value
+		self.count += 1
+
+
+	def getQuantile(self, q):
+		"""
+		:Description: estimates the 'q' quantile (0 - 1) of the observed values, as the upper bound 
+					  of the bucket it falls in.
+		"""
+
+		if self.count == 0: return None
+
+		rank = q * self.count
+		total = 0
+
+		for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+
+			total += count
+			if total >= rank: return bound
+
+
+class MetricsRegistry(object):
+	"""
+	:Description: thread-safe registry of histograms + counters, each identified by a metric name
+				  and a set of labels (e.g. endpoint="/molecules", method="GET").
+
+	:buckets (tuple): upper bounds of the histogram buckets, in seconds.
+	"""
+
+	def __init__(self, buckets=defaultBuckets):
+
+		self.buckets = buckets
+
+		self.histograms = {}
+		self.counters = {}
+		self.lock = threading.Lock()
+
+
+	def observe(self, name, value, **labels):
+		"""
+		:Description: records 'value' in the histogram for 'name' + 'labels'.
+		"""
+
+		key = (name, tuple(sorted(labels.items())))
+
+		with self.lock:
+
+			if key not in self.histograms: self.histograms[key] = Histogram(self.buckets)
+
+			self.histograms[key].observe(value)
+
+
+	def increment(self, name, value=1, **labels):
+		"""
+		:Description: adds 'value' to the counter for 'name' + 'labels'.
+		"""
+
+		key = (name, tuple(sorted(labels.items())))
+
+		with self.lock: self.counters[key] = self.counters.get(key, 0) + value
+
+
+	def getHistogram(self, name, **labels):
+		"""
+		:return (Histogram or None):
+		"""
+
+		return self.histograms.get((name, tuple(sorted(labels.items()))))
+
+
+	def getCounter(self, name, **labels):
+
+		return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+
+	def getSummary(self, name, q=0.95):
+		"""
+		:Description: summarizes the histograms for 'name' across all label sets, e.g. to find which 
+					  endpoints dominate request latency.
+
+		:return (list of dict): one dict per label set, with the count, total, mean + estimated 
+								'q' quantile of the observed values, sorted by total (descending).
+		"""
+
+		with self.lock:
+
+			rows = [{**dict(labels), "count": h.count, "total": h.sum, "mean": h.sum / h.count, 
+					 f"p{round(q * 100)}": h.getQuantile(q)}
+					for (metric, labels), h in self.histograms.items() if metric == name and h.count]
+
+		return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+
+	def clear(self):
+
+		with self.lock:
+
+			self.histograms.clear()
+			self.counters.clear()
+
+
+	def toPrometheus(self):
+		"""
+		:Description: exports every metric in the Prometheus text exposition format.
+
+		:return (str):
+		"""
+
+		def formatLabels(labels, extra=()):
+
+			labels = list(labels) + list(extra)
+			if not labels: return ""
+
+			values = [str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels]
+
+			return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, values)) + "}"
+
+		lines = []
+
+		with self.lock:
+
+			for name in sorted({name for name, _ in self.counters}):
+
+				lines.append(f"# TYPE {name} counter")
+
+				for (metric, labels), value in sorted(self.counters.items()):
+
+					if metric == name: lines.append(f"{name}{formatLabels(labels)} {value}")
+
+			for name in sorted({name for name, _ in self.histograms}):
+
+				lines.append(f"# TYPE {name} histogram")
+
+				for (metric, labels), h in sorted(self.histograms.items(), key=lambda item: item[0]):
+
+					if metric != name: continue
+
+					total = 0
+
+					for bound, count in zip(h.buckets + (float("inf"),), h.counts):
+
+						total += count
+						le = "+Inf" if bound == float("inf") else repr(float(bound))
+
+						lines.append(f"{name}_bucket{formatLabels(labels, [('le', le)])} {total}")
+
+					lines.append(f"{name}_sum{formatLabels(labels)} {h.sum}")
+					lines.append(f"{name}_count{formatLabels(labels)} {h.count}")
+
+		return "\n".join(lines) + "\n"
+
+
+# Time spent opening connections (DNS lookup, TCP connect + TLS handshake) by the current thread's
+# last request. Reset by VaultClient.sendRequest() before each request.
+
+connectionTimings = threading.local()
+
+
+class TimedConnectMixin(object):
+
+	def connect(self):
+
+		start = time.perf_counter()
+
+		try: super().connect()
+
+		finally: connectionTimings.connect = getattr(connectionTimings, "connect", 0.0) + time.perf_counter() - start
+
+
+class TimedHTTPConnection(TimedConnectMixin, HTTPConnection): pass
+
+
+class TimedHTTPSConnection(TimedConnectMixin, HTTPSConnection): pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+
+	ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+
+	ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+	"""
+	:Description: requests transport adapter which records the time spent opening each new connection
+				  in 'connectionTimings'.
+	"""
+
+	def init_poolmanager(self, *args, **kwargs):
+
+		super().init_poolmanager(*args, **kwargs)
+
+		self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool, 
+												   "https": TimedHTTPSConnectionPool}
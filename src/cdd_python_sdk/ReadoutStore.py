@@ -0,0 +1,277 @@
+'''
+______________________________________________________________________________________________________________________________________________
+Copyright © 2022 Workflow Informatics - Distribution of this software without written permission of Workflow Informatics is prohibited.
+
+This SOFTWARE PRODUCT is provided by Workflow Informatics "as is" and "with all faults."
+
+Workflow Informatics makes no representations or warranties of any kind concerning the safety, suitability, inaccuracies, typographical errors, or other harmful components of this SOFTWARE PRODUCT.
+
+You are solely responsible for determining whether this SOFTWARE PRODUCT is compatible with your equipment and other software installed on your equipment.
+
+You are solely responsible for the protection of your equipment and backup of your data.
+
+Workflow Informatics will not be liable for any damages you may suffer in connection with using or modifying this SOFTWARE PRODUCT
+______________________________________________________________________________________________________________________________________________
+
+Memory-mapped, on-disk store of protocol readout data, indexed by protocol, run, batch, molecule +
+readout definition ID.
+
+The store is a directory of flat numpy arrays, which are memory-mapped rather than loaded, so that
+lookups only read the pages they need and processes opening the same store share one copy of it
+through the operating system's page cache.
+
+'''
+
+
+import json
+import os
+import shutil
+
+from .VaultClient import LazyModule
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+
+class ReadoutStore(object):
+	"""
+	:Description: read-only view of a readout store built by ReadoutStore.build(). Each record is
+				  a single readout: one value of one readout definition in one readout row.
+
+				  For each indexed key, the store holds the record positions sorted by key, so that
+				  all records matching a key are found with a binary search (O(log n)).
+
+	:path (str): the store's directory.
+	"""
+
+	keys = ["protocol", "run", "batch", "molecule", "definition"]
+
+	# numpy dtypes of each record's fields, by name (so that numpy is only imported when used):
+
+	columns = {
+			   "row": "int64",
+			   "protocol": "int64",
+			   "run": "int64",
+			   "batch": "int64",
+			   "molecule": "int64",
+			   "definition": "int64",
+			   "value": "float64",
+			   "outlier": "bool",
+			   "textOffset": "int64",
+			   "textLength": "int32"
+			   }
+
+
+	def __init__(self, path):
+
+		self.path = path
+
+		with open(os.path.join(path, "meta.json")) as f: self.meta = json.load(f)
+
+		self.count = self.meta["count"]
+
+		self.arrays = {name: self.openArray(name, dtype) for name, dtype in self.columns.items()}
+
+		for key in self.keys:
+
+			self.arrays[f"{key}.order"] = self.openArray(f"{key}.order", np.int64)
+			self.arrays[f"{key}.sorted"] = self.openArray(f"{key}.sorted", np.int64)
+
+		self.text = self.openArray("text", np.uint8)
+
+
+	def __len__(self):
+
+		return self.count
+
+
+	def openArray(self, name, dtype):
+
+		filePath = os.path.join(self.path, f"{name}.bin")
+
+		if os.path.getsize(filePath) == 0: return np.zeros(0, dtype=dtype)
+
+		return np.memmap(filePath, dtype=dtype, mode="r")
+
+
+	@staticmethod
+	def build(path, chunks):
+		"""
+		:Description: builds a readout store at 'path' from chunks of protocol data / readout row objects,
+					  replacing any existing store. Chunks are appended to disk as they arrive, so only
+					  the key being indexed is held in memory at once while building the indexes.
+
+		:chunks (iterable): lists of protocol data / readout row objects. Each object must have a
+							"protocol" key (see fromProtocolData()).
+
+		:return (ReadoutStore):
+		"""
+
+		buildPath = f"{path}.building"
+
+		shutil.rmtree(buildPath, ignore_errors=True)
+		os.makedirs(buildPath)
+
+		files = {name: open(os.path.join(buildPath, f"{name}.bin"), "wb") for name in [*ReadoutStore.columns, "text"]}
+
+		count = 0
+		textOffset = 0
+
+		def getID(value):
+
+			if isinstance(value, dict): value = value.get("id")
+
+			return -1 if value is None else int(value)
+
+		try:
+
+			for chunk in chunks:
+
+				records = {name: [] for name in ReadoutStore.columns}
+
+				for row in chunk:
+
+					ids = [getID(row.get(key)) for key in ["id", "protocol", "run", "batch", "molecule"]]
+
+					for definition, readout in (row.get("readouts") or {}).items():
+
+						if not isinstance(readout, dict): readout = {"value": readout}
+
+						value = readout.get("value")
+						text = b""
+
+						try: value = float(value)
+
+						except (TypeError, ValueError): 
+
+							text = b"" if value is None else str(value).encode("utf-8")
+							value = np.nan
+
+						for name, item in zip(["row", "protocol", "run", "batch", "molecule"], ids): records[name].append(item)
+
+						records["definition"].append(int(definition))
+						records["value"].append(value)
+						records["outlier"].append(bool(readout.get("outlier", False)))
+						records["textOffset"].append(textOffset)
+						records["textLength"].append(len(text))
+
+						files["text"].write(text)
+						textOffset += len(text)
+
+				for name, dtype in ReadoutStore.columns.items():
+
+					np.asarray(records[name], dtype=dtype).tofile(files[name])
+
+				count += len(records["row"])
+
+		finally:
+
+			for f in files.values(): f.close()
+
+		# Build the index for each key:
+
+		for key in ReadoutStore.keys:
+
+			values = np.fromfile(os.path.join(buildPath, f"{key}.bin"), dtype=np.int64)
+			order = np.argsort(values, kind="stable")
+
+			order.tofile(os.path.join(buildPath, f"{key}.order.bin"))
+			values[order].tofile(os.path.join(buildPath, f"{key}.sorted.bin"))
+
+			del values, order
+
+		with open(os.path.join(buildPath, "meta.json"), "w") as f: json.dump({"count": count}, f)
+
+		# Replace any existing store:
+
+		shutil.rmtree(path, ignore_errors=True)
+		os.rename(buildPath, path)
+
+		return ReadoutStore(path)
+
+
+	@staticmethod
+	def fromProtocolData(vault, path, ids, chunkSize=10000, **kwargs):
+		"""
+		:Description: builds a readout store at 'path' from the readout data of one or more protocols.
+					  See VaultClient.iterProtocolData().
+
+		:vault (VaultClient): the client used to fetch readout data from CDD Vault.
+
+		:ids (list): protocol IDs.
+
+		:return (ReadoutStore):
+		"""
+
+		def iterChunks():
+
+			for id in ids:
+
+				for chunk in vault.iterProtocolData(id, chunkSize=chunkSize, **dict(kwargs)):
+
+					yield [{**row, "protocol": id} for row in chunk]
+
+		return ReadoutStore.build(path, iterChunks())
+
+
+	@staticmethod
+	def fromReadoutRows(vault, path, chunkSize=10000, **kwargs):
+		"""
+		:Description: builds a readout store at 'path' from readout rows matching 'kwargs'. 
+					  See VaultClient.iterReadoutRows().
+
+		:vault (VaultClient): the client used to fetch readout rows from CDD Vault.
+
+		:return (ReadoutStore):
+		"""
+
+		return ReadoutStore.build(path, vault.iterReadoutRows(chunkSize=chunkSize, **kwargs))
+
+
+	def getPositions(self, key, value):
+		"""
+		:Description: returns the (sorted) positions of the records where 'key' equals 'value'.
+		"""
+
+		assert key in self.keys, f"'key' must be one of: {', '.join(self.keys)}."
+
+		values = self.arrays[f"{key}.sorted"]
+
+		start = np.searchsorted(values, value, side="left")
+		end = np.searchsorted(values, value, side="right")
+
+		return np.sort(self.arrays[f"{key}.order"][start:end])
+
+
+	def getReadouts(self, asDataFrame=True, **kwargs):
+		"""
+		:Description: returns the readouts matching every keyword argument, e.g. all readouts for
+					  a batch across protocols: getReadouts(batch=123).
+
+		:kwargs: one or more of 'protocol', 'run', 'batch', 'molecule' or 'definition' (readout 
+				 definition ID), each set to a single ID.
+
+		:return (DataFrame or dict): with one row / array item per readout. Readouts with 
+									 non-numeric values have a NaN 'value' + a string 'text'. 
+									 Missing IDs are -1.
+		"""
+
+		assert kwargs, f"Must specify at least one of: {', '.join(self.keys)}."
+
+		positions = None
+
+		for key, value in kwargs.items():
+
+			matches = self.getPositions(key, value)
+			positions = matches if positions is None else np.intersect1d(positions, matches, assume_unique=True)
+
+		readouts = {name: np.asarray(self.arrays[name][positions]) for name in self.columns if not name.startswith("text")}
+
+		readouts["text"] = [
+			bytes(self.text[offset:offset + length]).decode("utf-8") if length else None
+			for offset, length in zip(self.arrays["textOffset"][positions], self.arrays["textLength"][positions])
+			]
+
+		if asDataFrame: readouts = pd.DataFrame(readouts)
+
+		return readouts
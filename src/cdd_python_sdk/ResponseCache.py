@@ -0,0 +1,156 @@
+'''
+______________________________________________________________________________________________________________________________________________
+Copyright © 2022 Workflow Informatics - Distribution of this software without written permission of Workflow Informatics is prohibited.
+
+This SOFTWARE PRODUCT is provided by Workflow Informatics "as is" and "with all faults."
+
+Workflow Informatics makes no representations or warranties of any kind concerning the safety, suitability, inaccuracies, typographical errors, or other harmful components of this SOFTWARE PRODUCT.
+
+You are solely responsible for determining whether this SOFTWARE PRODUCT is compatible with your equipment and other software installed on your equipment.
+
+You are solely responsible for the protection of your equipment and backup of your data.
+
+Workflow Informatics will not be liable for any damages you may suffer in connection with using or modifying this SOFTWARE PRODUCT
+______________________________________________________________________________________________________________________________________________
+
+Size-bounded, least-recently-used caches for GET responses from CDD Vault. See VaultClient.setCache().
+
+Each cache maps a string key (the normalized request URL) to an entry, which must be a
+json-serializable dictionary.
+
+'''
+
+
+import copy
+import json
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+
+
+class MemoryCache(object):
+	"""
+	:Description: in-process cache, holding up to 'maxEntries' entries. Shared safely between threads.
+
+				  Entries are copied on storage + retrieval, so that callers modifying a response
+				  (whether stored or returned) do not modify the cache.
+	"""
+
+	def __init__(self, maxEntries=1024):
+
+		self.maxEntries = maxEntries
+
+		self.entries = OrderedDict()
+		self.lock = threading.Lock()
+
+
+	def get(self, key):
+		"""
+		:return (dict or None): the cached entry, or None if 'key' is not cached.
+		"""
+
+		with self.lock:
+
+			if key not in self.entries: return None
+
+			self.entries.move_to_end(key)
+
+			return copy.deepcopy(self.entries[key])
+
+
+	def set(self, key, entry):
+
+		with self.lock:
+
+			self.entries[key] = copy.deepcopy(entry)
+			self.entries.move_to_end(key)
+
+			while len(self.entries) > self.maxEntries: self.entries.popitem(last=False)
+
+
+	def delete(self, prefix):
+		"""
+		:Description: removes all entries whose keys start with 'prefix'.
+		"""
+
+		with self.lock:
+
+			for key in [k for k in self.entries if k.startswith(prefix)]: del self.entries[key]
+
+
+	def clear(self):
+
+		with self.lock: self.entries.clear()
+
+
+class SQLiteCache(object):
+	"""
+	:Description: on-disk cache stored in a sqlite database, holding up to 'maxEntries' entries.
+				  Persists between processes, and may be shared by several processes at once.
+
+	:path (str): path to the sqlite database file. Created if it does not exist.
+	"""
+
+	def __init__(self, path, maxEntries=10000):
+
+		self.path = path
+		self.maxEntries = maxEntries
+
+		self.lock = threading.Lock()
+
+		self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+		self.connection.execute("""CREATE TABLE IF NOT EXISTS responses
+								   (key TEXT PRIMARY KEY, entry TEXT, accessed REAL)""")
+		self.connection.execute("CREATE INDEX IF NOT EXISTS accessed_index ON responses (accessed)")
+
+
+	def get(self, key):
+		"""
+		:return (dict or None): the cached entry, or None if 'key' is not cached.
+		"""
+
+		with self.lock:
+
+			row = self.connection.execute("SELECT entry FROM responses WHERE key = ?", (key,)).fetchone()
+
+			if row is None: return None
+
+			self.connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+
+		return json.loads(row[0])
+
+
+	def set(self, key, entry):
+
+		with self.lock:
+
+			self.connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+									(key, json.dumps(entry), time.time()))
+
+			# Evict least-recently used entries:
+
+			self.connection.execute("""DELETE FROM responses WHERE key IN
+									   (SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)""",
+									(self.maxEntries,))
+
+
+	def delete(self, prefix):
+		"""
+		:Description: removes all entries whose keys start with 'prefix'.
+		"""
+
+		with self.lock:
+
+			self.connection.execute("DELETE FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+
+	def clear(self):
+
+		with self.lock: self.connection.execute("DELETE FROM responses")
+
+
+	def close(self):
+
+		self.connection.close()
@@ -21,271 +21,2234 @@ If you're stuck, check out the Quickstart Guide.
 
 
 import datetime as dt
-import pandas as pd
 
 import json
 import os
+import random
 import base64
+import codecs
+import copy
+import functools
+import hashlib
+import heapq
+import importlib
 import re
 import requests
+import shutil
 import sys
+import tempfile
+import threading
 import time
+import uuid
 import zipfile
 
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from io import StringIO
+from urllib.parse import urlsplit, parse_qsl, urlencode, quote
+
+from .Metrics import TimedHTTPAdapter, connectionTimings
 
 helpDir = os.path.join(
 				os.path.dirname(__file__),
 				"help_docs")
 
+# Default # of seconds GET responses are cached for, by endpoint (see VaultClient.setCache()).
+# Numeric IDs in endpoint paths are replaced by "{id}". Endpoints not listed are not cached.
+
+defaultCacheTTLs = {
+				"/data_sets": 3600,
+				"/fields": 3600,
+				"/inventory_locations": 3600,
+				"/mapping_templates": 3600,
+				"/mapping_templates/{id}": 3600,
+				"/projects": 3600,
+				"/protocols": 600,
+				"/searches": 0,
+				"/users": 3600
+				}
+
+# Query parameters holding comma-separated lists of IDs (or names), which are split into shards when
+# too long (see VaultClient.setIDSharding()):
+
+shardableKwargs = ["molecules", "batches", "plates", "runs", "protocols", "names"]
+
+# Keys of molecule objects holding structure representations, which are left out of responses
+# requested with 'no_structures' (see VaultClient.getProjection()):
+
+structureKeys = ["smiles", "cxsmiles", "inchi", "inchi_key", "iupac_name", "molfile", "original_structure"]
+
+
+class LazyModule(object):
+	"""
+	:Description: stands in for a module which is only imported when one of its attributes is first 
+				  used, e.g. pandas, which is only needed when results are returned as DataFrames.
+	"""
+
+	def __init__(self, name):
+
+		self.name = name
+		self.module = None
+
+
+	def __getattr__(self, attr):
+
+		if self.module is None: self.module = importlib.import_module(self.name)
+
+		return getattr(self.module, attr)
+
+
+pd = LazyModule("pandas")
+
+
+class HelpDocMethod(object):
+	"""
+	:Description: wraps a class method decorated by appendToDocString(). On first access, reads the
+				  method's help documentation, appends it to the method's doc string, then replaces 
+				  itself with the plain method, so that help documentation is only read when used 
+				  and later calls have no overhead.
+	"""
+
+	lock = threading.Lock()
+
+	def __init__(self, func, helpDoc):
+
+		self.func = func
+		self.helpDoc = helpDoc
+
+		self.owner = None
+		self.name = func.__name__
+
+
+	def __set_name__(self, owner, name):
+
+		self.owner = owner
+		self.name = name
+
+
+	def __get__(self, instance, owner=None):
+
+		with self.lock:
+
+			if not getattr(self.func, "helpDocAppended", False):
+
+				with open(os.path.join(helpDir, self.helpDoc)) as f: helpDoc = "\t\t".join(f.readlines())
+
+				if not helpDoc.endswith("\n"): helpDoc += "\n"
+
+				self.func.__doc__ += "\n\n\t\t:Valid CDD Keyword Arguments:\n"
+				self.func.__doc__ += helpDoc
+				self.func.helpDocAppended = True
+
+			if self.owner is not None and self.owner.__dict__.get(self.name) is self: 
+				
+				setattr(self.owner, self.name, self.func)
+
+		return self.func.__get__(instance, owner)
+
+
+def appendToDocString(*args, **kwargs):
+	"""
+	:Description: decorates each class method's doc string with
+				  descriptions of valid keyword arguments which
+				  will in turn be passed to CDD Vault.
+
+				  Mainly used with class methods which implement
+				  HTTP verbs (GET, POST, etc.) described in the
+				  CDD Vault API.
+
+				  Help documentation is read + appended on first access 
+				  to the method, rather than at import. See HelpDocMethod.
+	"""
+
+	helpDoc = kwargs.get("helpDoc")
+
+	def inner(func):
+
+		return HelpDocMethod(func, helpDoc)
+
+	return inner
+
+
+class KwargSpec(frozenset):
+	"""
+	:Description: immutable set of the valid keyword arguments for a CDD Vault API method, 
+				  along with the type of each argument where its help documentation states one
+				  ("boolean", "date", "integer", "list" or "array"). See getKwargSpec().
+
+	:types (dict): optional. Defaults to the types of 'names', if it is a KwargSpec itself.
+	"""
+
+	def __new__(cls, names, types=None):
+
+		spec = super().__new__(cls, names)
+		spec.types = getattr(names, "types", {}) if types is None else types
+
+		return spec
+
+
+	def withKeys(self, *names):
+		"""
+		:Description: set operators (e.g. '|') return a plain frozenset, dropping the argument types.
+
+		:return (KwargSpec): a copy of this spec which also accepts 'names', as untyped arguments.
+		"""
+
+		return KwargSpec(self.union(names), self.types)
+
+
+# Help documentation phrases stating the type of a keyword argument:
+
+kwargTypes = [
+			  ("Boolean", "boolean"),
+			  ("Date", "date"),
+			  ("Comma-separated list", "list"),
+			  ("Comma-delimited list", "list"),
+			  ("Array of Molecule field names to", "array"),
+			  ("Array of Batch field names to", "array"),
+			  ("The maximum #", "integer"),
+			  ("The maximum number", "integer")
+			  ]
+
+
+@functools.lru_cache(maxsize=None)
+def getKwargSpec(fileName):
+	"""
+	:Description: parses the help documentation file for a CDD Vault API method into a KwargSpec.
+				  Each file is only read + parsed once per process; later calls return the cached spec.
+
+	Valid keywords in help documentation files are identified by:
+
+		1) No white space characters at the start of the line.
+
+		2) A final colon ":" character, after stripping all white space 
+		from the end of the line.
+
+	The type of each keyword is taken from the start of the first line of its description.
+
+	:fileName (str): the name of a valid file containing help documentation for
+					 a CDD Vault API method.
+
+	:return (KwargSpec):
+	"""
+
+	with open(os.path.join(helpDir, fileName)) as f: doc = [line.rstrip() for line in f]
+
+	names = []
+	types = {}
+
+	for line in doc:
+
+		if line and not line[0].isspace() and line.endswith(":"): 
+
+			names.append(line[:-1])
+			continue
+
+		# Type of the preceding keyword, from its description:
+
+		description = line.strip()
+
+		if not names or not description or names[-1] in types: continue
+
+		types[names[-1]] = next((t for phrase, t in kwargTypes if description.startswith(phrase)), None)
+
+	types = {k: v for k, v in types.items() if v is not None}
+
+	return KwargSpec(names, types)
+
+
+def iterJSONObjects(chunks, key="objects"):
+	"""
+	:Description: incrementally parses a JSON document arriving in chunks (e.g. from a streamed
+				  HTTP response), yielding each element of the array stored under 'key' as soon
+				  as it has been fully received. Only the element currently being parsed is held
+				  in memory, rather than the whole document.
+
+				  If the document itself is an array, its elements are yielded instead.
+
+	:chunks (iterable of bytes): the raw UTF-8 encoded JSON document.
+
+	:key (str): the top-level key of the array to iterate over.
+
+	:return (generator):
+	"""
+
+	decoder = json.JSONDecoder()
+	utf8 = codecs.getincrementaldecoder("utf-8")()
+	chunks = iter(chunks)
+
+	buffer = ""
+	pos = 0
+	exhausted = False
+
+	def readMore():
+
+		# Appends the next chunk to the buffer, discarding text which has already been parsed.
+
+		nonlocal buffer, pos, exhausted
+
+		for chunk in chunks:
+
+			if not chunk: continue
+
+			buffer = buffer[pos:] + utf8.decode(chunk)
+			pos = 0
+
+			return True
+
+		exhausted = True
+		return False
+
+	def nextChar():
+
+		# Skips white space + returns the next character, without consuming it.
+
+		nonlocal pos
+
+		while True:
+
+			while pos < len(buffer) and buffer[pos] in " \t\n\r": pos += 1
+
+			if pos < len(buffer): return buffer[pos]
+
+			if not readMore(): raise ValueError("Unexpected end of JSON document.")
+
+	def expect(char):
+
+		nonlocal pos
+
+		found = nextChar()
+		if found != char: raise ValueError(f"Expected '{char}' in JSON document, found '{found}'.")
+
+		pos += 1
+
+	def decodeValue():
+
+		# Decodes the next complete JSON value, reading more data until it is available.
+
+		nonlocal pos
+
+		nextChar()
+
+		while True:
+
+			try: 
+				value, end = decoder.raw_decode(buffer, pos)
+
+				# A number (or literal) is only complete once it is followed by a delimiter, since e.g.
+				# "3." + "5" or "2" + "5" may have been split across chunks:
+
+				complete = end < len(buffer) and (buffer[end - 1] in '"]}' or buffer[end] in ",]}: \t\n\r")
+
+				if complete or exhausted or not readMore():
+
+					pos = end
+					return value
+
+			except json.JSONDecodeError:
+
+				if not readMore(): raise
+
+
+	def iterArray():
+
+		expect("[")
+
+		if nextChar() == "]": return
+
+		while True:
+
+			yield decodeValue()
+
+			if nextChar() == "]": return
+			expect(",")
+
+
+	if nextChar() == "[":
+
+		yield from iterArray()
+		return
+
+	expect("{")
+
+	while nextChar() != "}":
+
+		name = decodeValue()
+		expect(":")
+
+		if name == key:
+
+			yield from iterArray()
+			return
+
+		decodeValue() # Skip over values for all other keys.
+
+		if nextChar() == ",": pos += 1
+
+
+def decodeBase64Field(chunks, f, key="contents"):
+	"""
+	:Description: streams the base64-encoded string stored under 'key' of a JSON object arriving in
+				  chunks (e.g. the response to a file GET request), decoding it + writing the decoded
+				  bytes to 'f' as it arrives, rather than holding the encoded + decoded copies in memory.
+
+	:chunks (iterable of bytes): the raw UTF-8 encoded JSON object.
+
+	:f (file-like object): a binary file object opened for writing.
+
+	:return (dict): the rest of the JSON object, with 'key' set to an empty string.
+	"""
+
+	# The key (not a string value equal to it), followed by a colon + the value's opening quote:
+
+	marker = re.compile(rb'(?<!\\)"' + re.escape(key.encode("utf-8")) + rb'"\s*:\s*"')
+
+	head = b"" # The object up to + including the opening quote of the value.
+	tail = b"" # The object from the closing quote of the value.
+	encoded = b""
+	state = "head"
+
+	def decode(final=False):
+
+		nonlocal encoded
+
+		# Remove JSON escapes + line breaks, except for a trailing backslash split from its escape:
+
+		carry = b""
+		if encoded.endswith(b"\\") and not final: encoded, carry = encoded[:-1], b"\\"
+
+		encoded = encoded.replace(b"\\/", b"/").replace(b"\\n", b"").replace(b"\\r", b"")
+
+		size = len(encoded) if final else len(encoded) - len(encoded) % 4
+
+		f.write(base64.b64decode(encoded[:size]))
+		encoded = encoded[size:] + carry
+
+	for chunk in chunks:
+
+		if state == "head":
+
+			head += chunk
+
+			# Searches the whole head each time, since the marker may be split across chunks:
+
+			match = marker.search(head)
+
+			if match is None: continue
+
+			head, chunk = head[:match.end()], head[match.end():]
+			state = "value"
+
+		if state == "value":
+
+			# base64 values never contain quotes, so the first quote closes the value:
+
+			end = chunk.find(b'"')
+
+			encoded += chunk if end < 0 else chunk[:end]
+
+			if end < 0: 
+
+				decode()
+				continue
+
+			decode(final=True)
+
+			chunk = chunk[end:]
+			state = "tail"
+
+		if state == "tail": tail += chunk
+
+	return json.loads(head + tail)
+
+
+def readoutsToDataFrame(records):
+	"""
+	:Description: builds a DataFrame from protocol data / readout row objects, with the nested
+				  'readouts' dictionary of each row flattened into one column per readout 
+				  definition ID.
+
+				  Readout values become float columns where every value is numeric, and string
+				  columns otherwise. Outlier flags become boolean "<ID> outlier" columns, and any
+				  other readout attributes (e.g. modifiers) become "<ID> <attribute>" columns.
+
+	:records (list of dict): protocol data or readout row objects, as returned by CDD Vault.
+
+	:return (Pandas DataFrame):
+	"""
+
+	frame = pd.json_normalize(records)
+
+	readoutColumns = [c for c in frame.columns if c.startswith("readouts.")]
+	readouts = {}
+
+	for column in readoutColumns:
+
+		# Readouts are either plain values ("readouts.<ID>") or objects ("readouts.<ID>.value", etc.):
+
+		_, defID, *attribute = column.split(".", 2)
+		attribute = attribute[0] if attribute else "value"
+
+		name = defID if attribute == "value" else f"{defID} {attribute}"
+
+		if name in readouts: readouts[name] = readouts[name].combine_first(frame[column])
+		else: readouts[name] = frame[column]
+
+	for name, series in readouts.items():
+
+		if name.endswith(" outlier"): 
+			
+			readouts[name] = series.fillna(False).astype(bool)
+			continue
+
+		numeric = pd.to_numeric(series, errors="coerce")
+
+		if numeric.count() == series.count(): readouts[name] = numeric.astype(float)
+		else: readouts[name] = series.astype("string")
+
+	frame = frame.drop(columns=readoutColumns)
+
+	return pd.concat([frame, pd.DataFrame(readouts, index=frame.index)], axis=1)
+
+
+def projectObjects(objects, paths):
+	"""
+	:Description: prunes json objects to the selected values.
+
+	:paths (dict): the keys leading to each selected value, by column name, e.g. 
+				   {"id": ("id",), "MW": ("molecule_fields", "MW")}. Missing values are None.
+
+	:return (list of dict): one row per object, with a value for each column.
+	"""
+
+	rows = []
+
+	for obj in objects:
+
+		row = {}
+
+		for column, path in paths.items():
+
+			value = obj
+
+			for key in path: value = value.get(key) if isinstance(value, dict) else None
+
+			row[column] = value
+
+		rows.append(row)
+
+	return rows
+
+
+def castColumns(frame, types):
+	"""
+	:Description: converts DataFrame columns to the dtypes of their CDD Vault field types, in place.
+				  Values which cannot be converted become missing values.
+
+	:types (dict): CDD Vault data type (e.g. "Number", "Date", "Text") by column name.
+
+	:return (Pandas DataFrame):
+	"""
+
+	for column, dataType in types.items():
+
+		if dataType == "Number": frame[column] = pd.to_numeric(frame[column], errors="coerce").astype("float64")
+
+		elif dataType == "Integer": frame[column] = pd.to_numeric(frame[column], errors="coerce").astype("Int64")
+
+		elif dataType == "Boolean": 
+			
+			frame[column] = frame[column].map({True: True, False: False, "true": True, "false": False}).astype("boolean")
+
+		elif dataType == "Date": frame[column] = pd.to_datetime(frame[column], errors="coerce")
+
+		elif dataType in ["Text", "String", "Pick List"]: frame[column] = frame[column].astype("string")
+
+	return frame
+
+
+def splitImportFile(fileName, rowsPerChunk, destFolder):
+	"""
+	:Description: splits a csv / tsv / txt or sdf import file into files of up to 'rowsPerChunk' rows
+				  (or SD records) each, written to 'destFolder'. The header line of delimited files is
+				  repeated at the top of every chunk, and quoted values spanning several lines are 
+				  kept within a single row. Rows are copied byte-for-byte.
+
+	:return (list of tuple): (chunk file path, index of the chunk's first row, # of rows) for each chunk.
+	"""
+
+	name, extension = os.path.splitext(os.path.basename(fileName))
+
+	if extension.lower() not in [".csv", ".tsv", ".txt", ".sdf", ".sd"]:
+
+		raise ValueError(f"Cannot split '{fileName}': only csv, tsv, txt and sdf files are supported.")
+
+	isSDF = extension.lower() in [".sdf", ".sd"]
+
+	chunks = []
+	header = b""
+
+	def writeChunk(rows):
+
+		chunkPath = os.path.join(destFolder, f"{name}.part{len(chunks) + 1:05d}{extension}")
+		firstRow = sum(chunk[2] for chunk in chunks)
+
+		with open(chunkPath, "wb") as f: f.write(header + b"".join(rows))
+
+		chunks.append((chunkPath, firstRow, len(rows)))
+
+	with open(fileName, "rb") as f:
+
+		if not isSDF: header = f.readline()
+
+		rows = []
+		row = b""
+
+		for line in f:
+
+			row += line
+
+			# SD records end with "$$$$". Delimited rows end on a line with balanced quotes:
+
+			if isSDF: complete = line.strip() == b"$$$$"
+			else: complete = row.count(b'"') % 2 == 0
+
+			if not complete: continue
+
+			if row.strip(): rows.append(row)
+			row = b""
+
+			if len(rows) == rowsPerChunk:
+
+				writeChunk(rows)
+				rows = []
+
+		if row.strip(): rows.append(row)
+		if rows: writeChunk(rows)
+
+	return chunks
+
+
+def splitIDList(ids, maxIDs, maxLength):
+	"""
+	:Description: splits a list of IDs into consecutive shards of up to 'maxIDs' IDs each, whose 
+				  comma-separated values are at most 'maxLength' characters long.
+
+	:ids (list of str):
+
+	:return (list of list):
+	"""
+
+	shards = []
+	shard = []
+	length = -1 # No comma before the first ID.
+
+	for i in ids:
+
+		if shard and (len(shard) >= maxIDs or length + len(i) + 1 > maxLength):
+
+			shards.append(shard)
+			shard = []
+			length = -1
+
+		shard.append(i)
+		length += len(i) + 1
+
+	if shard: shards.append(shard)
+
+	return shards
+
+
+class FixedPolling(object):
+	"""
+	:Description: polling strategy which waits a constant # of seconds between status checks
+				  of an asynchronous export or slurp. See VaultClient.setPollingStrategy().
+	"""
+
+	def __init__(self, interval=5.0):
+
+		self.interval = interval
+
+
+	def getDelay(self, pollNumber, elapsed=0.0, key=None, size=None):
+
+		return self.interval
+
+
+	def record(self, key, duration, size=None):
+
+		pass
+
+
+class ExponentialBackoff(object):
+	"""
+	:Description: polling strategy which checks the status of an asynchronous export or slurp 
+				  quickly at first, then backs off exponentially (with random jitter) up to a cap.
+
+				  Completed durations are recorded per endpoint 'key', so that later jobs for the
+				  same endpoint can skip ahead to roughly when they are expected to finish. Where
+				  the # of exported objects ('size') is known, the expected duration is scaled
+				  by it. See VaultClient.setPollingStrategy().
+
+	:initial (float): # of seconds to wait after the first status check.
+
+	:factor (float): multiplier applied to the wait after each further status check.
+
+	:maxInterval (float): the maximum # of seconds to wait between status checks.
+
+	:jitter (float): fraction by which each wait is randomly lengthened or shortened, so that
+					 many clients polling at once do not synchronize.
+	"""
+
+	def __init__(self, initial=1.0, factor=2.0, maxInterval=30.0, jitter=0.1):
+
+		self.initial = initial
+		self.factor = factor
+		self.maxInterval = maxInterval
+		self.jitter = jitter
+
+		self.history = {} # key -> (average duration in seconds, average seconds per object)
+
+
+	def getDelay(self, pollNumber, elapsed=0.0, key=None, size=None):
+
+		delay = min(self.initial * self.factor ** (pollNumber - 1), self.maxInterval)
+
+		# Jump ahead to the expected finish time for this endpoint, if known:
+
+		if key in self.history:
+
+			duration, perObject = self.history[key]
+			if size and perObject: duration = perObject * size
+
+			if duration > elapsed: delay = max(delay, min(duration - elapsed, self.maxInterval))
+
+		return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+	def record(self, key, duration, size=None):
+
+		if key is None: return
+
+		perObject = duration / size if size else None
+
+		if key in self.history: # Exponential moving average of past durations.
+
+			oldDuration, oldPerObject = self.history[key]
+
+			duration = 0.5 * (oldDuration + duration)
+			if perObject and oldPerObject: perObject = 0.5 * (oldPerObject + perObject)
+			else: perObject = perObject or oldPerObject
+
+		self.history[key] = (duration, perObject)
+
+
+class RetryPolicy(object):
+	"""
+	:Description: determines which failed requests are retried, and how long to wait before
+				  each retry. See VaultClient.setRetryPolicy().
+
+				  Requests are retried on connection errors, timeouts and the HTTP status codes
+				  in 'statuses' (rate limits + transient server errors). Waits grow exponentially 
+				  with random jitter, unless the response includes a 'Retry-After' header.
+
+	:maxRetries (int): the maximum # of retries per request.
+
+	:backoffFactor (float): # of seconds to wait before the first retry. Doubles with each further retry.
+
+	:maxBackoff (float): the maximum # of seconds to wait before a single retry.
+
+	:statuses (tuple of int): HTTP status codes which are retried.
+
+	:methods (tuple of str): HTTP verbs which are retried. By default, only idempotent verbs are retried,
+							 since a failed POST may already have created its object in CDD Vault.
+	"""
+
+	def __init__(self, maxRetries=3, backoffFactor=0.5, maxBackoff=60.0, 
+				 statuses=(429, 500, 502, 503, 504), methods=("GET", "PUT", "DELETE")):
+
+		self.maxRetries = maxRetries
+		self.backoffFactor = backoffFactor
+		self.maxBackoff = maxBackoff
+		self.statuses = statuses
+		self.methods = methods
+
+
+	def isRetryable(self, method, attempt, response=None):
+
+		if attempt > self.maxRetries or method.upper() not in self.methods: return False
+
+		return response is None or response.status_code in self.statuses
+
+
+	def getDelay(self, attempt, response=None):
+
+		retryAfter = response.headers.get("Retry-After") if response is not None else None
+
+		if retryAfter:
+
+			try: delay = float(retryAfter)
+
+			except ValueError: # HTTP-date form of the header.
+
+				try:
+					retryAt = parsedate_to_datetime(retryAfter)
+					delay = (retryAt - dt.datetime.now(retryAt.tzinfo)).total_seconds()
+
+				except (TypeError, ValueError): delay = None # Malformed header; use the backoff delay.
+
+			if delay is not None: return min(max(delay, 0.0), self.maxBackoff)
+
+		delay = min(self.backoffFactor * 2 ** (attempt - 1), self.maxBackoff)
+
+		return random.uniform(0.5 * delay, delay)
+
+
+# Pooled session for requests sent without a VaultClient instance (see VaultClient.getVaults()), 
+# created on first use:
+
+sharedSession = None
+sharedSessionLock = threading.Lock()
+
+
+def getSharedSession():
+	"""
+	:Description: returns the process-wide pooled session used by static methods, so that repeated
+				  calls reuse their connections to CDD Vault.
+
+	:return (requests.Session):
+	"""
+
+	global sharedSession
+
+	with sharedSessionLock:
+
+		if sharedSession is None:
+
+			sharedSession = requests.Session()
+			sharedSession.mount("https://", TimedHTTPAdapter())
+			sharedSession.mount("http://", TimedHTTPAdapter())
+
+		return sharedSession
+
+
+class TokenBucket(object):
+	"""
+	:Description: client-wide rate limiter, allowing bursts of up to 'capacity' requests
+				  while keeping the long-run request rate at or below 'rate' per second.
+				  Shared safely between threads. See VaultClient.setRateLimit().
+	"""
+
+	def __init__(self, rate, capacity=None):
+
+		self.rate = rate
+		self.capacity = capacity or max(rate, 1.0)
+
+		self.tokens = self.capacity
+		self.updated = time.monotonic()
+		self.lock = threading.Lock()
+
+
+	def reserve(self):
+		"""
+		:Description: takes one token from the bucket + returns the # of seconds the caller
+					  must wait before sending its request.
+		"""
+
+		with self.lock:
+
+			now = time.monotonic()
+
+			self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+			self.updated = now
+
+			self.tokens -= 1
+
+			return max(0.0, -self.tokens / self.rate)
+
+
+	def acquire(self):
+
+		delay = self.reserve()
+		if delay > 0: time.sleep(delay)
+
+
+class SingleFlight(object):
+	"""
+	:Description: de-duplicates concurrent identical calls. While a call for a key is in progress,
+				  other threads calling with the same key wait for it + share its result (or
+				  exception), instead of repeating the work. Shared safely between threads.
+				  See VaultClient.setSingleFlight().
+
+				  Waiting threads receive a copy of the result, so that callers modifying a
+				  returned response do not modify each other's.
+	"""
+
+	def __init__(self):
+
+		self.calls = {}
+		self.lock = threading.Lock()
+
+
+	def do(self, key, function, *args, **kwargs):
+		"""
+		:return (tuple): the result of function(*args, **kwargs), and whether it was shared with 
+						 an identical call already in progress.
+		"""
+
+		with self.lock:
+
+			call = self.calls.get(key)
+			leader = call is None
+
+			if leader: call = self.calls[key] = Future()
+
+		if not leader: return (copy.deepcopy(call.result()), True)
+
+		try:
+			result = function(*args, **kwargs)
+			call.set_result(result)
+
+		except BaseException as e:
+
+			call.set_exception(e)
+			raise
+
+		finally:
+			with self.lock: del self.calls[key]
+
+		return (result, False)
+
+
+class MultipartEncoder(object):
+	"""
+	:Description: file-like, multipart/form-data request body, which reads file attachments from disk
+				  as the body is sent, so that uploads use constant memory regardless of file size.
+				  
+				  Each file is only open while its part is being sent, and is closed once it has been
+				  read, on close(), or when used as a context manager.
+
+	:fields (list): (name, value) tuples. Values are either strings, or (file name, file path) tuples 
+					for file attachments.
+
+	:progress (callable): optional. Called as progress(bytesSent, totalBytes, bytesPerSecond) after
+						  each block of the body is read for sending.
+	"""
+
+	def __init__(self, fields, progress=None, blockSize=65536):
+
+		self.progress = progress
+		self.blockSize = blockSize
+
+		self.boundary = uuid.uuid4().hex
+		self.contentType = f"multipart/form-data; boundary={self.boundary}"
+
+		# Split the body into in-memory (bytes) + on-disk (file path) segments:
+
+		self.segments = []
+
+		for name, value in fields:
+
+			if isinstance(value, tuple):
+
+				fileName, filePath = value
+
+				self.segments.append(f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{fileName}"\r\n'
+									 f'Content-Type: application/octet-stream\r\n\r\n'.encode("utf-8"))
+				self.segments.append(filePath)
+				self.segments.append(b"\r\n")
+
+			else:
+
+				self.segments.append(f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+									 f'{value}\r\n'.encode("utf-8"))
+
+		self.segments.append(f"--{self.boundary}--\r\n".encode("utf-8"))
+
+		self.length = sum(len(segment) if isinstance(segment, bytes) else os.path.getsize(segment) 
+						  for segment in self.segments)
+
+		self.file = None
+		self.seek(0)
+
+
+	def __len__(self):
+
+		return self.length
+
+
+	def __enter__(self):
+
+		return self
+
+
+	def __exit__(self, *args):
+
+		self.close()
+
+
+	def seek(self, offset, whence=0):
+		"""
+		:Description: rewinds the body, so that a failed request can be retried. Only seeking to the 
+					  start of the body is supported.
+		"""
+
+		assert offset == 0 and whence == 0, "MultipartEncoder can only be rewound to the start."
+
+		self.close()
+
+		self.position = 0
+		self.segment = 0
+		self.offset = 0
+		self.started = None
+
+
+	def read(self, size=-1):
+
+		if size is None or size < 0: size = self.length
+		if self.started is None: self.started = time.monotonic()
+
+		block = b""
+
+		while len(block) < size and self.segment < len(self.segments):
+
+			segment = self.segments[self.segment]
+
+			if isinstance(segment, bytes):
+
+				data = segment[self.offset:self.offset + size - len(block)]
+
+			else:
+				if self.file is None: self.file = open(segment, "rb")
+
+				data = self.file.read(size - len(block))
+
+			block += data
+			self.offset += len(data)
+
+			# Move on to the next segment once this one has been read:
+
+			if not data or (isinstance(segment, bytes) and self.offset >= len(segment)):
+
+				self.close()
+
+				self.segment += 1
+				self.offset = 0
+
+		self.position += len(block)
+
+		if self.progress and block:
+
+			elapsed = time.monotonic() - self.started
+			self.progress(self.position, self.length, self.position / elapsed if elapsed > 0 else 0.0)
+
+		return block
+
+
+	def close(self):
+
+		if self.file is not None: 
+			
+			self.file.close()
+			self.file = None
+
+
+class VaultClient(object):
+
+	def __init__(self, vaultNum, apiKey, poolConnections=10, poolMaxSize=10, 
+												poolBlock=False, keepAlive=True):
+
+		self.setVaultNumAndURL(vaultNum)
+		self.setAPIKey(apiKey)
+
+		self.setMaxSyncObjects()
+		self.setMaxPagedObjects()
+		self.setPollingStrategy()
+		self.setRetryPolicy()
+		self.setRateLimit()
+		self.setIDSharding()
+		self.setCache()
+		self.setSingleFlight()
+		self.setMetrics()
+		self.setSession(poolConnections, poolMaxSize, poolBlock, keepAlive)
+
+
+	def __str__(self):
+
+		return f'Client for Vault ID: {self.vaultNum} instantiated {str(dt.datetime.now())}'
+
+
+	def __enter__(self):
+
+		return self
+
+
+	def __exit__(self, excType, excValue, traceback):
+
+		self.close()
+
+
+	def setVaultNumAndURL(self, vaultNum):
+		"""
+		:Description: sets the vault ID and constructs the base URL, from which endpoints
+					  for all subsequent API calls (GET, POST, PUT, DELETE) will be constructed.
+
+		:vaultNum (int or str): unique integer ID of the target vault.
+
+		:return (tuple): a two-element tuple consisting of the vault ID and the base URL for
+						 accessing the CDD Vault API.
+		"""
+
+		self.vaultNum = int(vaultNum)
+
+		URL = "https://app.collaborativedrug.com/api/v1/vaults/"
+		URL = URL + str(vaultNum)
+
+		self.URL = URL
+
+		return (self.vaultNum, self.URL)
+
+
+	def getVaultNum(self):
+		"""
+		:Description: returns the unique integer ID of the target vault.
+
+		:return (int): 
+		"""
+
+		return self.vaultNum
+	
+
+	def getURL(self):
+		"""
+		:Description: returns the base URL used in the construction of
+					  CDD Vault API calls (GET, POST, PUT, DELETE).
+
+		:return (str):
+		"""
+
+		return self.URL
+
+
+	def setAPIKey(self, apiKey):
+		"""
+		:Description: sets the API token credentials, which will be passed
+					  in the request header to CDD Vault with each API request. 
+
+					  Note that the API token must have read/write access to
+					  the vault specified by the vault ID when executing the
+					  various API calls or an error will be returned.
+
+		:return (str):
+		"""
+
+		self.apiKey = apiKey
+
+		return self.apiKey
+
+
+	def getAPIKey(self):
+		"""
+		:Description: returns the currently set API key.
+
+		:return (str):
+		"""
+
+		return self.apiKey
+
+
+	def setMaxSyncObjects(self, value=1000):
+		"""
+		:Description: sets the 'maxSyncObjects' attribute, which is used to determine
+					  when a synchronous vs asynchronous export request is submitted
+					  to CDD. If the # of objects returned from a GET request is ever
+					  >= maxSyncObjects, the call will be repeated asynchronously.
+
+					  Defaults to 1000, the maximum # of objects which a CDD GET request
+					  can return synchronously.
+
+					  Only used in methods where GET requests can be performed asynchronously:
+					  Molecules, Batches, Plates, Protocols, and Protocol Data. See method
+					  sendSyncAndAsyncGets().
+		"""
+
+		self.maxSyncObjects = value
+
+		return self.maxSyncObjects
+
+
+	def setMaxPagedObjects(self, value=20000, maxWorkers=4):
+		"""
+		:Description: sets the 'maxPagedObjects' attribute, which is used to determine how results
+					  larger than 'maxSyncObjects' are retrieved (see sendSyncAndAsyncGets()).
+
+					  If the # of objects matching a GET request is <= maxPagedObjects, the remaining
+					  objects are fetched as synchronous pages of 'maxSyncObjects' objects, sent 
+					  concurrently. Larger results are retrieved using an asynchronous export.
+
+					  Set to 0 to always use asynchronous exports.
+
+		:maxWorkers (int): the maximum # of pages requested concurrently.
+		"""
+
+		self.maxPagedObjects = value
+		self.maxPageWorkers = maxWorkers
+
+		return self.maxPagedObjects
+
+
+	def setIDSharding(self, maxLength=2000, maxWorkers=4):
+		"""
+		:Description: sets how long lists of IDs passed as query parameters (e.g. getBatches(batches=ids) 
+					  or getProtocolData(id, runs=ids)) are split into shards, each of which is sent as a 
+					  separate GET request. See sendShardedGets() + iterShardedGets().
+
+					  A list is sharded if its comma-separated value is longer than 'maxLength' characters, 
+					  or it holds more than 'maxSyncObjects' IDs. Shards are sized so that each one is 
+					  expected to return at most 'maxSyncObjects' objects, and can be fetched 
+					  synchronously instead of with an asynchronous export.
+
+		:maxLength (int): the maximum length of a single shard's query parameter, keeping URLs within 
+						  server limits. Set to None to disable sharding.
+
+		:maxWorkers (int): the maximum # of shards requested concurrently. Iterators (e.g. iterMolecules())
+						   request their shards one at a time.
+		"""
+
+		self.maxShardLength = maxLength
+		self.maxShardWorkers = maxWorkers
+
+		return self.maxShardLength
+
+
+	def setPollingStrategy(self, strategy=None):
+		"""
+		:Description: sets the default strategy for how long to wait between status checks of 
+					  asynchronous exports + slurps (see getAsyncExport() and postSlurpsData()).
+
+					  Also resets the count of status checks made (see getPollCount()).
+
+		:strategy: a FixedPolling or ExponentialBackoff instance, or any object implementing their
+				   getDelay() + record() methods. Defaults to ExponentialBackoff().
+
+		:return: the polling strategy.
+		"""
+
+		if strategy is None: strategy = ExponentialBackoff()
+
+		self.pollingStrategy = strategy
+		self.pollCount = 0
+
+		return self.pollingStrategy
+
+
+	def getPollingStrategy(self, interval=None):
+		"""
+		:Description: returns the polling strategy to use for a single export or slurp.
+
+		:interval (float, strategy or None): if None, the client's default strategy is returned.
+											 A number is treated as a fixed interval in seconds.
+		"""
+
+		if interval is None: return self.pollingStrategy
+
+		if isinstance(interval, (int, float)): return FixedPolling(interval)
+
+		return interval
+
+
+	def getPollCount(self):
+		"""
+		:Description: returns the total # of status checks made for asynchronous exports + slurps 
+					  since the polling strategy was last set. Each status check counts towards the
+					  API execution time reported by getAPIExecutionMetrics().
+
+		:return (int):
+		"""
+
+		return self.pollCount
+
+
+	def setRetryPolicy(self, policy=None):
+		"""
+		:Description: sets the policy used to retry requests which fail due to rate limits (429),
+					  transient server errors (5xx), connection errors or timeouts.
+
+		:policy (RetryPolicy): defaults to RetryPolicy(), which retries GET, PUT + DELETE requests
+							   up to 3 times. Use RetryPolicy(maxRetries=0) to disable retries.
+
+		:return (RetryPolicy):
+		"""
+
+		if policy is None: policy = RetryPolicy()
+
+		self.retryPolicy = policy
+
+		return self.retryPolicy
+
+
+	def setRateLimit(self, requestsPerSecond=None, burst=None):
+		"""
+		:Description: limits the rate at which this client sends requests to CDD Vault, across all
+					  threads sharing the client. Retries count towards the limit.
+
+		:requestsPerSecond (float): the long-run maximum request rate. If None (the default), 
+									requests are not rate limited.
+
+		:burst (int): the maximum # of requests which may be sent at once after a quiet period.
+					  Defaults to 'requestsPerSecond'.
+
+		:return (TokenBucket or None):
+		"""
+
+		if requestsPerSecond is None: self.rateLimiter = None
+		else: self.rateLimiter = TokenBucket(requestsPerSecond, burst)
+
+		return self.rateLimiter
+
+
+	def setMetrics(self, registry=None, hooks=None):
+		"""
+		:Description: sets where this client reports the latency + traffic of its API calls, by endpoint
+					  (e.g. "/protocols/{id}/data"). If neither 'registry' nor 'hooks' is set (the default),
+					  no metrics are recorded.
+
+					  Each request records its connection time (DNS lookup, TCP connect + TLS handshake,
+					  for new connections), time to first byte, download time + total time, as well as
+					  bytes sent + received, retries, status checks of asynchronous exports + slurps,
+					  json decoding + DataFrame building times. See recordMetrics().
+
+		:registry (MetricsRegistry): optional. Registry of histograms + counters which metrics are 
+									 recorded in. Use registry.toPrometheus() to export them.
+
+		:hooks (list of callable): optional. Functions called with a dict describing each event, 
+								   e.g. {"event": "request", "endpoint": "/molecules", "method": "GET",
+								   "status": 200, "connect": 0.0, "ttfb": 0.21, "download": 0.05, ...}.
+
+		:return (MetricsRegistry or None): the registry.
+		"""
+
+		self.metrics = registry
+		self.metricHooks = list(hooks or [])
+
+		return self.metrics
+
+
+	def recordMetrics(self, event, endpoint, timings=None, counts=None, **labels):
+		"""
+		:Description: records a single event in the client's metrics (see setMetrics()). Timings are 
+					  recorded in "cdd_<name>_seconds" histograms, and counts are added to 
+					  "cdd_<name>_total" counters, each labelled by 'endpoint' + 'labels'.
+
+		:timings (dict): durations in seconds, by name.
+
+		:counts (dict): counts (e.g. bytes), by name.
+		"""
+
+		if self.metrics is None and not self.metricHooks: return
+
+		timings = timings or {}
+		counts = counts or {}
+
+		if self.metrics is not None:
+
+			for name, value in timings.items(): self.metrics.observe(f"cdd_{name}_seconds", value, endpoint=endpoint, **labels)
+
+			for name, value in counts.items(): self.metrics.increment(f"cdd_{name}_total", value, endpoint=endpoint, **labels)
+
+		for hook in self.metricHooks: hook({"event": event, "endpoint": endpoint, **labels, **timings, **counts})
+
+
+	def getEndpoint(self, URL):
+		"""
+		:Description: returns the endpoint a URL targets, with numeric IDs replaced by "{id}", 
+					  e.g. "/protocols/{id}/data".
+		"""
+
+		path = urlsplit(URL[len(self.URL):] if URL.startswith(self.URL) else URL).path
+
+		return re.sub(r"/\d+(?=/|$)", "/{id}", path)
+
+
+	def recordPoll(self, endpoint):
+		"""
+		:Description: counts a single status check of an asynchronous export or slurp.
+		"""
+
+		self.pollCount += 1
+
+		self.recordMetrics("poll", endpoint, counts={"polls": 1})
+
+
+	def toDataFrame(self, data, endpoint=None):
+		"""
+		:Description: builds a Pandas DataFrame from json objects, recording the time taken in the 
+					  client's metrics (see setMetrics()).
+		"""
+
+		start = time.perf_counter()
+
+		frame = pd.DataFrame(data)
+
+		if self.metrics is not None or self.metricHooks:
+
+			self.recordMetrics("dataframe", self.getEndpoint(endpoint or ""), timings={"dataframe_build": time.perf_counter() - start})
+
+		return frame
+
+
+	def decodeJSON(self, response):
+		"""
+		:Description: decodes a json response, recording the time taken in the client's metrics 
+					  (see setMetrics()).
+		"""
+
+		start = time.perf_counter()
+
+		data = response.json()
+
+		if self.metrics is not None or self.metricHooks:
+
+			self.recordMetrics("json", self.getEndpoint(response.url), timings={"json_decode": time.perf_counter() - start})
+
+		return data
+
+
+	def setCache(self, cache=None, ttls=None):
+		"""
+		:Description: sets the cache used to store GET responses from slowly-changing endpoints
+					  (fields, projects, protocols, etc.), so that repeat requests within each
+					  endpoint's time-to-live are answered locally. See sendGetRequest().
+
+					  Once a cached response is older than its endpoint's time-to-live, it is revalidated
+					  with a conditional GET request (using the ETag / Last-Modified headers of the 
+					  response), and reused without being downloaded again if it has not changed.
+
+					  Cached responses for a resource (e.g. all "/protocols" requests) are invalidated
+					  whenever this client sends a successful PUT, POST or DELETE request to it.
+
+		:cache: a MemoryCache or SQLiteCache instance, or any object implementing their get(), 
+				set(), delete() + clear() methods. If None (the default), responses are not cached.
+
+		:ttls (dict): # of seconds to reuse responses for without revalidating them, by endpoint, 
+					  e.g. {"/protocols": 60}. Numeric IDs in endpoint paths are written as "{id}". 
+					  Updates the defaults in 'defaultCacheTTLs'. A time-to-live of 0 revalidates
+					  responses on every request; set an endpoint's time-to-live to None to disable 
+					  caching.
+
+		:return: the cache.
+		"""
+
+		self.cache = cache
+		self.cacheTTLs = {**defaultCacheTTLs, **(ttls or {})}
+
+		return self.cache
+
+
+	def setSingleFlight(self, enabled=True):
+		"""
+		:Description: enables (the default) or disables coalescing of identical concurrent GET requests.
+
+					  When several threads sharing this client request the same URL at once (e.g. the 
+					  same getProtocols() or getMolecules() call), only one request is sent, and the 
+					  others wait for + share its parsed result. For GET requests which fall back to an
+					  asynchronous export (see sendSyncAndAsyncGets()), a single export is run for all
+					  of the waiting threads. Requests are matched using getCacheKey().
+
+		:return (SingleFlight or None): the in-flight call registry.
+		"""
+
+		self.singleFlight = SingleFlight() if enabled else None
+
+		return self.singleFlight
+
+
+	def coalesce(self, key, endpoint, function, *args):
+		"""
+		:Description: runs function(*args), sharing the result with identical concurrent calls for 
+					  'key' if single-flight is enabled (see setSingleFlight()).
+		"""
+
+		if self.singleFlight is None: return function(*args)
+
+		result, shared = self.singleFlight.do(key, function, *args)
+
+		if shared: self.recordMetrics("coalesced", self.getEndpoint(endpoint), counts={"coalesced_requests": 1})
+
+		return result
+
+
+	def getCacheKey(self, URL):
+		"""
+		:Description: returns the key under which the response to a GET request is cached: the URL
+					  with its query parameters sorted, plus a hash of the API token (since the 
+					  response depends on the token's permissions).
+		"""
+
+		path, _, query = URL.partition("?")
+		query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+
+		token = hashlib.sha256(str(self.apiKey).encode()).hexdigest()[:16]
+
+		return f"{path}?{query}#{token}"
+
+
+	def getCacheTTL(self, URL):
+		"""
+		:Description: returns the # of seconds the response to a GET request may be reused for
+					  without revalidating it, or None if the response should not be cached.
+		"""
+
+		if not URL.startswith(self.URL): return None
+
+		return self.cacheTTLs.get(self.getEndpoint(URL))
+
+
+	def invalidateCache(self, URL=None):
+		"""
+		:Description: removes cached responses for the resource targeted by 'URL' (e.g. all cached 
+					  "/protocols..." responses for ".../protocols/123"), or all cached responses 
+					  if 'URL' is None.
+		"""
+
+		if self.cache is None: return
+
+		if URL is None or not URL.startswith(self.URL): 
+			
+			self.cache.clear()
+			return
+
+		resource = urlsplit(URL[len(self.URL):]).path.split("/")[1]
+
+		self.cache.delete(f"{self.URL}/{resource}")
+
+
+	def setSession(self, poolConnections=10, poolMaxSize=10, poolBlock=False, keepAlive=True):
+		"""
+		:Description: creates the connection-pooled HTTP session through which all
+					  subsequent API calls (GET, POST, PUT, DELETE) are sent, so that
+					  TCP + TLS connections to CDD Vault are reused between calls.
+
+					  Any previously set session is closed and replaced.
+
+		:poolConnections (int): the # of per-host connection pools to cache.
+
+		:poolMaxSize (int): the maximum # of connections kept open per host. Should be
+							at least the # of threads sharing this client.
+
+		:poolBlock (bool): if True, requests wait for a free connection once 'poolMaxSize'
+						   connections to a host are in use, rather than opening extra
+						   (non-pooled) connections.
+
+		:keepAlive (bool): if False, connections are closed after every request.
+
+					  The time spent opening each connection is reported to the client's 
+					  metrics (see setMetrics()).
+
+		:return (requests.Session):
+		"""
+
+		if getattr(self, "session", None) is not None: self.session.close()
+
+		adapter = TimedHTTPAdapter(pool_connections=poolConnections, 
+							  pool_maxsize=poolMaxSize, 
+							  pool_block=poolBlock)
+
+		session = requests.Session()
+		session.mount("https://", adapter)
+		session.mount("http://", adapter)
+
+		if not keepAlive: session.headers["Connection"] = "close"
+
+		self.session = session
+
+		return self.session
+
+
+	def getSession(self):
+		"""
+		:Description: returns the HTTP session used to send requests to CDD Vault.
+
+		:return (requests.Session):
+		"""
+
+		return self.session
+
+
+	def close(self):
+		"""
+		:Description: closes the HTTP session + releases all pooled connections.
+
+					  Also called automatically when the client is used as a 
+					  context manager, e.g. 'with VaultClient(vaultNum, apiKey) as vault:'.
+		"""
+
+		self.session.close()
+
+
+	def getValidKwargs(self, fileName):
+		"""
+		:Description: retrieves the valid keyword arguments for a 
+					  specific CDD Vault API method from the method's 
+					  help documentation. 
+					  
+					  Help documentation is parsed once + cached, see getKwargSpec().
+
+		:fileName (str): the name of a valid file containing help documentation for
+						 a CDD Vault API method.
+
+		: return (KwargSpec): a frozenset of valid keyword arguments.
+		"""
+
+		return getKwargSpec(fileName)
+
+
+	def buildQueryString(self, kwargs, valid_kwargs):
+		"""
+		:Description: Constructs the query string, which will be appended
+					  to the URL endpoint when making GET requests.
+
+					  Where 'valid_kwargs' is a KwargSpec, values are formatted by type:
+					  booleans as "true" / "false", lists of IDs as comma-separated strings,
+					  dates using ISO format and arrays (e.g. of field names) as repeated 
+					  "name[]=value" parameters.
+
+		:return (str):
+		"""
+
+		if len(kwargs) == 0: # No additional query parameters.
+			
+			return "" 
+
+
+		# Remove any invalid dictionary keys/parameters from kwargs + warn user, before constructing 
+		# the query string:
+
+		types = getattr(valid_kwargs, "types", {})
+
+		for k in list(kwargs):
+
+			if k not in valid_kwargs: 
+				
+				del kwargs[k]
+				print(f"'{k}' is not a valid query parameter.")
+				continue
+
+			value = kwargs[k]
+			valueType = types.get(k)
 
-def appendToDocString(*args, **kwargs):
-	"""
-	:Description: decorates each class method's doc string with
-				  descriptions of valid keyword arguments which
-				  will in turn be passed to CDD Vault.
+			if valueType == "boolean" and isinstance(value, bool): value = str(value).lower()
+			elif valueType == "list" and isinstance(value, (list, tuple, set, frozenset)): value = ",".join(map(str, value))
+			elif valueType == "date" and isinstance(value, (dt.date, dt.datetime)): value = value.isoformat()
 
-				  Mainly used with class methods which implement
-				  HTTP verbs (GET, POST, etc.) described in the
-				  CDD Vault API.
-	"""
+			elif valueType == "array" and isinstance(value, (list, tuple)): # Sent as repeated "name[]=" parameters.
 
-	helpDoc = kwargs.get("helpDoc")
-	helpDoc = os.path.join(helpDir, helpDoc)
-	helpDoc = "\t\t".join(open(helpDoc).readlines())
+				kwargs[k] = [str(v) for v in value]
+				continue
 
-	if not helpDoc.endswith("\n"): helpDoc += "\n"
+			kwargs[k] = str(value) # Ensure querys string only contains valid strings.
 
-	def inner(func):
 
-		func.__doc__ += "\n\n\t\t:Valid CDD Keyword Arguments:\n"
-		func.__doc__ += helpDoc
+		# Construct + return the query string, percent-encoding values (e.g. the "+" of a UTC offset,
+		# or a "&" in a name), except for the commas separating lists of IDs:
 
-		return func
+		queryString = []
 
-	return inner
+		for k, v in kwargs.items():
 
+			if isinstance(v, list): queryString.extend(f"{k}[]={quote(item)}" for item in v)
+			else: queryString.append(f"{k}={quote(v, safe=',')}")
 
-class VaultClient(object):
+		queryString = "?" + "&".join(queryString)
 
-	def __init__(self, vaultNum, apiKey):
+		return queryString
 
-		self.setVaultNumAndURL(vaultNum)
-		self.setAPIKey(apiKey)
 
-		self.setMaxSyncObjects()
+	def sendRequest(self, method, URL, headers=None, **kwargs):
+		"""
+		:Description: general method through which all requests are sent to CDD vault.
 
+					  Applies the client's rate limit (see setRateLimit()) + retry policy 
+					  (see setRetryPolicy()), then raises an HTTPError for any failed request
+					  which is not retried.
 
-	def __str__(self):
+		:method (str): the HTTP verb, e.g. "GET".
 
-		return f'Client for Vault ID: {self.vaultNum} instantiated {str(dt.datetime.now())}'
+		:headers (dict): optional. Headers to send in addition to the API token.
 
+		:kwargs: passed on to requests.Session.request().
 
-	def setVaultNumAndURL(self, vaultNum):
+		:return (requests.Response):
 		"""
-		:Description: sets the vault ID and constructs the base URL, from which endpoints
-					  for all subsequent API calls (GET, POST, PUT, DELETE) will be constructed.
 
-		:vaultNum (int or str): unique integer ID of the target vault.
+		headers = {"X-CDD-Token": self.apiKey, **(headers or {})}
 
-		:return (tuple): a two-element tuple consisting of the vault ID and the base URL for
-						 accessing the CDD Vault API.
+		instrumented = self.metrics is not None or bool(self.metricHooks)
+		if instrumented: endpoint = self.getEndpoint(URL)
+
+		attempt = 0
+
+		while True:
+
+			attempt += 1
+
+			if self.rateLimiter: self.rateLimiter.acquire()
+
+			# Rewind any file upload, in case it was read by a previous attempt:
+
+			if hasattr(kwargs.get("data"), "seek"): kwargs["data"].seek(0)
+
+			connectionTimings.connect = 0.0
+			start = time.perf_counter()
+
+			try: 
+				response = self.session.request(method, URL, headers=headers, **kwargs)
+
+			except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+
+				if instrumented: 
+					
+					self.recordMetrics("error", endpoint, counts={"request_errors": 1}, method=method, error=type(e).__name__)
+
+				if not self.retryPolicy.isRetryable(method, attempt): raise
+
+				if instrumented: self.recordMetrics("retry", endpoint, counts={"retries": 1}, method=method)
+
+				time.sleep(self.retryPolicy.getDelay(attempt))
+				continue
+
+			if instrumented: self.recordRequest(endpoint, method, response, time.perf_counter() - start, kwargs.get("stream", False))
+
+			if response.ok or not self.retryPolicy.isRetryable(method, attempt, response): break
+
+			if instrumented: self.recordMetrics("retry", endpoint, counts={"retries": 1}, method=method)
+
+			delay = self.retryPolicy.getDelay(attempt, response)
+
+			response.close() # Returns the connection of an unread (streamed) response to the pool.
+
+			time.sleep(delay)
+
+		response.raise_for_status()
+
+		if method.upper() != "GET": self.invalidateCache(URL)
+
+		return response
+
+
+	def recordRequest(self, endpoint, method, response, duration, stream=False):
 		"""
+		:Description: records the timings + size of a single request in the client's metrics.
 
-		self.vaultNum = int(vaultNum)
+					  The time to first byte is the time from sending the request until its response
+					  headers were received, less the time spent opening a connection. The download
+					  time is the time spent reading the response body, which for streamed responses
+					  (stream=True) happens after the request returns + is not recorded.
+		"""
 
-		URL = "https://app.collaborativedrug.com/api/v1/vaults/"
-		URL = URL + str(vaultNum)
+		connect = getattr(connectionTimings, "connect", 0.0)
+		elapsed = response.elapsed.total_seconds()
 
-		self.URL = URL
+		timings = {
+				   "connect": connect, 
+				   "ttfb": max(elapsed - connect, 0.0), 
+				   "request": duration
+				   }
 
-		return (self.vaultNum, self.URL)
+		counts = {"requests": 1}
 
+		body = response.request.body
+		counts["bytes_sent"] = len(body) if body is not None and hasattr(body, "__len__") else 0
 
-	def getVaultNum(self):
+		if not stream:
+
+			timings["download"] = max(duration - elapsed, 0.0)
+			counts["bytes_received"] = len(response.content)
+
+		self.recordMetrics("request", endpoint, timings, counts, method=method, status=response.status_code)
+
+
+	def sendGetRequest(self, URL, asText=False, asBytes=False):
 		"""
-		:Description: returns the unique integer ID of the target vault.
+		:Description: general method for sending GET requests to CDD vault.
 
-		:return (int): 
+					  json responses from endpoints with a time-to-live are served from + stored 
+					  in the client's cache, if set (see setCache()). Expired responses are 
+					  revalidated using If-None-Match / If-Modified-Since headers, and reused 
+					  if CDD Vault responds with 304 (Not Modified).
+
+					  Identical concurrent requests share a single response (see setSingleFlight()).
 		"""
 
-		return self.vaultNum
-	
+		key = ("GET", self.getCacheKey(URL), asText, asBytes)
 
-	def getURL(self):
+		return self.coalesce(key, URL, self.fetchGetRequest, URL, asText, asBytes)
+
+
+	def fetchGetRequest(self, URL, asText=False, asBytes=False):
+		"""
+		:Description: sends a single GET request, using the client's cache. See sendGetRequest().
 		"""
-		:Description: returns the base URL used in the construction of
-					  CDD Vault API calls (GET, POST, PUT, DELETE).
 
-		:return (str):
+		ttl = None
+		if self.cache is not None and not (asText or asBytes): ttl = self.getCacheTTL(URL)
+
+		if ttl is None: 
+
+			response = self.sendRequest("GET", URL)
+
+			if asText: return response.text
+
+			elif asBytes: return response.content
+
+			return self.decodeJSON(response)
+
+
+		key = self.getCacheKey(URL)
+		entry = self.cache.get(key)
+
+		headers = {}
+
+		if entry is not None:
+
+			if time.time() - entry["storedAt"] < ttl: 
+				
+				self.recordMetrics("cache", self.getEndpoint(URL), counts={"cache_hits": 1})
+				return entry["body"]
+
+			# Revalidate the cached response:
+
+			if entry.get("etag"): headers["If-None-Match"] = entry["etag"]
+			if entry.get("lastModified"): headers["If-Modified-Since"] = entry["lastModified"]
+
+		response = self.sendRequest("GET", URL, headers=headers)
+
+		if response.status_code == 304 and headers:
+
+			entry["storedAt"] = time.time()
+			entry["etag"] = response.headers.get("ETag", entry.get("etag"))
+			entry["lastModified"] = response.headers.get("Last-Modified", entry.get("lastModified"))
+
+		else: 
+			entry = {"body": self.decodeJSON(response), 
+					 "storedAt": time.time(),
+					 "etag": response.headers.get("ETag"),
+					 "lastModified": response.headers.get("Last-Modified")}
+
+		# Responses which expire immediately are only worth storing if they can be revalidated:
+
+		if ttl > 0 or entry["etag"] or entry["lastModified"]: self.cache.set(key, entry)
+
+		return entry["body"]
+
+
+	def sendSyncAndAsyncGets(self, suffix, kwargs, valid_kwargs):
 		"""
+		:Description: for methods where GET requests can be performed
+					  both synchronously and asynchronously, data will
+					  first be retrieved using a syncronous GET request.
 
-		return self.URL
+					  If the # of objects matching the request is >= 'maxSyncObjects'
+					  attribute, the remaining objects are either fetched as concurrent 
+					  synchronous pages (up to 'maxPagedObjects' objects, see 
+					  setMaxPagedObjects()), or the request will be repeated 
+					  asynchronously to avoid any loss of data.
+
+					  Identical concurrent calls share all of these requests, including a single
+					  asynchronous export (see setSingleFlight()). Long lists of IDs are split into
+					  shards (see sendShardedGets()).
+		"""
 
+		sharded = self.getShardedKwarg(kwargs, valid_kwargs)
+		if sharded is not None: return self.sendShardedGets(suffix, kwargs, valid_kwargs, *sharded)
 
-	def setAPIKey(self, apiKey):
+		kwargs["page_size"] = self.maxSyncObjects
+		queryString = self.buildQueryString(kwargs, valid_kwargs)
+
+		URL = self.URL + suffix + queryString
+
+		return self.coalesce(("objects", self.getCacheKey(URL)), URL, self.fetchSyncAndAsyncGets, 
+							 URL, suffix, kwargs, valid_kwargs)
+
+
+	def fetchSyncAndAsyncGets(self, URL, suffix, kwargs, valid_kwargs):
+		"""
+		:Description: retrieves all objects matching a GET request. See sendSyncAndAsyncGets().
 		"""
-		:Description: sets the API token credentials, which will be passed
-					  in the request header to CDD Vault with each API request. 
 
-					  Note that the API token must have read/write access to
-					  the vault specified by the vault ID when executing the
-					  various API calls or an error will be returned.
+		objects = self.sendGetRequest(URL)
 
-		:return (str):
+		if self.isIncomplete(objects) and objects["count"] <= self.maxPagedObjects:
+
+			pages = self.iterPages(suffix, kwargs, valid_kwargs, objects["count"])
+			objects = objects["objects"] + [obj for page in pages for obj in page]
+
+		elif self.isIncomplete(objects):
+
+			kwargs["async"] = "true"
+			queryString = self.buildQueryString(kwargs, valid_kwargs)
+			URL = self.URL + suffix + queryString
+
+			exportID =self.sendGetRequest(URL)["id"]
+			objects = self.getAsyncExport(exportID, key=suffix, size=objects["count"])
+
+			if type(objects) == dict and objects["status"] == "canceled": 
+				
+				sys.exit(1)
+
+		else: objects = objects["objects"]
+
+		return objects
+
+
+	def getShardedKwarg(self, kwargs, valid_kwargs):
 		"""
+		:Description: finds the query parameter to split into shards, if any (see setIDSharding()).
 
-		self.apiKey = apiKey
+		:return (tuple or None): the parameter's name + its list of IDs, with duplicates removed, or 
+								 None if no parameter needs to be sharded.
+		"""
 
-		return self.apiKey
+		if self.maxShardLength is None: return None
 
+		longest = None
 
-	def getAPIKey(self):
+		for k in shardableKwargs:
+
+			if k not in kwargs or k not in valid_kwargs: continue
+
+			value = kwargs[k]
+
+			if isinstance(value, str): ids = value.split(",")
+			elif isinstance(value, (list, tuple, set, frozenset)): ids = [str(i) for i in value]
+			else: continue
+
+			ids = list(dict.fromkeys(i.strip() for i in ids if i.strip()))
+			length = sum(len(i) + 1 for i in ids) - 1
+
+			if length <= self.maxShardLength and len(ids) <= self.maxSyncObjects: continue
+
+			if longest is None or length > longest[2]: longest = (k, ids, length)
+
+		return longest[:2] if longest else None
+
+
+	def getShardSize(self, shard, count):
+		"""
+		:Description: estimates the # of IDs per shard for which each shard returns at most 
+					  'maxSyncObjects' objects, from the # of objects ('count') returned for the first shard.
 		"""
-		:Description: returns the currently set API key.
 
-		:return (str):
+		perID = count / len(shard)
+
+		if perID <= 1: return self.maxSyncObjects
+
+		return max(1, int(0.8 * self.maxSyncObjects / perID)) # Leaves room for variation between shards.
+
+
+	def mergeShards(self, results):
+		"""
+		:Description: concatenates the objects returned for each shard in order, removing objects 
+					  (with the same "id") returned by more than one shard.
 		"""
 
-		return self.apiKey
+		merged = []
+		seen = set()
 
+		for objects in results:
 
-	def setMaxSyncObjects(self, value=1000):
+			for obj in objects:
+
+				objectID = obj.get("id") if isinstance(obj, dict) else None
+
+				if objectID is not None:
+
+					if objectID in seen: continue
+					seen.add(objectID)
+
+				merged.append(obj)
+
+		return merged
+
+
+	def sendShardedGets(self, suffix, kwargs, valid_kwargs, key, ids):
 		"""
-		:Description: sets the 'maxSyncObjects' attribute, which is used to determine
-					  when a synchronous vs asynchronous export request is submitted
-					  to CDD. If the # of objects returned from a GET request is ever
-					  >= maxSyncObjects, the call will be repeated asynchronously.
+		:Description: retrieves all objects matching a GET request whose 'key' query parameter holds 
+					  a long list of IDs, by splitting the list into shards (see setIDSharding()).
 
-					  Defaults to 1000, the maximum # of objects which a CDD GET request
-					  can return synchronously.
+					  The first shard is fetched alone, to estimate how many objects each ID matches, 
+					  and the remaining shards are sized to match + fetched concurrently. Each shard is 
+					  retrieved with sendSyncAndAsyncGets(), so that shards which still match too many
+					  objects are paged or exported. 
 
-					  Only used in methods where GET requests can be performed asynchronously:
-					  Molecules, Batches, Plates, Protocols, and Protocol Data. See method
-					  sendSyncAndAsyncGets().
+		:return (list): the objects for each shard in order, without duplicates.
 		"""
 
-		self.maxSyncObjects = value
+		def getShard(shard):
 
-		return self.maxSyncObjects
+			return self.sendSyncAndAsyncGets(suffix, {**kwargs, key: shard}, valid_kwargs)
 
+		first = splitIDList(ids, self.maxSyncObjects, self.maxShardLength)[0]
+		results = [getShard(first)]
 
-	def getValidKwargs(self, fileName):
+		shards = splitIDList(ids[len(first):], self.getShardSize(first, len(results[0])), self.maxShardLength)
+
+		with ThreadPoolExecutor(max_workers=self.maxShardWorkers) as executor:
+
+			results.extend(executor.map(getShard, shards))
+
+		self.recordMetrics("shards", self.getEndpoint(suffix), counts={"shards": len(shards) + 1})
+
+		return self.mergeShards(results)
+
+
+	def iterShardedGets(self, suffix, kwargs, valid_kwargs, key, ids, statusUpdates=False):
+		"""
+		:Description: iterator version of sendShardedGets(). Shards are fetched one at a time with 
+					  iterSyncAndAsyncGets(), so that only a single shard's objects are in flight at once.
+
+		:return (generator): yields the objects for each shard in order, without duplicates.
+		"""
+
+		seen = set()
+
+		def iterShard(shard):
+
+			for obj in self.iterSyncAndAsyncGets(suffix, {**kwargs, key: shard}, valid_kwargs, statusUpdates=statusUpdates):
+
+				objectID = obj.get("id") if isinstance(obj, dict) else None
+
+				if objectID is not None:
+
+					if objectID in seen: continue
+					seen.add(objectID)
+
+				yield obj
+
+		first = splitIDList(ids, self.maxSyncObjects, self.maxShardLength)[0]
+		count = 0
+
+		for obj in iterShard(first):
+
+			count += 1
+			yield obj
+
+		shards = splitIDList(ids[len(first):], self.getShardSize(first, count), self.maxShardLength)
+
+		for shard in shards: yield from iterShard(shard)
+
+		self.recordMetrics("shards", self.getEndpoint(suffix), counts={"shards": len(shards) + 1})
+
+
+	def getProjection(self, entity, select, fields, kwargs, valid_kwargs):
+		"""
+		:Description: plans the cheapest request for the columns in 'select', for getMolecules() or 
+					  getBatches(). Server-side parameters are added to 'kwargs' (unless already set):
+
+						:only_ids: if only "id" is selected.
+
+						:no_structures: unless a structure representation (e.g. "smiles") is selected.
+
+						:molecule_fields / batch_fields: the selected molecule + batch fields.
+
+						:only_batch_ids / only_molecule_ids: unless batch-level information (for molecules)
+															 or molecule-level information (for batches) 
+															 is selected.
+
+					  Each selected name is looked up as a molecule or batch field (for batches), then 
+					  as a key of the object. Dotted names select nested values, e.g. "molecule.name".
+
+		:entity (str): "molecule" or "batch".
+
+		:fields (dict): the vault's fields, see getFields(). Only needed if names other than "id" are selected.
+
+		:return (tuple): the keys leading to each selected value (see projectObjects()), and the CDD Vault
+						 data types of the selected fields, by column name.
+		"""
+
+		moleculeFields = {f["name"]: f for f in (fields or {}).get("molecule", [])}
+		batchFields = {f["name"]: f for f in (fields or {}).get("batch", [])} if entity == "batch" else {}
+
+		paths = {}
+		types = {"id": "Integer"}
+
+		for name in select:
+
+			if name in batchFields: 
+				
+				paths[name] = ("batch_fields", name)
+				types[name] = batchFields[name].get("type", batchFields[name].get("data_type"))
+
+			elif name in moleculeFields:
+
+				paths[name] = ("molecule_fields", name) if entity == "molecule" else ("molecule", "molecule_fields", name)
+				types[name] = moleculeFields[name].get("type", moleculeFields[name].get("data_type"))
+
+			else: paths[name] = tuple(name.split("."))
+
+		types = {k: v for k, v in types.items() if k in paths}
+
+
+		# Server-side parameters:
+
+		def setDefault(k, v):
+
+			if k in valid_kwargs and k not in kwargs: kwargs[k] = v
+
+		if list(paths.values()) == [("id",)]: 
+			
+			setDefault("only_ids", True)
+			return (paths, types)
+
+		molecule = [path[1:] if entity == "batch" else path for path in paths.values() 
+					if entity == "molecule" or path[0] == "molecule"]
+
+		if not any(path and path[0] in structureKeys for path in molecule): setDefault("no_structures", True)
+
+		selectedMoleculeFields = [path[-1] for path in paths.values() if "molecule_fields" in path]
+		selectedBatchFields = [path[-1] for path in paths.values() if "batch_fields" in path]
+
+		if selectedMoleculeFields: setDefault("molecule_fields", selectedMoleculeFields)
+		if selectedBatchFields: setDefault("batch_fields", selectedBatchFields)
+
+		if entity == "molecule" and not any(path[0] == "batches" for path in paths.values()): setDefault("only_batch_ids", True)
+		if entity == "batch" and not molecule: setDefault("only_molecule_ids", True)
+
+		return (paths, types)
+
+
+	def selectObjects(self, objects, paths, types, asDataFrame=True, endpoint=None):
+		"""
+		:Description: prunes objects to the columns planned by getProjection(), and optionally builds a 
+					  DataFrame with a column per selected name, typed by field type (see castColumns()).
+		"""
+
+		rows = projectObjects(objects, paths)
+
+		if not asDataFrame: return rows
+
+		start = time.perf_counter()
+
+		frame = castColumns(pd.DataFrame(rows, columns=list(paths)), types)
+
+		self.recordMetrics("dataframe", self.getEndpoint(endpoint or ""), timings={"dataframe_build": time.perf_counter() - start})
+
+		return frame
+
+
+	def isIncomplete(self, objects):
+		"""
+		:Description: determines whether more objects match a synchronous GET request than were
+					  returned in its first page, 'objects'.
 		"""
-		:Description: retrieves a list of valid keyword arguments for a 
-					  specific CDD Vault API method from the method's 
-					  help documentation.
-					  
-		Valid keywords in help documentation files are identified by:
 
-			1) No white space characters at the start of the line.
+		if "count" not in objects: return False
 
-			2) A final colon ":" character, after stripping all white space 
-			from the end of the line.
+		count = objects["count"]
 
+		return count >= (self.maxSyncObjects - 1) and count > len(objects["objects"])
 
-		:fileName (str): the name of a valid file containing help documentation for
-						 a CDD Vault API method.
 
-		: return (list of str):
+	def iterPages(self, suffix, kwargs, valid_kwargs, count):
 		"""
+		:Description: fetches every page after the first of a synchronous GET request concurrently,
+					  using the 'offset' query parameter. 
 
-		filePath = os.path.join(helpDir, fileName)
+		:count (int): the total # of objects matching the request.
 
-		doc = open(filePath).readlines()
+		:return (generator): yields the list of objects on each page, in order.
+		"""
 
-		# Parse help file + locate valid keyword arguments:
+		valid_kwargs = KwargSpec(valid_kwargs).withKeys("offset")
 
-		valid_kwargs = [line.rstrip() for line in doc]
-		valid_kwargs = [line for line in valid_kwargs if not re.match(r'\s', line)]
-		valid_kwargs = [line[:-1] for line in valid_kwargs if line.endswith(":")]
+		def getPage(offset):
 
-		return valid_kwargs
+			pageKwargs = {**kwargs, "page_size": self.maxSyncObjects, "offset": offset}
+			queryString = self.buildQueryString(pageKwargs, valid_kwargs)
 
+			return self.sendGetRequest(self.URL + suffix + queryString)["objects"]
 
-	def buildQueryString(self, kwargs, valid_kwargs):
-		"""
-		:Description: Constructs the query string, which will be appended
-					  to the URL endpoint when making GET requests.
+		offsets = range(self.maxSyncObjects, count, self.maxSyncObjects)
 
-		:return (str):
-		"""
+		with ThreadPoolExecutor(max_workers=self.maxPageWorkers) as executor:
 
-		if len(kwargs) == 0: # No additional query parameters.
-			
-			return "" 
+			yield from executor.map(getPage, offsets)
 
 
-		# Remove any invalid dictionary keys/parameters from kwargs + warn user, before constructing 
-		# the query string:
+	def iterSyncAndAsyncGets(self, suffix, kwargs, valid_kwargs, chunkSize=None, statusUpdates=False):
+		"""
+		:Description: iterator version of sendSyncAndAsyncGets(). Large results are streamed from
+					  the asynchronous export + parsed incrementally, so that only 'chunkSize' 
+					  objects are held in memory at once. Long lists of IDs are split into shards
+					  (see iterShardedGets()).
 
-		for k in list(kwargs):
+		:chunkSize (int): if None, objects are yielded one at a time. Otherwise, objects are 
+						  yielded in lists of up to 'chunkSize' objects.
 
-			if k not in valid_kwargs: 
-				
-				del kwargs[k]
-				print(f"'{k}' is not a valid query parameter.")
+		:return (generator):
+		"""
 
-			else: kwargs[k] = str(kwargs[k]) # Ensure querys string only contains valid strings.
+		def iterObjects():
 
+			sharded = self.getShardedKwarg(kwargs, valid_kwargs)
 
-		# Construct + return the query string:
+			if sharded is not None:
 
-		queryString = [f"{k}={v}" for k,v in kwargs.items()]
-		queryString = "?" + "&".join(queryString)
+				yield from self.iterShardedGets(suffix, kwargs, valid_kwargs, *sharded, statusUpdates=statusUpdates)
+				return
 
-		return queryString
+			kwargs["page_size"] = self.maxSyncObjects
+			queryString = self.buildQueryString(kwargs, valid_kwargs)
 
+			URL = self.URL + suffix + queryString
 
-	def sendGetRequest(self, URL, asText=False, asBytes=False):
+			objects = self.sendGetRequest(URL)
 
-		headers = {"X-CDD-Token": self.apiKey}
+			if not self.isIncomplete(objects):
 
-		response = requests.get(URL, headers=headers)
+				yield from objects["objects"]
+				return
 
-		response.raise_for_status()
+			if objects["count"] <= self.maxPagedObjects:
 
-		if asText: return response.text
+				yield from objects["objects"]
 
-		elif asBytes: return response.content
+				for page in self.iterPages(suffix, kwargs, valid_kwargs, objects["count"]): yield from page
+				return
 
-		return response.json()
+			kwargs["async"] = "true"
+			queryString = self.buildQueryString(kwargs, valid_kwargs)
+			URL = self.URL + suffix + queryString
 
+			exportID = self.sendGetRequest(URL)["id"]
 
-	def sendSyncAndAsyncGets(self, suffix, kwargs, valid_kwargs):
-		"""
-		:Description: for methods where GET requests can be performed
-					  both synchronously and asynchronously, data will
-					  first be retrieved using a syncronous GET request.
+			try: self.waitForAsyncExport(exportID, statusUpdates=statusUpdates, key=suffix, size=objects["count"])
 
-					  If the # of objects returned is >= 'maxSyncObjects'
-					  attribute, the request will be repeated asynchronously
-					  to avoid any loss of data.
-		"""
+			except KeyboardInterrupt: # Cancels in-progress asynchronous export.
 
-		kwargs["page_size"] = self.maxSyncObjects
-		queryString = self.buildQueryString(kwargs, valid_kwargs)
+				self.deleteExport(exportID)
+				raise
 
-		URL = self.URL + suffix + queryString
+			yield from self.iterExportData(exportID)
 
-		objects = self.sendGetRequest(URL)
 
-		if "count" in objects and objects["count"] >= (self.maxSyncObjects - 1):
+		if chunkSize is None:
 
-			kwargs["async"] = "true"
-			queryString = self.buildQueryString(kwargs, valid_kwargs)
-			URL = self.URL + suffix + queryString
+			yield from iterObjects()
+			return
 
-			exportID =self.sendGetRequest(URL)["id"]
-			objects = self.getAsyncExport(exportID)
+		chunk = []
 
-			if type(objects) == dict and objects["status"] == "canceled": 
-				
-				sys.exit(1)
+		for obj in iterObjects():
 
-		else: objects = objects["objects"]
+			chunk.append(obj)
 
-		return objects
+			if len(chunk) == chunkSize:
+
+				yield chunk
+				chunk = []
+
+		if chunk: yield chunk
 
 
 	@appendToDocString(helpDoc="get_api_execution_metrics.txt")
@@ -316,7 +2279,8 @@ class VaultClient(object):
 		return usageMetrics
 
 
-	def getAsyncExport(self, exportID, interval=5.0, asText=False, asBytes=False, statusUpdates=True):
+	def getAsyncExport(self, exportID, interval=None, asText=False, asBytes=False, statusUpdates=True, 
+																		key=None, size=None, filePath=None):
 		"""
 		:Description: used to both check the status of an in-progress CDD asynchronous export,
 					  as well as retrieve the data once the export has been completed.
@@ -326,35 +2290,31 @@ class VaultClient(object):
 					  {'id': 19211628, 'created_at': '2022-11-03T02:02:12.000Z', 
 										'modified_at': '2022-11-03T02:02:12.000Z', 'status': 'started'}
 
+		:interval (float or polling strategy): the wait between status checks. Defaults to the client's
+											   polling strategy (see setPollingStrategy()).
+
 		:asText: determines whether the data in response is returned as a json (default behavior) or a string.
 
 		:asBytes: determines whether the data in response is returned as bytes.
 
 		:statusUpdates (bool): if true, displays status updates of asynchronous export to screen.
 
-		:return: json output.
+		:key (str): optional. The endpoint being exported (e.g. "/molecules"), under which the export's
+					duration is recorded by the polling strategy.
 
-		:Reference: https://support.collaborativedrug.com/hc/en-us/articles/115005685506-Async-Export-GET-
-		"""
-
-		try:
-			suffix = f"/export_progress/{exportID}"
-			URL = self.URL + suffix
-
-			nonErrorStates = ["new", "started", "finished"] 
-			# ^Any export status except these 3 should return an error.
-
-			while True:
+		:size (int): optional. The expected # of exported objects, used by the polling strategy.
 
-				response = self.sendGetRequest(URL)
-				if statusUpdates: print(response)
-				status = response["status"]
+		:filePath (str or file-like object): optional. If set, the export is streamed in chunks to this
+											 file path (or binary file object) instead of being held
+											 in memory. See downloadExport().
 
-				assert status in nonErrorStates, f"Export status '{status}' indicates the export has failed to complete."
+		:return: json output, or the # of bytes written if 'filePath' is set.
 
-				if status == "finished": break
+		:Reference: https://support.collaborativedrug.com/hc/en-us/articles/115005685506-Async-Export-GET-
+		"""
 
-				time.sleep(interval) # CDD-recommended time-interval for export checks is 5-10 sec.
+		try:
+			self.waitForAsyncExport(exportID, interval, statusUpdates, key, size)
 
 		except KeyboardInterrupt as e: # Cancels in-progress asynchronous export.
 
@@ -365,7 +2325,55 @@ class VaultClient(object):
 
 		
 		# Get export data:
+
+		if filePath is not None: return self.downloadExport(exportID, filePath)
 		
+		return self.getExportData(exportID, asText=asText, asBytes=asBytes)
+
+
+	def waitForAsyncExport(self, exportID, interval=None, statusUpdates=True, key=None, size=None):
+		"""
+		:Description: checks the status of an in-progress CDD asynchronous export until it has finished.
+					  See getAsyncExport() for a description of the arguments.
+		"""
+
+		strategy = self.getPollingStrategy(interval)
+		start = time.monotonic()
+		pollNumber = 0
+
+		suffix = f"/export_progress/{exportID}"
+		URL = self.URL + suffix
+
+		nonErrorStates = ["new", "started", "finished"] 
+		# ^Any export status except these 3 should return an error.
+
+		while True:
+
+			response = self.sendGetRequest(URL)
+			pollNumber += 1
+			self.recordPoll(key or "/exports")
+
+			if statusUpdates: print(response)
+			status = response["status"]
+
+			assert status in nonErrorStates, f"Export status '{status}' indicates the export has failed to complete."
+
+			if status == "finished": break
+
+			time.sleep(strategy.getDelay(pollNumber, time.monotonic() - start, key, size))
+
+		strategy.record(key, time.monotonic() - start, size)
+
+		self.recordMetrics("export", key or "/exports", timings={"export_wait": time.monotonic() - start})
+
+
+	def getExportData(self, exportID, asText=False, asBytes=False):
+		"""
+		:Description: retrieves the data for a finished asynchronous export.
+
+		:return: the exported objects (json), or the raw export as a string (asText=True) or bytes (asBytes=True).
+		"""
+
 		suffix = f"/exports/{exportID}"
 		URL = self.URL + suffix
 
@@ -383,6 +2391,214 @@ class VaultClient(object):
 		return response
 
 
+	def iterExportData(self, exportID, chunkSize=1024 * 1024):
+		"""
+		:Description: streams the objects of a finished asynchronous export, parsing them one 
+					  at a time as they arrive rather than loading the whole export into memory.
+					  See iterJSONObjects().
+
+		:chunkSize (int): the maximum # of bytes read from the connection at once.
+
+		:return (generator): yields the exported objects (json).
+		"""
+
+		suffix = f"/exports/{exportID}"
+		URL = self.URL + suffix
+
+		with self.sendRequest("GET", URL, stream=True) as response:
+
+			yield from iterJSONObjects(response.iter_content(chunk_size=chunkSize))
+
+
+	def downloadExport(self, exportID, destination, chunkSize=1024 * 1024, maxResumes=3):
+		"""
+		:Description: streams the data for a finished asynchronous export to disk in chunks, so that
+					  at most 'chunkSize' bytes of the export are held in memory at once.
+
+					  If the connection drops partway through, the download is resumed from the 
+					  last byte written using an HTTP Range request. Should CDD Vault ignore the 
+					  range, the download restarts from the beginning.
+
+		:destination (str or file-like object): a file path, or a binary file object opened for writing.
+												File objects are not closed, and must be seekable for a
+												download to be restarted.
+
+		:chunkSize (int): the maximum # of bytes read from the connection at once.
+
+		:maxResumes (int): the maximum # of times a dropped download is resumed.
+
+		:return (int): the # of bytes written.
+		"""
+
+		suffix = f"/exports/{exportID}"
+		URL = self.URL + suffix
+
+		ownsFile = isinstance(destination, (str, os.PathLike))
+		f = open(destination, "wb") if ownsFile else destination
+
+		origin = f.tell() if f.seekable() else None
+
+		try:
+			received = 0
+			resumes = 0
+
+			while True:
+
+				headers = {"Range": f"bytes={received}-"} if received else None
+
+				try:
+					with self.sendRequest("GET", URL, headers=headers, stream=True) as response:
+
+						if received and response.status_code != 206: # Range was ignored; restart download.
+
+							assert origin is not None, "Cannot restart a download to a non-seekable file object."
+
+							f.seek(origin)
+							f.truncate()
+							received = 0
+
+						for chunk in response.iter_content(chunk_size=chunkSize):
+
+							f.write(chunk)
+							received += len(chunk)
+
+					break
+
+				except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError):
+
+					resumes += 1
+					if resumes > maxResumes: raise
+
+		finally:
+
+			if ownsFile: f.close()
+
+		return received
+
+
+	def submitAsyncExport(self, suffix, helpDoc=None, **kwargs):
+		"""
+		:Description: starts an asynchronous export in CDD Vault without waiting for it to complete.
+					  Used with getAsyncExports() to run many exports at once.
+
+					  Example: vault.submitAsyncExport("/protocols/123/data", helpDoc="get_protocol_data.txt", runs="1,2")
+
+		:suffix (str): the endpoint to export from, e.g. "/molecules", "/batches", "/protocols/{id}/data", 
+					   "/searches/{id}" or "/eln/entries".
+
+		:helpDoc (str): optional. Name of the endpoint's help documentation file, used to validate the kwargs. 
+
+		:return (int): the unique ID of the new export.
+		"""
+
+		if helpDoc is None: valid_kwargs = KwargSpec(kwargs, {})
+		else: valid_kwargs = self.getValidKwargs(helpDoc)
+
+		kwargs["async"] = "true"
+		valid_kwargs = valid_kwargs.withKeys("async")
+
+		queryString = self.buildQueryString(kwargs, valid_kwargs)
+		URL = self.URL + suffix + queryString
+
+		exportID = self.sendGetRequest(URL)["id"]
+
+		return exportID
+
+
+	def getAsyncExports(self, exports, interval=None, maxPollsPerSecond=2.0, statusUpdates=False):
+		"""
+		:Description: waits on many in-progress asynchronous exports at once, yielding the data
+					  for each export as soon as it has finished.
+
+					  All exports are polled from a single scheduling loop: each export is checked
+					  according to the polling strategy, and status checks across all exports
+					  are spaced to stay within 'maxPollsPerSecond'. The total wait is therefore
+					  roughly that of the slowest export, rather than the sum of all of them.
+
+					  Exports which are still outstanding on a keyboard interrupt are deleted.
+
+		:exports (iterable or dict): export IDs (see submitAsyncExport()), or a dict mapping each export 
+									 ID to the format its data should be returned in: "json" (default), 
+									 "text" or "bytes", or None to leave the data to be fetched by the
+									 caller (e.g. with downloadExport()).
+
+		:interval (float or polling strategy): the wait between status checks of the same export.
+											   Defaults to the client's polling strategy (see setPollingStrategy()).
+
+		:maxPollsPerSecond (float): status-check budget shared across all exports.
+
+		:statusUpdates (bool): if true, displays status updates of the exports to screen.
+
+		:return (generator): yields (exportID, data, error) tuples in order of completion, where 'error'
+							 is None if the export finished successfully.
+		"""
+
+		if not isinstance(exports, dict): exports = {exportID: "json" for exportID in exports}
+
+		nonErrorStates = ["new", "started", "finished"]
+
+		# Export IDs ordered by the time of their next status check:
+
+		strategy = self.getPollingStrategy(interval)
+		start = time.monotonic()
+
+		queue = [(start, exportID) for exportID in exports]
+		heapq.heapify(queue)
+
+		outstanding = set(exports)
+		pollNumbers = {exportID: 0 for exportID in exports}
+		lastPoll = 0.0
+
+		try:
+			while queue:
+
+				nextPoll, exportID = heapq.heappop(queue)
+
+				delay = max(nextPoll, lastPoll + 1.0 / maxPollsPerSecond) - time.monotonic()
+				if delay > 0: time.sleep(delay)
+
+				lastPoll = time.monotonic()
+
+				try:
+					response = self.sendGetRequest(self.URL + f"/export_progress/{exportID}")
+					pollNumbers[exportID] += 1
+					self.recordPoll("/exports")
+
+					if statusUpdates: print(response)
+					status = response["status"]
+
+					assert status in nonErrorStates, f"Export status '{status}' indicates the export has failed to complete."
+
+					if status != "finished":
+
+						delay = strategy.getDelay(pollNumbers[exportID], lastPoll - start)
+						heapq.heappush(queue, (lastPoll + delay, exportID))
+						continue
+
+					format = exports[exportID]
+
+					if format is None: data = None
+					else: data = self.getExportData(exportID, asText=(format == "text"), asBytes=(format == "bytes"))
+
+				except (AssertionError, requests.exceptions.RequestException) as e:
+
+					outstanding.discard(exportID)
+					yield (exportID, None, e)
+					continue
+
+				outstanding.discard(exportID)
+				yield (exportID, data, None)
+
+		except KeyboardInterrupt: # Cancels all outstanding asynchronous exports.
+
+			for exportID in outstanding:
+
+				delResponse = self.deleteExport(exportID)
+				if statusUpdates: print(delResponse)
+
+			raise
+
+
 	def getBatchMoveJobs(self, batchMoveJobID=None):
 		"""
 		:Description: retrieve the statuses of one or more batch move jobs from CDD Vault queue.
@@ -405,9 +2621,13 @@ class VaultClient(object):
 
 
 	@appendToDocString(helpDoc="get_batches.txt")
-	def getBatches(self, asDataFrame=True, **kwargs):
+	def getBatches(self, asDataFrame=True, select=None, **kwargs):
 		"""
 		:Description: return a collection of batches from CDD vault. 
+
+		:select (list of str): optional. Names of the only columns to return (e.g. ["id", "name", "Purity"]): 
+							   batch or molecule fields, batch keys, or nested keys such as "molecule.name". 
+							   The request is narrowed server-side where possible (see getProjection()).
 		
 		:Reference: https://support.collaborativedrug.com/hc/en-us/articles/115005682943-Batch-es-GET-POST-PUT-
 		"""
@@ -422,13 +2642,36 @@ class VaultClient(object):
 
 		suffix = "/batches"
 
+		if select is not None:
+
+			fields = self.getFields(asDataFrame=False) if set(select) - {"id"} else None
+			paths, types = self.getProjection("batch", select, fields, kwargs, valid_kwargs)
+
+			batches = self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
+
+			return self.selectObjects(batches, paths, types, asDataFrame, suffix)
+
 		batches = self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
 
-		if asDataFrame: batches = pd.DataFrame.from_dict(batches)
+		if asDataFrame: batches = self.toDataFrame(batches, suffix)
 
 		return batches
 
 
+	@appendToDocString(helpDoc="get_batches.txt")
+	def iterBatches(self, chunkSize=None, **kwargs):
+		"""
+		:Description: iterator version of getBatches(), which streams + parses batches incrementally
+					  instead of loading the full result into memory. See iterSyncAndAsyncGets().
+
+		:chunkSize (int): if set, batches are yielded in lists of up to 'chunkSize' batches.
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_batches.txt")
+
+		return self.iterSyncAndAsyncGets("/batches", kwargs, valid_kwargs, chunkSize)
+
+
 	@appendToDocString(helpDoc="get_collections.txt")
 	def getCollections(self, asDataFrame=True, **kwargs):
 		"""
@@ -449,7 +2692,7 @@ class VaultClient(object):
 
 		collections = self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
 
-		if asDataFrame: collections = pd.DataFrame.from_dict(collections)
+		if asDataFrame: collections = self.toDataFrame(collections, suffix)
 
 		return collections
 
@@ -467,7 +2710,7 @@ class VaultClient(object):
 		URL = self.URL + suffix
 
 		datasets = self.sendGetRequest(URL=URL)
-		if asDataFrame: datasets = pd.DataFrame(datasets)
+		if asDataFrame: datasets = self.toDataFrame(datasets, suffix)
 			
 		return datasets
 
@@ -510,7 +2753,7 @@ class VaultClient(object):
 			URL = self.URL + suffix
 
 			elnEntries = self.sendGetRequest(URL)["objects"]
-			if asDataFrame: elnEntries = pd.DataFrame(elnEntries)
+			if asDataFrame: elnEntries = self.toDataFrame(elnEntries, suffix)
 
 			return elnEntries
 
@@ -521,9 +2764,7 @@ class VaultClient(object):
 		URL = self.URL + suffix
 
 		exportID = self.sendGetRequest(URL=URL)["id"]
-		elnEntries = self.getAsyncExport(exportID=exportID, asBytes=True)
-
-		with open(exportPath, "wb") as f: f.write(elnEntries)
+		self.getAsyncExport(exportID=exportID, key="/eln/entries", filePath=exportPath)
 
 		if unzipELNEntries:
 
@@ -553,7 +2794,7 @@ class VaultClient(object):
 		fields = self.sendGetRequest(URL)
 		if asDataFrame: 
 			
-			fields = {k:pd.DataFrame.from_dict(fields[k]) for k in fields}
+			fields = {k:self.toDataFrame(fields[k], suffix) for k in fields}
 
 		return fields
 
@@ -585,6 +2826,53 @@ class VaultClient(object):
 		return contents
 
 
+	def getFilesBulk(self, fileIDs, destFolder, maxWorkers=10, chunkSize=1024 * 1024):
+		"""
+		:Description: downloads many files concurrently to 'destFolder', each named after the original
+					  name of the file when it was uploaded to CDD Vault. See getFile().
+
+					  Each file is streamed + its base64 contents decoded to disk by a worker thread 
+					  as it arrives (see decodeBase64Field()), so that at most 'chunkSize' bytes of 
+					  each file are held in memory at once.
+
+					  Files with the same name overwrite each other.
+
+		:fileIDs (iterable): unique IDs of the files to download.
+
+		:maxWorkers (int): the maximum # of concurrent downloads.
+
+		:return (generator): yields (fileID, file path, error) tuples as each download completes,
+							 where 'error' is None if the download succeeded.
+		"""
+
+		os.makedirs(destFolder, exist_ok=True)
+
+		def download(fileID):
+
+			partialPath = os.path.join(destFolder, f".{fileID}.download")
+
+			try:
+				with self.sendRequest("GET", self.URL + f"/files/{fileID}", stream=True) as response:
+
+					with open(partialPath, "wb") as f: 
+						
+						metadata = decodeBase64Field(response.iter_content(chunk_size=chunkSize), f)
+
+			except Exception:
+
+				if os.path.exists(partialPath): os.remove(partialPath)
+				raise
+
+			destPath = os.path.join(destFolder, metadata.get("name") or str(fileID))
+			os.replace(partialPath, destPath)
+
+			return destPath
+
+		for item, destPath, error in self.sendBulkRequests(download, ((id,) for id in fileIDs), maxWorkers):
+
+			yield (item[0], destPath, error)
+
+
 	@appendToDocString(helpDoc="get_sample_inventory.txt")
 	def getInventorySamples(self, asDataFrame=True, **kwargs):
 		"""
@@ -603,7 +2891,7 @@ class VaultClient(object):
 
 		samples = self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
 
-		if asDataFrame: samples = pd.DataFrame.from_dict(samples)
+		if asDataFrame: samples = self.toDataFrame(samples, suffix)
 
 		return samples
 
@@ -621,7 +2909,7 @@ class VaultClient(object):
 		URL = self.URL + suffix
 
 		locations = self.sendGetRequest(URL=URL)
-		if asDataFrame: locations = pd.DataFrame(locations)
+		if asDataFrame: locations = self.toDataFrame(locations, suffix)
 			
 		return locations
 
@@ -652,7 +2940,7 @@ class VaultClient(object):
 			URL = self.URL + suffix
 
 			response = self.sendGetRequest(URL)
-			if asDataFrame: response = pd.DataFrame.from_dict(response)
+			if asDataFrame: response = self.toDataFrame(response, suffix)
 
 		else:
 
@@ -681,7 +2969,7 @@ class VaultClient(object):
 
 		exportID = self.sendGetRequest(URL=URL)["id"]
 
-		molImage = self.getAsyncExport(exportID=exportID, asBytes=True)
+		molImage = self.getAsyncExport(exportID=exportID, asBytes=True, key="/molecules/image")
 
 		if filePath: 
 
@@ -690,10 +2978,94 @@ class VaultClient(object):
 		return molImage
 
 
+	def getMoleculeImagesBulk(self, molIDs, destFolder, maxWorkers=10, maxPending=200, interval=None, 
+							  maxPollsPerSecond=10.0, extension="png"):
+		"""
+		:Description: downloads images of many molecules concurrently to 'destFolder', as "<molID>.<extension>". 
+					  See getMoleculeImage().
+
+					  Image exports are started concurrently in batches of up to 'maxPending' molecules, 
+					  and polled together (see getAsyncExports()) while finished images are streamed to
+					  disk by worker threads (see downloadExport()).
+
+		:molIDs (iterable): unique IDs of the molecules.
+
+		:maxWorkers (int): the maximum # of concurrent requests to start exports or download images.
+
+		:maxPending (int): the maximum # of image exports in progress at once.
+
+		:interval (float or polling strategy): the wait between status checks of the same export.
+											   Defaults to the client's polling strategy (see setPollingStrategy()).
+
+		:maxPollsPerSecond (float): status-check budget shared across all pending exports.
+
+		:return (generator): yields (molID, file path, error) tuples as each image is written,
+							 where 'error' is None if the download succeeded.
+		"""
+
+		os.makedirs(destFolder, exist_ok=True)
+
+		molIDs = list(molIDs)
+
+		def startExport(molID):
+
+			return self.sendGetRequest(self.URL + f"/molecules/{molID}/image")["id"]
+
+		def collect(downloads, block=False):
+
+			# Yields the results of finished downloads:
+
+			done = wait(downloads).done if block else [d for d in downloads if d.done()]
+
+			for future in done:
+
+				molID, destPath = downloads.pop(future)
+				error = future.exception()
+
+				yield (molID, None if error else destPath, error)
+
+		with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+
+			for start in range(0, len(molIDs), maxPending):
+
+				# Start a batch of image exports concurrently:
+
+				exports = {}
+
+				for (molID,), exportID, error in self.sendBulkRequests(startExport, [(m,) for m in molIDs[start:start + maxPending]], maxWorkers):
+
+					if error is None: exports[exportID] = molID
+					else: yield (molID, None, error)
+
+				# Download images as their exports finish:
+
+				downloads = {}
+
+				for exportID, _, error in self.getAsyncExports({e: None for e in exports}, interval, maxPollsPerSecond):
+
+					molID = exports[exportID]
+
+					if error is not None: 
+						
+						yield (molID, None, error)
+						continue
+
+					destPath = os.path.join(destFolder, f"{molID}.{extension}")
+					downloads[executor.submit(self.downloadExport, exportID, destPath)] = (molID, destPath)
+
+					yield from collect(downloads)
+
+				yield from collect(downloads, block=True)
+
+
 	@appendToDocString(helpDoc="get_molecules.txt")
-	def getMolecules(self, asDataFrame=True, **kwargs):
+	def getMolecules(self, asDataFrame=True, select=None, **kwargs):
 		"""
 		:Description: return a list of molecules and their batches, based on optional parameters.
+
+		:select (list of str): optional. Names of the only columns to return (e.g. ["id", "name", "Mol Weight"]): 
+							   molecule fields, molecule keys, or nested keys such as "batches". Structures 
+							   are only downloaded if selected (see getProjection()).
 		
 		:Reference: https://support.collaborativedrug.com/hc/en-us/articles/115005685466-Molecule-s-GET-POST-PUT-
 		"""
@@ -708,13 +3080,36 @@ class VaultClient(object):
 
 		suffix = "/molecules"
 
+		if select is not None:
+
+			fields = self.getFields(asDataFrame=False) if set(select) - {"id"} else None
+			paths, types = self.getProjection("molecule", select, fields, kwargs, valid_kwargs)
+
+			molecules = self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
+
+			return self.selectObjects(molecules, paths, types, asDataFrame, suffix)
+
 		molecules = self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
 
-		if asDataFrame: molecules = pd.DataFrame.from_dict(molecules)
+		if asDataFrame: molecules = self.toDataFrame(molecules, suffix)
 
 		return molecules
 
 
+	@appendToDocString(helpDoc="get_molecules.txt")
+	def iterMolecules(self, chunkSize=None, **kwargs):
+		"""
+		:Description: iterator version of getMolecules(), which streams + parses molecules incrementally
+					  instead of loading the full result into memory. See iterSyncAndAsyncGets().
+
+		:chunkSize (int): if set, molecules are yielded in lists of up to 'chunkSize' molecules.
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_molecules.txt")
+
+		return self.iterSyncAndAsyncGets("/molecules", kwargs, valid_kwargs, chunkSize)
+
+
 	@appendToDocString(helpDoc="get_plates.txt")
 	def getPlates(self, asDataFrame=True, **kwargs):
 		"""
@@ -735,7 +3130,7 @@ class VaultClient(object):
 
 		plates = self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
 
-		if asDataFrame: plates = pd.DataFrame.from_dict(plates)
+		if asDataFrame: plates = self.toDataFrame(plates, suffix)
 
 		return plates
 
@@ -777,7 +3172,7 @@ class VaultClient(object):
 
 		protocols = self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
 
-		if asDataFrame: protocols = pd.DataFrame.from_dict(protocols)
+		if asDataFrame: protocols = self.toDataFrame(protocols, suffix)
 
 		return protocols
 
@@ -809,18 +3204,48 @@ class VaultClient(object):
 			URL = self.URL + suffix + queryString
 
 			exportID = self.sendGetRequest(URL)["id"]
-			data = self.getAsyncExport(exportID, statusUpdates=statusUpdates, asText=True)
+			data = self.getAsyncExport(exportID, statusUpdates=statusUpdates, asText=True, key=suffix)
 
 			return data
 
 
 		data = self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
 
-		if asDataFrame: data = pd.DataFrame.from_dict(data)
+		if asDataFrame: data = self.toDataFrame(data, suffix)
 
 		return data
 
 
+	@appendToDocString(helpDoc="get_protocol_data.txt")
+	def iterProtocolData(self, id, chunkSize=None, **kwargs):
+		"""
+		:Description: iterator version of getProtocolData(), which streams + parses readout data 
+					  incrementally instead of loading the full result into memory. 
+					  See iterSyncAndAsyncGets().
+
+		:chunkSize (int): if set, readout data is yielded in lists of up to 'chunkSize' rows.
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_protocol_data.txt")
+
+		return self.iterSyncAndAsyncGets(f"/protocols/{id}/data", kwargs, valid_kwargs, chunkSize)
+
+
+	@appendToDocString(helpDoc="get_protocol_data.txt")
+	def iterProtocolDataFrames(self, id, chunkSize=10000, **kwargs):
+		"""
+		:Description: streams the readout data for a single protocol as a series of DataFrames of up to
+					  'chunkSize' rows each, with readouts flattened into typed columns. 
+					  See iterProtocolData() + readoutsToDataFrame().
+
+		:return (generator): yields Pandas DataFrames.
+		"""
+
+		for chunk in self.iterProtocolData(id, chunkSize=chunkSize, **kwargs):
+
+			yield readoutsToDataFrame(chunk)
+
+
 	def getProjects(self, asDataFrame=True):
 		"""
 		:Description: returns a list of accessible projects for the given vault.
@@ -832,7 +3257,7 @@ class VaultClient(object):
 		URL = self.URL + suffix
 
 		projects = self.sendGetRequest(URL)
-		if asDataFrame: projects = pd.DataFrame.from_dict(projects)
+		if asDataFrame: projects = self.toDataFrame(projects, suffix)
 
 		return projects
 
@@ -856,11 +3281,41 @@ class VaultClient(object):
 		suffix = f"/readout_rows"
 
 		readoutRows = self.sendSyncAndAsyncGets(suffix, kwargs, valid_kwargs)
-		if asDataFrame: readoutRows = pd.DataFrame(readoutRows)
+		if asDataFrame: readoutRows = self.toDataFrame(readoutRows, suffix)
 
 		return readoutRows
 
 
+	@appendToDocString(helpDoc="get_readout_rows.txt")
+	def iterReadoutRows(self, chunkSize=None, **kwargs):
+		"""
+		:Description: iterator version of getReadoutRows(), which streams + parses readout rows
+					  incrementally instead of loading the full result into memory. 
+					  See iterSyncAndAsyncGets().
+
+		:chunkSize (int): if set, readout rows are yielded in lists of up to 'chunkSize' rows.
+		"""
+
+		valid_kwargs = self.getValidKwargs("get_readout_rows.txt")
+
+		return self.iterSyncAndAsyncGets("/readout_rows", kwargs, valid_kwargs, chunkSize)
+
+
+	@appendToDocString(helpDoc="get_readout_rows.txt")
+	def iterReadoutRowsFrames(self, chunkSize=10000, **kwargs):
+		"""
+		:Description: streams readout rows as a series of DataFrames of up to 'chunkSize' rows each,
+					  with readouts flattened into typed columns. 
+					  See iterReadoutRows() + readoutsToDataFrame().
+
+		:return (generator): yields Pandas DataFrames.
+		"""
+
+		for chunk in self.iterReadoutRows(chunkSize=chunkSize, **kwargs):
+
+			yield readoutsToDataFrame(chunk)
+
+
 	@appendToDocString(helpDoc="get_runs.txt")
 	def getRun(self, runID=None, **kwargs):
 		"""
@@ -932,10 +3387,11 @@ class VaultClient(object):
 		:Reference: https://support.collaborativedrug.com/hc/en-us/articles/115005699026-Saved-Search-es-GET-
 		"""
 		
-		def getData():
+		def getData(filePath=None):
 
 			# Retrieve the saved search data using an async export.
-			# Return as bytes object, regardless of request format.
+			# Return as bytes object, regardless of request format,
+			# or stream the data to 'filePath' if set.
 
 			suffix = f"/searches/{searchID}"
 
@@ -953,20 +3409,11 @@ class VaultClient(object):
 
 			exportID = self.sendGetRequest(URL)["id"]
 
-			data = self.getAsyncExport(exportID, asBytes=True)
+			data = self.getAsyncExport(exportID, asBytes=True, key=suffix, filePath=filePath)
 
 			return data
 
 
-		def writeToFile(data):
-
-			# Writes the bytes for saved search data to file.
-
-			assert filePath is not None, "Must specify a destination path."
-
-			with open(filePath, "wb") as f: f.write(data)
-
-
 		def parseBytes(rawData):
 
 			# Read bytes into a Pandas DataFrame, for xlsx or csv data.
@@ -997,20 +3444,22 @@ class VaultClient(object):
 
 			savedSearches = self.sendGetRequest(URL)
 
-			if asDataFrame: savedSearches = pd.DataFrame(savedSearches)
+			if asDataFrame: savedSearches = self.toDataFrame(savedSearches, suffix)
 
 			return savedSearches
 
 
 		# Perform saved search using the specified ID + retrieve search results:
 
-		rawData = getData()
-
 		if filePath or zip or format == "sdf": 
-			
-			writeToFile(rawData)
+
+			assert filePath is not None, "Must specify a destination path."
+
+			getData(filePath)
 			return
 
+		rawData = getData()
+
 		savedSearches = parseBytes(rawData)
 		
 		return savedSearches
@@ -1048,10 +3497,18 @@ class VaultClient(object):
 
 
 	@staticmethod
-	def getVaults(apiKey, asDataFrame=True):
+	def getVaults(apiKey, asDataFrame=True, session=None, retryPolicy=None):
 		"""
 		:Description: static method for retrieving a list of Vault instances accesssible to the input API key.
 
+					  Failed requests are retried as in VaultClient.sendRequest().
+
+		:session (requests.Session): optional. An existing session (e.g. VaultClient.getSession()) to send
+									 the request through. Defaults to a pooled session shared by the 
+									 process (see getSharedSession()).
+
+		:retryPolicy (RetryPolicy): optional. Defaults to RetryPolicy().
+
 		:return (json object or Pandas DataFrame): 
 		"""
 
@@ -1059,7 +3516,28 @@ class VaultClient(object):
 
 		headers = {"X-CDD-TOKEN": apiKey}
 
-		response = requests.get(URL, headers=headers)
+		if session is None: session = getSharedSession()
+		if retryPolicy is None: retryPolicy = RetryPolicy()
+
+		attempt = 0
+
+		while True:
+
+			attempt += 1
+
+			try: 
+				response = session.get(URL, headers=headers)
+
+			except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+
+				if not retryPolicy.isRetryable("GET", attempt): raise
+
+				time.sleep(retryPolicy.getDelay(attempt))
+				continue
+
+			if response.ok or not retryPolicy.isRetryable("GET", attempt, response): break
+
+			time.sleep(retryPolicy.getDelay(attempt, response))
 
 		response.raise_for_status()
 				
@@ -1084,11 +3562,7 @@ class VaultClient(object):
 			jsonObj = json.load(open(jsonObj, "r"))
 
 		
-		headers = {"X-CDD-Token": self.apiKey}
-
-		response = requests.post(URL, headers=headers, json=jsonObj)
-
-		response.raise_for_status()
+		response = self.sendRequest("POST", URL, json=jsonObj)
 		
 		return response.json()
 
@@ -1164,10 +3638,12 @@ class VaultClient(object):
 		return response
 
 
-	def postFiles(self, objectType, objectID, fileName):
+	def postFiles(self, objectType, objectID, fileName, progress=None):
 		"""
 		:Description: attach a file to an object (Run, Molecule, Protocol or ELN entry).
 
+					  The file is streamed from disk as it is uploaded. See MultipartEncoder.
+
 		:objectType (str): specifies the CDD object type to which the file will be attached.
 						   Value must be one of: 'molecule', 'protocol', 'run', or 'eln_entry'.
 
@@ -1175,6 +3651,9 @@ class VaultClient(object):
 
 		:fileName (str): path to a valid file for upload to CDD.
 
+		:progress (callable): optional. Called as progress(bytesSent, totalBytes, bytesPerSecond)
+							  as the upload proceeds.
+
 		:Reference: https://support.collaborativedrug.com/hc/en-us/articles/115005739786-Files-GET-POST-DELETE-
 		"""
 
@@ -1196,15 +3675,13 @@ class VaultClient(object):
 		# Post file to CDD Vault + get response:
 		# Does not use standard sendPostRequest() method, since request uses form-multipart.
 
-		headers = {"X-CDD-Token": self.apiKey}
+		fields = [("file", (os.path.basename(fileName), fileName)),
+				  ("resource_class", objectType),
+				  ("resource_id", objectID)]
 
-		files = {"file": (os.path.basename(fileName), open(fileName, "rb")),
-				 "resource_class": (None, objectType),
-				 "resource_id": (None, objectID)}
+		with MultipartEncoder(fields, progress) as body:
 
-		response = requests.post(URL, headers=headers, files=files)
-		
-		response.raise_for_status()
+			response = self.sendRequest("POST", URL, headers={"Content-Type": body.contentType}, data=body)
 
 		return response.json()
 	
@@ -1258,7 +3735,7 @@ class VaultClient(object):
 		return response
 	
 
-	def postSlurpsData(self, fileName, project, mappingTemplate=None, runs=None, autoreject=None, ambiguous_events_resolution=None, suspicious_events_resolution=None, interval=5.0):
+	def postSlurpsData(self, fileName, project, mappingTemplate=None, runs=None, autoreject=None, ambiguous_events_resolution=None, suspicious_events_resolution=None, interval=None, progress=None):
 		"""
 		:Description: bulk import for programmatically importing data into CDD Vault. Uses an existing mapping template to map the data in the
 					  import file into CDD Vault. Once a file has been uploaded through the API, data from the import is committed immediately 
@@ -1301,17 +3778,70 @@ class VaultClient(object):
 							: "reject" : Automatically reject all suspicious events.
 							: "accept" : Automatically accept all suspicious events.
 
+		:interval (float or polling strategy): the wait between status checks of the import. Defaults to the 
+											   client's polling strategy (see setPollingStrategy()).
+
+		:progress (callable): optional. Called as progress(bytesSent, totalBytes, bytesPerSecond) as the 
+							  file is uploaded. The file is streamed from disk, see MultipartEncoder.
 
 		Reference: https://support.collaborativedrug.com/hc/en-us/articles/115005685526-Slurps-Post-i-e-Bulk-Import-of-Data-via-Files
 		"""
 
-		# Read-in file prm for import:
-		
-		files = {
-				"file": (os.path.basename(fileName), open(fileName, "rb"))
-				}
+		jsonObj = self.buildSlurpsJSON(project, mappingTemplate, runs, autoreject, 
+									   ambiguous_events_resolution, suspicious_events_resolution)
+
+
+		# Send request to initiate bulk upload:
+
+		suffix = "/slurps"
+
+		response = self.submitSlurp(fileName, jsonObj, progress)
+
+
+		# Check status of bulk upload until completed:
+
+		slurpID = response["id"]
+		state = response["state"]
+
+		URL = self.URL + f"/slurps/{slurpID}"
+
+		strategy = self.getPollingStrategy(interval)
+		start = time.monotonic()
+		pollNumber = 0
+
+		while state not in ["committed", "canceled", "rejected", "invalid"]:
+
+			time.sleep(strategy.getDelay(pollNumber + 1, time.monotonic() - start, suffix))
 
-		# Read-in json prm for import:
+			exportResponse = self.sendGetRequest(URL)
+			pollNumber += 1
+			self.recordPoll(suffix)
+
+			state = exportResponse["state"]
+
+		strategy.record(suffix, time.monotonic() - start)
+
+		self.recordMetrics("slurp", suffix, timings={"slurp_wait": time.monotonic() - start})
+			
+		assert state == "committed", exportResponse
+
+
+		# Get protocol + run information for successful imports using slurps ID:
+
+		URL = self.URL + f"/protocols?slurp={slurpID}"
+
+		outputResponse = self.sendGetRequest(URL)
+
+		return outputResponse
+
+
+	def buildSlurpsJSON(self, project, mappingTemplate=None, runs=None, autoreject=None, 
+						ambiguous_events_resolution=None, suspicious_events_resolution=None):
+		"""
+		:Description: builds the 'json' form parameter of a slurps import. See postSlurpsData().
+
+		:return (str):
+		"""
 
 		jsonObj = {"project": project}
 
@@ -1332,47 +3862,154 @@ class VaultClient(object):
 		if suspicious_events_resolution:
 			jsonObj["suspicious_events_resolution"] = suspicious_events_resolution
 			
-		jsonObj = json.dumps(jsonObj)
+		return json.dumps(jsonObj)
 
 
-		# Send request to initiate bulk upload:
+	def submitSlurp(self, fileName, jsonObj, progress=None):
+		"""
+		:Description: uploads a single file to start a slurps import, without waiting for it to finish.
+					  The file is streamed from disk as it is uploaded. See MultipartEncoder.
+
+		:jsonObj (str): the import's 'json' form parameter. See buildSlurpsJSON().
+
+		:progress (callable): optional. Called as progress(bytesSent, totalBytes, bytesPerSecond)
+							  as the upload proceeds.
+
+		:return (dict): the new slurp's ID + state.
+		"""
+
+		URL = self.URL + "/slurps"
+
+		fields = [("json", jsonObj), 
+				  ("file", (os.path.basename(fileName), fileName))]
+
+		with MultipartEncoder(fields, progress) as body:
+
+			response = self.sendRequest("POST", URL, headers={"Content-Type": body.contentType}, data=body)
+
+		return response.json()
+
+
+	def postSlurpsDataChunked(self, fileName, project, rowsPerChunk=5000, maxWorkers=4, chunkFolder=None, 
+							  interval=None, maxPollErrors=5, **kwargs):
+		"""
+		:Description: imports a large csv / tsv / txt or sdf file as a series of smaller slurps imports, so
+					  that each import finishes within the API's time limits and a bad row only causes
+					  its own chunk to be rejected. See splitImportFile() + postSlurpsData().
+
+					  Chunks are uploaded concurrently by up to 'maxWorkers' threads, then all of their 
+					  imports are polled together until they have finished.
+
+					  Files for chunks which were not committed are kept in 'chunkFolder' for targeted 
+					  retries with postSlurpsData(). Runs created by committed chunks can be rolled 
+					  back using deleteRuns(slurpID, slurps=True).
+
+		:rowsPerChunk (int): the maximum # of rows (or SD records) per import.
+
+		:maxWorkers (int): the maximum # of concurrent uploads.
+
+		:chunkFolder (str): optional. The folder chunk files are written to. Defaults to a new temporary
+							folder, which is removed if every chunk is committed.
+
+		:interval (float or polling strategy): the wait between status checks. Defaults to the 
+											   client's polling strategy (see setPollingStrategy()).
+
+		:maxPollErrors (int): the # of consecutive failed status checks after which a chunk is 
+							  reported as "failed".
+
+		:kwargs: any other postSlurpsData() arguments ('mappingTemplate', 'runs', 'autoreject', etc.).
+
+		:return (dict): chunk reports, keyed by final state ("committed", "rejected", "invalid", 
+						"canceled", or "failed" for chunks which could not be uploaded or polled). Each report
+						holds the chunk's 'file', 'firstRow', 'rows', 'slurp' ID + final 'response' 
+						(or 'error').
+		"""
+
+		jsonObj = self.buildSlurpsJSON(project, **kwargs)
+
+		temporary = chunkFolder is None
+		if temporary: chunkFolder = tempfile.mkdtemp(prefix="cdd_slurps_")
+
+		os.makedirs(chunkFolder, exist_ok=True)
+
+		chunks = [{"file": path, "firstRow": firstRow, "rows": rows}
+				  for path, firstRow, rows in splitImportFile(fileName, rowsPerChunk, chunkFolder)]
+
+		report = {state: [] for state in ["committed", "rejected", "invalid", "canceled", "failed"]}
+
+
+		# Upload chunks concurrently:
+
+		def upload(chunk):
+
+			chunk["slurp"] = self.submitSlurp(chunk["file"], jsonObj)["id"]
+
+			return chunk
+
+		pending = []
+
+		for (chunk,), response, error in self.sendBulkRequests(upload, [(chunk,) for chunk in chunks], maxWorkers):
+
+			if error is None: pending.append(chunk)
+
+			else:
+				chunk["error"] = error
+				report["failed"].append(chunk)
+
+
+		# Poll all imports until completed:
 
 		suffix = "/slurps"
-		URL = self.URL + suffix
 
-		headers = {"X-CDD-Token": self.apiKey}
+		strategy = self.getPollingStrategy(interval)
+		start = time.monotonic()
+		pollNumber = 0
 
-		response = requests.post(URL, headers=headers, files=files, data={"json": jsonObj})
+		while pending:
 
-		response.raise_for_status()
+			time.sleep(strategy.getDelay(pollNumber + 1, time.monotonic() - start, suffix))
+			pollNumber += 1
 
+			for chunk in list(pending):
 
-		# Check status of bulk upload until completed:
+				try: response = self.sendGetRequest(self.URL + f"/slurps/{chunk['slurp']}")
 
-		slurpID = response.json()["id"]
-		state = response.json()["state"]
+				except requests.exceptions.RequestException as e: 
 
-		URL = self.URL + f"/slurps/{slurpID}"
+					# Retried on the next poll, until too many checks in a row have failed:
 
-		while state not in ["committed", "canceled", "rejected", "invalid"]:
+					chunk["pollErrors"] = chunk.get("pollErrors", 0) + 1
 
-			time.sleep(interval)
+					if chunk["pollErrors"] >= maxPollErrors:
 
-			exportResponse = requests.get(URL, headers=headers).json()
-			state = exportResponse["state"]
-			
-		assert state == "committed", exportResponse
+						chunk["error"] = e
+						report["failed"].append(chunk)
+						pending.remove(chunk)
 
+					continue
 
-		# Get protocol + run information for successful imports using slurps ID:
+				chunk["pollErrors"] = 0
 
-		URL = self.URL + f"/protocols?slurp={slurpID}"
+				self.recordPoll(suffix)
 
-		outputResponse = requests.get(URL, headers=headers)
-		
-		outputResponse.raise_for_status()
+				if response["state"] not in report: continue
+
+				chunk["response"] = response
+				report[response["state"]].append(chunk)
+				pending.remove(chunk)
 
-		return outputResponse.json()
+		strategy.record(suffix, time.monotonic() - start)
+
+		self.recordMetrics("slurp", suffix, timings={"slurp_wait": time.monotonic() - start})
+
+
+		# Remove the files of committed chunks:
+
+		for chunk in report["committed"]: os.remove(chunk["file"])
+
+		if temporary and not os.listdir(chunkFolder): shutil.rmtree(chunkFolder)
+
+		return report
 
 
 	def sendPutRequest(self, URL, jsonObj):
@@ -1389,11 +4026,7 @@ class VaultClient(object):
 			jsonObj = json.load(open(jsonObj, "r"))
 
 		
-		headers = {"X-CDD-Token": self.apiKey}
-
-		response = requests.put(URL, headers=headers, json=jsonObj)
-
-		response.raise_for_status()
+		response = self.sendRequest("PUT", URL, json=jsonObj)
 		
 		return response.json()
 
@@ -1608,10 +4241,7 @@ class VaultClient(object):
 
 	def sendDeleteRequest(self, URL):
 
-		headers = {"X-CDD-Token": self.apiKey}
-		response = requests.delete(URL, headers=headers)
-
-		response.raise_for_status()
+		response = self.sendRequest("DELETE", URL)
 		
 		return response.json()
 
@@ -1796,3 +4426,147 @@ class VaultClient(object):
 		
 		return response
 
+
+
+	def sendBulkRequests(self, method, items, maxWorkers=10):
+		"""
+		:Description: general method for running a single-object API method (e.g. putMolecules)
+					  once per item over a bounded pool of worker threads.
+
+					  Results are yielded as each request completes (not in input order), and
+					  errors are returned per item rather than raised, so that one failed request
+					  does not abort the remaining items.
+
+					  Note that the session's 'poolMaxSize' (see setSession()) should be at least
+					  'maxWorkers', or extra connections will be opened + discarded.
+
+		:method (callable): the VaultClient method to call for each item.
+
+		:items (iterable): an iterable of argument tuples for 'method'. Consumed lazily, so that
+						   at most 2 x 'maxWorkers' items are held in memory at once.
+
+		:maxWorkers (int): the maximum # of requests sent concurrently.
+
+		:return (generator): yields (item, response, error) tuples, where 'error' is None if
+							 the request succeeded and 'response' is None if it failed.
+		"""
+
+		items = iter(items)
+
+		with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+
+			pending = {}
+
+			while True:
+
+				# Top up the queue of in-flight requests:
+
+				for item in items:
+
+					pending[executor.submit(method, *item)] = item
+					if len(pending) >= 2 * maxWorkers: break
+
+				if not pending: break
+
+				done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+				for future in done:
+
+					item = pending.pop(future)
+
+					try: yield (item, future.result(), None)
+
+					except Exception as e: yield (item, None, e)
+
+
+	def postBatchesBulk(self, data, maxWorkers=10):
+		"""
+		:Description: creates many new batches concurrently. See postBatches() + sendBulkRequests().
+
+		:data (iterable): json objects or json file paths, one per batch.
+
+		:return (generator): yields (data, response, error) tuples as each request completes.
+		"""
+
+		for item, response, error in self.sendBulkRequests(self.postBatches, ((d,) for d in data), maxWorkers):
+
+			yield (item[0], response, error)
+
+
+	def postInventorySamplesBulk(self, data, maxWorkers=10):
+		"""
+		:Description: creates many new inventory samples concurrently. See postInventorySamples() + sendBulkRequests().
+
+		:data (iterable): json objects or json file paths, one per sample.
+
+		:return (generator): yields (data, response, error) tuples as each request completes.
+		"""
+
+		for item, response, error in self.sendBulkRequests(self.postInventorySamples, ((d,) for d in data), maxWorkers):
+
+			yield (item[0], response, error)
+
+
+	def postMoleculesBulk(self, data, maxWorkers=10):
+		"""
+		:Description: registers many new molecules concurrently. See postMolecules() + sendBulkRequests().
+
+		:data (iterable): json objects or json file paths, one per molecule.
+
+		:return (generator): yields (data, response, error) tuples as each request completes.
+		"""
+
+		for item, response, error in self.sendBulkRequests(self.postMolecules, ((d,) for d in data), maxWorkers):
+
+			yield (item[0], response, error)
+
+
+	def putBatchesBulk(self, items, maxWorkers=10):
+		"""
+		:Description: updates many existing batches concurrently. See putBatches() + sendBulkRequests().
+
+		:items (iterable): (id, data) pairs, one per batch.
+
+		:return (generator): yields ((id, data), response, error) tuples as each request completes.
+		"""
+
+		return self.sendBulkRequests(self.putBatches, items, maxWorkers)
+
+
+	def putMoleculesBulk(self, items, maxWorkers=10):
+		"""
+		:Description: updates many existing molecules concurrently. See putMolecules() + sendBulkRequests().
+
+		:items (iterable): (id, data) pairs, one per molecule.
+
+		:return (generator): yields ((id, data), response, error) tuples as each request completes.
+		"""
+
+		return self.sendBulkRequests(self.putMolecules, items, maxWorkers)
+
+
+	def putReadoutRowsBulk(self, items, maxWorkers=10):
+		"""
+		:Description: updates (or flags as outliers) many existing readout rows concurrently. 
+					  See putReadoutRows() + sendBulkRequests().
+
+		:items (iterable): (id, data) pairs, one per readout row.
+
+		:return (generator): yields ((id, data), response, error) tuples as each request completes.
+		"""
+
+		return self.sendBulkRequests(self.putReadoutRows, items, maxWorkers)
+
+
+	def deleteReadoutRowsBulk(self, ids, maxWorkers=10):
+		"""
+		:Description: deletes many readout rows concurrently. See deleteReadoutRows() + sendBulkRequests().
+
+		:ids (iterable): unique readout row IDs.
+
+		:return (generator): yields (id, response, error) tuples as each request completes.
+		"""
+
+		for item, response, error in self.sendBulkRequests(self.deleteReadoutRows, ((i,) for i in ids), maxWorkers):
+
+			yield (item[0], response, error)
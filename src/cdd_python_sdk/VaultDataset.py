@@ -0,0 +1,414 @@
+'''
+______________________________________________________________________________________________________________________________________________
+Copyright © 2022 Workflow Informatics - Distribution of this software without written permission of Workflow Informatics is prohibited.
+
+This SOFTWARE PRODUCT is provided by Workflow Informatics "as is" and "with all faults."
+
+Workflow Informatics makes no representations or warranties of any kind concerning the safety, suitability, inaccuracies, typographical errors, or other harmful components of this SOFTWARE PRODUCT.
+
+You are solely responsible for determining whether this SOFTWARE PRODUCT is compatible with your equipment and other software installed on your equipment.
+
+You are solely responsible for the protection of your equipment and backup of your data.
+
+Workflow Informatics will not be liable for any damages you may suffer in connection with using or modifying this SOFTWARE PRODUCT
+______________________________________________________________________________________________________________________________________________
+
+Local, columnar copies of CDD Vault data, written as partitioned Parquet datasets through Arrow.
+
+Analysts can then scan the data locally (with column projection + predicate pushdown), instead of
+each of them fetching it from the API + rebuilding DataFrames from json.
+
+Requires pyarrow, which is an optional dependency: pip install cdd_python_sdk[parquet]
+
+'''
+
+
+import json
+import os
+import shutil
+import uuid
+
+from .VaultClient import LazyModule, readoutsToDataFrame
+
+pd = LazyModule("pandas")
+
+
+def importArrow():
+	"""
+	:Description: imports pyarrow on first use, so that it is only required by VaultDataset.
+
+	:return (tuple): the pyarrow, pyarrow.dataset + pyarrow.parquet modules.
+	"""
+
+	try:
+		import pyarrow
+		import pyarrow.dataset
+		import pyarrow.parquet
+
+	except ImportError:
+		raise ImportError("VaultDataset requires pyarrow. Install it using: pip install cdd_python_sdk[parquet]")
+
+	return pyarrow, pyarrow.dataset, pyarrow.parquet
+
+
+def getIDs(frame, column):
+	"""
+	:Description: returns the IDs of the objects linked to by 'column' of a flattened DataFrame, which
+				  CDD Vault returns either as IDs ('column') or as objects ('column'.id).
+	"""
+
+	if f"{column}.id" in frame.columns: return frame[f"{column}.id"]
+
+	return frame[column]
+
+
+class VaultDataset(object):
+	"""
+	:Description: writes molecules, batches + protocol readout data from a CDD Vault to Parquet datasets,
+				  one per entity, in sub-directories of 'root'.
+
+				  Column types are fixed by the vault's field + readout definitions (see getFields() +
+				  getProtocols()), rather than inferred from each chunk of data, so that every file in
+				  a dataset shares the same schema. The combined schema of each dataset is stored in
+				  its "_common_metadata" file.
+
+				  Readout data is partitioned by protocol ID + run date 
+				  (i.e. "<root>/protocol_data/protocol=<ID>/run_date=<date>/...").
+
+	:vault (VaultClient): the client used to fetch data from CDD Vault.
+
+	:root (str): the directory under which datasets are written. Created if it does not exist.
+	"""
+
+	# CDD Vault field / readout data types with a non-string Arrow type:
+
+	fieldTypes = {
+				  "Number": "float64",
+				  "Integer": "int64",
+				  "Boolean": "bool_",
+				  "Date": "date32"
+				  }
+
+
+	def __init__(self, vault, root):
+
+		self.vault = vault
+		self.root = root
+
+		os.makedirs(root, exist_ok=True)
+
+
+	def getPath(self, entity):
+
+		return os.path.join(self.root, entity)
+
+
+	def getFieldTypes(self, fields, prefix=""):
+		"""
+		:Description: maps field definitions (with "name" + "type" / "data_type" keys) to the Arrow
+					  types of their columns, e.g. {"molecule_fields.MW": pyarrow.float64()}.
+		"""
+
+		pa, _, _ = importArrow()
+
+		types = {}
+
+		for field in fields:
+
+			dataType = field.get("type", field.get("data_type"))
+			types[f"{prefix}{field['name']}"] = getattr(pa, self.fieldTypes.get(dataType, "string"))()
+
+		return types
+
+
+	def toTable(self, frame, types, schema=None):
+		"""
+		:Description: converts a DataFrame to an Arrow table, giving each column in 'types' its 
+					  declared type + adding any missing ones as empty columns. Nested lists / 
+					  dictionaries are stored as json strings.
+
+		:schema (pyarrow.Schema): optional. The schema of previously written chunks, which 
+								  columns of undeclared type are cast to where possible.
+
+		:return (pyarrow.Table):
+		"""
+
+		pa, _, _ = importArrow()
+
+		for column in frame.columns:
+
+			if frame[column].dtype == object and frame[column].map(lambda v: isinstance(v, (list, dict))).any():
+
+				frame[column] = frame[column].map(lambda v: v if v is None or pd.isna(v) else json.dumps(v))
+
+		# Convert columns of declared type:
+
+		for column, dataType in types.items():
+
+			if column not in frame.columns: frame[column] = None
+
+			if pa.types.is_floating(dataType) or pa.types.is_integer(dataType): 
+				
+				frame[column] = pd.to_numeric(frame[column], errors="coerce").astype("Float64")
+
+			elif pa.types.is_date(dataType): 
+				
+				frame[column] = pd.to_datetime(frame[column], errors="coerce").dt.date
+
+			elif pa.types.is_boolean(dataType): frame[column] = frame[column].astype("boolean")
+
+			else: frame[column] = frame[column].astype("string")
+
+		table = pa.Table.from_pandas(frame, preserve_index=False)
+
+		for i, field in enumerate(table.schema):
+
+			if field.name in types: newType = types[field.name]
+			elif schema is not None and field.name in schema.names: newType = schema.field(field.name).type
+			elif pa.types.is_null(field.type): newType = pa.string()
+			else: continue
+
+			if field.type == newType: continue
+
+			try: table = table.set_column(i, field.name, table.column(i).cast(newType, safe=False))
+
+			except (pa.ArrowInvalid, pa.ArrowNotImplementedError): continue
+
+		return table.replace_schema_metadata(None)
+
+
+	def write(self, entity, chunks, partitionBy=None):
+		"""
+		:Description: writes a stream of Arrow tables to the dataset for 'entity'. 
+
+					  Unpartitioned datasets are replaced in full. In partitioned datasets, only
+					  the partitions for the values of the first 'partitionBy' column written here
+					  (e.g. the protocols exported) are replaced.
+
+		:chunks (iterable): Arrow tables to write.
+
+		:partitionBy (list): optional. Columns to partition the dataset by, in order.
+
+		:return (int): the # of rows written.
+		"""
+
+		pa, _, pq = importArrow()
+
+		path = self.getPath(entity)
+		metadataPath = os.path.join(path, "_common_metadata")
+
+		if not partitionBy and os.path.exists(path): shutil.rmtree(path)
+
+		os.makedirs(path, exist_ok=True)
+
+		schema = pq.read_schema(metadataPath) if os.path.exists(metadataPath) else None
+
+		replaced = set()
+		count = 0
+
+		for table in chunks:
+
+			if table.num_rows == 0: continue
+
+			# Remove stale partitions the first time they are written to:
+
+			if partitionBy:
+
+				for value in table.column(partitionBy[0]).unique().to_pylist():
+
+					if value in replaced: continue
+
+					shutil.rmtree(os.path.join(path, f"{partitionBy[0]}={value}"), ignore_errors=True)
+					replaced.add(value)
+
+			pq.write_to_dataset(table, path, partition_cols=partitionBy, 
+								basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+								existing_data_behavior="overwrite_or_ignore")
+
+			schema = table.schema if schema is None else pa.unify_schemas([schema, table.schema])
+			count += table.num_rows
+
+		if schema is not None: pq.write_metadata(schema.remove_metadata(), metadataPath)
+
+		return count
+
+
+	def writeMolecules(self, chunkSize=10000, **kwargs):
+		"""
+		:Description: writes molecules matching 'kwargs' (see VaultClient.getMolecules()) to the "molecules" 
+					  dataset, replacing its contents. Molecule fields become "molecule_fields.<name>" columns.
+
+		:return (int): the # of molecules written.
+		"""
+
+		fields = self.vault.getFields(asDataFrame=False)
+		types = self.getFieldTypes(fields.get("molecule", []), "molecule_fields.")
+
+		def iterTables():
+
+			schema = None
+
+			for chunk in self.vault.iterMolecules(chunkSize=chunkSize, **kwargs):
+
+				table = self.toTable(pd.json_normalize(chunk, max_level=1), types, schema)
+				schema = table.schema
+
+				yield table
+
+		return self.write("molecules", iterTables())
+
+
+	def writeBatches(self, chunkSize=10000, **kwargs):
+		"""
+		:Description: writes batches matching 'kwargs' (see VaultClient.getBatches()) to the "batches" 
+					  dataset, replacing its contents. Batch fields become "batch_fields.<name>" columns.
+
+		:return (int): the # of batches written.
+		"""
+
+		fields = self.vault.getFields(asDataFrame=False)
+		types = self.getFieldTypes(fields.get("batch", []), "batch_fields.")
+
+		def iterTables():
+
+			schema = None
+
+			for chunk in self.vault.iterBatches(chunkSize=chunkSize, **kwargs):
+
+				table = self.toTable(pd.json_normalize(chunk, max_level=1), types, schema)
+				schema = table.schema
+
+				yield table
+
+		return self.write("batches", iterTables())
+
+
+	def writeReadouts(self, chunks, protocolID=None):
+		"""
+		:Description: writes chunks of protocol data / readout row objects to the "protocol_data" 
+					  dataset, partitioned by protocol ID + run date. Readouts become one column per
+					  readout definition ID (see readoutsToDataFrame()), typed by their definitions.
+
+		:protocolID (int): the protocol of every row, for protocol data (which does not include it).
+
+		:return (int): the # of rows written.
+		"""
+
+		pa, _, _ = importArrow()
+
+		protocols = {}
+
+		def getProtocol(id):
+
+			# Fetch the runs + readout definitions of each protocol once:
+
+			if id not in protocols:
+
+				protocols[id] = {"runDates": {}, "types": {}}
+
+				for protocol in self.vault.getProtocols(asDataFrame=False, protocols=str(id)):
+
+					protocols[id]["runDates"] = {run["id"]: run.get("run_date") for run in protocol.get("runs", [])}
+
+					definitions = [{**d, "name": str(d["id"])} for d in protocol.get("readout_definitions", [])]
+					protocols[id]["types"] = self.getFieldTypes(definitions)
+
+			return protocols[id]
+
+
+		def iterTables():
+
+			schema = None
+
+			for chunk in chunks:
+
+				frame = readoutsToDataFrame(chunk)
+
+				frame["protocol"] = int(protocolID) if protocolID is not None else getIDs(frame, "protocol")
+				frame["run"] = getIDs(frame, "run")
+
+				for id in frame["protocol"].unique():
+
+					protocol = getProtocol(id)
+
+					rows = frame[frame["protocol"] == id].dropna(axis=1, how="all").copy()
+					rows["run_date"] = rows["run"].map(protocol["runDates"])
+
+					table = self.toTable(rows, {**protocol["types"], "run_date": pa.string()}, schema)
+					schema = table.schema
+
+					yield table
+
+
+		return self.write("protocol_data", iterTables(), partitionBy=["protocol", "run_date"])
+
+
+	def writeProtocolData(self, id, chunkSize=10000, **kwargs):
+		"""
+		:Description: writes the readout data for a single protocol (see VaultClient.getProtocolData()) to
+					  the "protocol_data" dataset, replacing the protocol's partition. See writeReadouts().
+
+		:return (int): the # of rows written.
+		"""
+
+		chunks = self.vault.iterProtocolData(id, chunkSize=chunkSize, **kwargs)
+
+		return self.writeReadouts(chunks, protocolID=id)
+
+
+	def writeReadoutRows(self, chunkSize=10000, **kwargs):
+		"""
+		:Description: writes readout rows matching 'kwargs' (see VaultClient.getReadoutRows()) to the 
+					  "protocol_data" dataset, replacing the partitions of the protocols written.
+					  See writeReadouts().
+
+		:return (int): the # of rows written.
+		"""
+
+		chunks = self.vault.iterReadoutRows(chunkSize=chunkSize, **kwargs)
+
+		return self.writeReadouts(chunks)
+
+
+	def getDataset(self, entity):
+		"""
+		:Description: opens a dataset written by this class for scanning with pyarrow.
+
+		:entity (str): "molecules", "batches" or "protocol_data".
+
+		:return (pyarrow.dataset.Dataset):
+		"""
+
+		_, ds, pq = importArrow()
+
+		path = self.getPath(entity)
+		schema = pq.read_schema(os.path.join(path, "_common_metadata"))
+
+		return ds.dataset(path, schema=schema, format="parquet", partitioning="hive", 
+						  exclude_invalid_files=True, ignore_prefixes=["_", "."])
+
+
+	def read(self, entity, columns=None, filters=None, asDataFrame=True):
+		"""
+		:Description: reads (a subset of) a dataset written by this class. Only the requested columns 
+					  + the files / row groups which may match 'filters' are read from disk.
+
+		:entity (str): "molecules", "batches" or "protocol_data".
+
+		:columns (list): optional. Names of the columns to read. Defaults to all columns.
+
+		:filters: optional. A pyarrow.compute expression, e.g. pyarrow.compute.field("protocol") == 123,
+				  or a list of (column, operator, value) tuples, e.g. [("run_date", ">=", "2023-01-01")].
+
+		:return (DataFrame or pyarrow.Table):
+		"""
+
+		_, _, pq = importArrow()
+
+		if isinstance(filters, list): filters = pq.filters_to_expression(filters)
+
+		table = self.getDataset(entity).to_table(columns=columns, filter=filters)
+
+		if asDataFrame: table = table.to_pandas()
+
+		return table
@@ -0,0 +1,272 @@
+'''
+______________________________________________________________________________________________________________________________________________
+Copyright © 2022 Workflow Informatics - Distribution of this software without written permission of Workflow Informatics is prohibited.
+
+This SOFTWARE PRODUCT is provided by Workflow Informatics "as is" and "with all faults."
+
+Workflow Informatics makes no representations or warranties of any kind concerning the safety, suitability, inaccuracies, typographical errors, or other harmful components of this SOFTWARE PRODUCT.
+
+You are solely responsible for determining whether this SOFTWARE PRODUCT is compatible with your equipment and other software installed on your equipment.
+
+You are solely responsible for the protection of your equipment and backup of your data.
+
+Workflow Informatics will not be liable for any damages you may suffer in connection with using or modifying this SOFTWARE PRODUCT
+______________________________________________________________________________________________________________________________________________
+
+Incremental, local mirror of the molecules, batches + protocol readout rows in a CDD Vault.
+
+Each sync only fetches the objects modified since the previous sync of the same query,
+using the 'modified_after' parameter of the corresponding GET endpoint, and merges them
+into a sqlite database keyed by object ID.
+
+'''
+
+
+import datetime as dt
+
+import json
+import sqlite3
+
+from .VaultClient import LazyModule
+
+pd = LazyModule("pandas")
+
+# The maximum # of variables in a single sqlite query (SQLITE_MAX_VARIABLE_NUMBER) on older sqlite builds:
+
+maxVariables = 999
+
+
+class VaultMirror(object):
+	"""
+	:Description: keeps a sqlite database at 'path' in sync with a CDD Vault, one table per 
+				  entity ("molecules", "batches", "readout_rows"). 
+
+				  The high-water mark of each query (the latest 'modified_at' timestamp synced) is 
+				  stored alongside the data, so that later syncs, including from other processes, 
+				  only fetch + merge the objects modified since.
+
+				  Deleted objects are not detected by incremental syncs; use resetWatermark() to
+				  fetch all objects matching a query again.
+
+	:vault (VaultClient): the client used to fetch objects from CDD Vault.
+
+	:path (str): path to the sqlite database file. Created if it does not exist.
+	"""
+
+	# entity: (endpoint, help doc, whether 'modified_after' only accepts dates)
+
+	entities = {
+				"molecules": ("/molecules", "get_molecules.txt", False),
+				"batches": ("/batches", "get_batches.txt", False),
+				"readout_rows": ("/readout_rows", "get_readout_rows.txt", True)
+				}
+
+
+	def __init__(self, vault, path):
+
+		self.vault = vault
+		self.path = path
+
+		self.connection = sqlite3.connect(path)
+
+		with self.connection:
+
+			for entity in self.entities:
+
+				self.connection.execute(f"""CREATE TABLE IF NOT EXISTS {entity} 
+											(id INTEGER PRIMARY KEY, modified_at TEXT, data TEXT)""")
+
+			self.connection.execute("""CREATE TABLE IF NOT EXISTS watermarks 
+									   (query TEXT PRIMARY KEY, watermark TEXT, synced_at TEXT)""")
+
+
+	def __enter__(self):
+
+		return self
+
+
+	def __exit__(self, *args):
+
+		self.close()
+
+
+	def close(self):
+
+		self.connection.close()
+
+
+	def getQueryKey(self, entity, kwargs):
+		"""
+		:Description: returns the key under which the watermark for syncing 'entity' with 
+					  'kwargs' is stored, e.g. "/readout_rows?protocols=123".
+		"""
+
+		suffix, helpDoc, _ = self.entities[entity]
+
+		kwargs = {k: kwargs[k] for k in sorted(kwargs)}
+
+		return suffix + self.vault.buildQueryString(kwargs, self.vault.getValidKwargs(helpDoc))
+
+
+	def getWatermark(self, entity, **kwargs):
+		"""
+		:return (datetime or None): the latest 'modified_at' timestamp synced for 'entity' with 
+									'kwargs', or None if the query has not been synced yet.
+		"""
+
+		row = self.connection.execute("SELECT watermark FROM watermarks WHERE query = ?", 
+									  (self.getQueryKey(entity, kwargs),)).fetchone()
+
+		if row is None: return None
+
+		return dt.datetime.fromisoformat(row[0])
+
+
+	def resetWatermark(self, entity, **kwargs):
+		"""
+		:Description: forgets the watermark for 'entity' with 'kwargs', so that the next sync
+					  fetches all matching objects.
+		"""
+
+		with self.connection:
+
+			self.connection.execute("DELETE FROM watermarks WHERE query = ?", (self.getQueryKey(entity, kwargs),))
+
+
+	def sync(self, entity, chunkSize=10000, **kwargs):
+		"""
+		:Description: fetches the objects of 'entity' matching 'kwargs' which were modified since
+					  the last sync of the same query (or all of them, on the first sync), and
+					  merges them into the local table, replacing older copies of each object.
+
+					  Objects are streamed + written in chunks of 'chunkSize' objects (see 
+					  VaultClient.iterSyncAndAsyncGets()), so the first, full sync of a large vault
+					  is not held in memory at once.
+
+					  The watermark is only advanced once every object has been merged, so an
+					  interrupted sync is simply repeated by the next one.
+
+		:entity (str): "molecules", "batches" or "readout_rows".
+
+		:kwargs: any valid keyword arguments for the entity's GET endpoint, except for 'modified_after'.
+
+		:return (int): the # of objects merged.
+		"""
+
+		assert entity in self.entities, f"'entity' must be one of: {', '.join(self.entities)}."
+		assert "modified_after" not in kwargs, "'modified_after' is set from the stored watermark."
+
+		suffix, helpDoc, datesOnly = self.entities[entity]
+		valid_kwargs = self.vault.getValidKwargs(helpDoc)
+
+		query = self.getQueryKey(entity, kwargs)
+		watermark = self.getWatermark(entity, **kwargs)
+
+		syncedAt = dt.datetime.now(dt.timezone.utc)
+
+		if watermark is not None and datesOnly: kwargs["modified_after"] = watermark.date().isoformat()
+
+		elif watermark is not None: kwargs["modified_after"] = watermark.astimezone(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+		# Merge modified objects into the local table:
+
+		count = 0
+
+		for chunk in self.vault.iterSyncAndAsyncGets(suffix, kwargs, valid_kwargs, chunkSize):
+
+			rows = []
+
+			for obj in chunk:
+
+				modifiedAt = obj.get("modified_at")
+
+				if modifiedAt:
+
+					modifiedAt = dt.datetime.fromisoformat(modifiedAt.replace("Z", "+00:00"))
+					if modifiedAt.tzinfo is None: modifiedAt = modifiedAt.replace(tzinfo=dt.timezone.utc)
+
+					if watermark is None or modifiedAt > watermark: watermark = modifiedAt
+
+					modifiedAt = modifiedAt.isoformat()
+
+				rows.append((obj["id"], modifiedAt, json.dumps(obj)))
+
+			with self.connection:
+
+				self.connection.executemany(f"INSERT OR REPLACE INTO {entity} VALUES (?, ?, ?)", rows)
+
+			count += len(rows)
+
+		# Advance the watermark:
+
+		if watermark is None: watermark = syncedAt
+
+		with self.connection:
+
+			self.connection.execute("INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)", 
+									(query, watermark.isoformat(), syncedAt.isoformat()))
+
+		return count
+
+
+	def syncMolecules(self, chunkSize=10000, **kwargs):
+		"""
+		:Description: incrementally syncs molecules matching 'kwargs'. See sync().
+		"""
+
+		return self.sync("molecules", chunkSize, **kwargs)
+
+
+	def syncBatches(self, chunkSize=10000, **kwargs):
+		"""
+		:Description: incrementally syncs batches matching 'kwargs'. See sync().
+		"""
+
+		return self.sync("batches", chunkSize, **kwargs)
+
+
+	def syncProtocolData(self, id, chunkSize=10000, **kwargs):
+		"""
+		:Description: incrementally syncs the readout rows for a single protocol using its protocol ID. 
+					  See sync().
+
+					  Readout rows can only be filtered by modification date (not time), so rows
+					  modified on the day of the previous sync are fetched again.
+		"""
+
+		return self.sync("readout_rows", chunkSize, protocols=id, **kwargs)
+
+
+	def getObjects(self, entity, ids=None, asDataFrame=True):
+		"""
+		:Description: returns objects from the local table for 'entity'.
+
+		:ids (list): optional. IDs of the objects to return. If None, returns all objects.
+
+		:return (DataFrame or list):
+		"""
+
+		assert entity in self.entities, f"'entity' must be one of: {', '.join(self.entities)}."
+
+		if ids is None:
+
+			rows = self.connection.execute(f"SELECT data FROM {entity} ORDER BY id")
+
+		else: 
+
+			# IDs are queried in shards, since older sqlite builds allow at most 999 variables per query:
+
+			ids = sorted({int(id) for id in ids})
+			rows = []
+
+			for start in range(0, len(ids), maxVariables):
+
+				shard = ids[start:start + maxVariables]
+
+				rows.extend(self.connection.execute(f"SELECT data FROM {entity} WHERE id IN ({','.join('?' * len(shard))}) ORDER BY id", shard))
+
+		objects = [json.loads(row[0]) for row in rows]
+
+		if asDataFrame: objects = pd.DataFrame.from_dict(objects)
+
+		return objects
@@ -0,0 +1,124 @@
+'''
+Shared fixtures: a local mock vault (see benchmarks/mock_vault.py) which records every request it
+receives, and a VaultClient connected to it.
+
+Tests set the mock vault's settings with the "mock_vault" marker, e.g.
+
+	@pytest.mark.mock_vault(molecules=2500)
+	def test_something(mock, vault): ...
+'''
+
+
+import re
+import threading
+
+from urllib.parse import parse_qs
+
+import pytest
+
+from mock_vault import MockVault
+
+from cdd_python_sdk.VaultClient import VaultClient, FixedPolling
+
+
+class RecordingVault(MockVault):
+	"""
+	:Description: MockVault which records each request (+ counts the connections opened to it) and
+				  answers requests matching an override (see override()) instead of emulating them. 
+				  Responds without latency, and finishes asynchronous exports + slurps quickly, unless
+				  set otherwise.
+	"""
+
+	def __init__(self, **kwargs):
+
+		self.requests = [] # (verb, path, raw query string, headers)
+		self.overrides = []
+		self.connections = 0
+		self.recordLock = threading.Lock()
+
+		super().__init__(**{"latency": 0, "exportSeconds": 0.05, "slurpSeconds": 0.05, **kwargs})
+
+
+	def makeHandler(self):
+
+		vault = self
+
+		class Handler(super().makeHandler()):
+
+			def setup(self):
+
+				super().setup()
+
+				with vault.recordLock: vault.connections += 1
+
+		return Handler
+
+
+	def override(self, verb, pattern, response):
+		"""
+		:Description: answers requests whose path matches the regular expression 'pattern' with
+					  'response' instead. Later overrides take precedence.
+
+		:response (tuple or callable): status code, body (bytes) + optionally a dict of headers, or a
+									   function of (path, query, body, headers) returning them, or returning None
+									   to emulate the request as usual.
+		"""
+
+		self.overrides.insert(0, (verb, re.compile(pattern), response))
+
+
+	def handle(self, verb, path, queryString, body, headers=None):
+
+		with self.recordLock: self.requests.append((verb, path, queryString, headers or {}))
+
+		for overrideVerb, pattern, response in self.overrides:
+
+			if overrideVerb != verb or not pattern.search(path): continue
+
+			if callable(response):
+
+				query = {k: v[0] for k, v in parse_qs(queryString).items()}
+				response = response(path, query, body, headers or {})
+
+			if response is not None: return response
+
+		return super().handle(verb, path, queryString, body, headers)
+
+
+	def getRequests(self, verb, pattern):
+		"""
+		:return (list of str): the raw query strings of the requests received whose path matches 'pattern'.
+		"""
+
+		with self.recordLock:
+
+			return [queryString for v, path, queryString, _ in self.requests if v == verb and re.search(pattern, path)]
+
+
+	def getQueries(self, verb, pattern):
+		"""
+		:return (list of dict): the parsed queries (see urllib.parse.parse_qs()) of the requests received
+								whose path matches 'pattern'.
+		"""
+
+		return [parse_qs(queryString) for queryString in self.getRequests(verb, pattern)]
+
+
+@pytest.fixture
+def mock(request):
+
+	marker = request.node.get_closest_marker("mock_vault")
+
+	with RecordingVault(**(marker.kwargs if marker else {})) as vault: yield vault
+
+
+@pytest.fixture
+def vault(mock):
+
+	client = VaultClient(1, "test")
+	client.URL = mock.URL
+	client.setPollingStrategy(FixedPolling(0.01))
+
+	yield client
+
+	client.close()
@@ -0,0 +1,94 @@
+'''
+Tests for AsyncVaultClient, which exposes the VaultClient API as coroutines.
+'''
+
+
+import asyncio
+
+import pytest
+
+from cdd_python_sdk.AsyncVaultClient import AsyncVaultClient
+from cdd_python_sdk.VaultClient import FixedPolling
+
+
+def run(mock, method):
+	"""
+	:Description: calls the coroutine function 'method' with an AsyncVaultClient connected to 'mock'.
+	"""
+
+	async def main():
+
+		async with AsyncVaultClient(1, "test") as vault:
+
+			vault.URL = mock.URL
+			vault.setPollingStrategy(FixedPolling(0.01))
+
+			return await method(vault)
+
+	return asyncio.run(main())
+
+
+def startELNExport(mock):
+
+	# The mock vault has no ELN entries, so exports its molecules instead.
+
+	mock.override("GET", "/eln/entries$", lambda path, query, body, headers: (200, mock.startExport("molecules", query)))
+
+
+@pytest.mark.mock_vault(molecules=2500)
+def test_getMolecules_matches_sync_client(mock, vault):
+
+	molecules = run(mock, lambda client: client.getMolecules(asDataFrame=False))
+
+	assert molecules == vault.getMolecules(asDataFrame=False)
+	assert [molecule["id"] for molecule in molecules] == list(range(1, 2501))
+
+
+def test_concurrent_writes(mock):
+
+	async def putAll(client):
+
+		return await asyncio.gather(*[client.putBatches(i, {"name": f"batch {i}"}) for i in range(1, 51)])
+
+	responses = run(mock, putAll)
+
+	assert [response["id"] for response in responses] == list(range(1, 51))
+	assert len(mock.getRequests("PUT", r"/batches/\d+$")) == 50
+
+
+@pytest.mark.mock_vault(molecules=100)
+def test_getELNEntries_streams_export_to_file(mock, tmp_path):
+
+	startELNExport(mock)
+	exportPath = tmp_path / "entries.zip"
+
+	run(mock, lambda client: client.getELNEntries(exportPath=str(exportPath)))
+
+	[exportID] = mock.exports
+
+	assert exportPath.read_bytes() == mock.getExport(exportID)
+
+
+@pytest.mark.mock_vault(molecules=100)
+def test_download_dropped_mid_body_is_retried(mock, tmp_path):
+
+	startELNExport(mock)
+	drops = []
+
+	def dropOnce(path, query, body, headers):
+
+		if drops: return None
+
+		drops.append(path)
+
+		return 200, b'{"count": 100, "objects": [', {"Content-Length": "100000", "Connection": "close"}
+
+	mock.override("GET", r"/exports/\d+$", dropOnce)
+	exportPath = tmp_path / "entries.zip"
+
+	run(mock, lambda client: client.getELNEntries(exportPath=str(exportPath)))
+
+	[exportID] = mock.exports
+
+	assert len(mock.getRequests("GET", r"/exports/\d+$")) == 2
+	assert exportPath.read_bytes() == mock.getExport(exportID)
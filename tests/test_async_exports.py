@@ -0,0 +1,56 @@
+'''
+Tests for waiting on many asynchronous exports from a single scheduling loop (see VaultClient.getAsyncExports()).
+'''
+
+
+import json
+import time
+
+import pytest
+
+
+@pytest.mark.mock_vault(molecules=20, exportSeconds=0.3)
+def test_exports_are_waited_on_together(mock, vault):
+
+	exportIDs = [vault.submitAsyncExport("/molecules") for _ in range(5)]
+
+	start = time.perf_counter()
+	results = list(vault.getAsyncExports(exportIDs, interval=0.05, maxPollsPerSecond=100))
+	duration = time.perf_counter() - start
+
+	assert sorted(exportID for exportID, _, _ in results) == sorted(exportIDs)
+	assert all(error is None and len(data) == 20 for _, data, error in results)
+	assert duration < 5 * 0.3 # Roughly the wait of the slowest export, not the sum.
+
+
+@pytest.mark.mock_vault(molecules=20, exportSeconds=0.5)
+def test_status_checks_stay_within_budget(mock, vault):
+
+	exportIDs = [vault.submitAsyncExport("/molecules") for _ in range(4)]
+
+	start = time.perf_counter()
+	list(vault.getAsyncExports(exportIDs, interval=0.01, maxPollsPerSecond=10))
+	duration = time.perf_counter() - start
+
+	polls = len(mock.getRequests("GET", r"/export_progress/\d+$"))
+
+	assert polls <= 10 * duration + 1
+
+
+@pytest.mark.mock_vault(molecules=20)
+def test_formats_and_failed_exports(mock, vault):
+
+	asJSON, asText, failed, unfetched = [vault.submitAsyncExport("/molecules") for _ in range(4)]
+
+	mock.override("GET", f"/export_progress/{failed}$", (200, json.dumps({"id": failed, "status": "failed"}).encode()))
+
+	results = {exportID: (data, error) for exportID, data, error in 
+			   vault.getAsyncExports({asJSON: "json", asText: "text", failed: "json", unfetched: None}, 
+									 interval=0.02, maxPollsPerSecond=100)}
+
+	assert len(results[asJSON][0]) == 20
+	assert json.loads(results[asText][0])["count"] == 20
+	assert results[unfetched] == (None, None)
+	assert results[failed][0] is None and isinstance(results[failed][1], AssertionError)
+
+	assert len(mock.getRequests("GET", r"/exports/\d+$")) == 2 # The failed + unfetched exports are not downloaded.
@@ -0,0 +1,61 @@
+'''
+Tests for the thread-pooled bulk write methods (see VaultClient.sendBulkRequests()).
+'''
+
+
+import time
+
+import pytest
+import requests
+
+from cdd_python_sdk.VaultClient import RetryPolicy
+
+
+def test_putBatchesBulk_returns_every_response(mock, vault):
+
+	results = list(vault.putBatchesBulk((i, {"name": f"batch {i}"}) for i in range(1, 101)))
+
+	assert sorted(item[0] for item, _, _ in results) == list(range(1, 101))
+	assert all(error is None and response["id"] == item[0] for item, response, error in results)
+	assert len(mock.getRequests("PUT", r"/batches/\d+$")) == 100
+
+
+@pytest.mark.mock_vault(latency=0.05)
+def test_requests_are_sent_concurrently(mock, vault):
+
+	start = time.perf_counter()
+
+	results = list(vault.putBatchesBulk(((i, {"name": f"batch {i}"}) for i in range(1, 41)), maxWorkers=10))
+
+	assert len(results) == 40
+	assert time.perf_counter() - start < 40 * 0.05 / 2 # Well under the time taken one request at a time.
+
+
+def test_errors_are_returned_per_item(mock, vault):
+
+	mock.override("PUT", "/batches/13$", (422, b'{"error": "Unprocessable Entity"}'))
+	vault.setRetryPolicy(RetryPolicy(maxRetries=0))
+
+	results = {item[0]: (response, error) for item, response, error in vault.putBatchesBulk((i, {}) for i in range(1, 21))}
+
+	assert isinstance(results[13][1], requests.exceptions.HTTPError) and results[13][0] is None
+	assert all(error is None for i, (_, error) in results.items() if i != 13)
+
+
+def test_items_are_consumed_lazily(mock, vault):
+
+	consumed = []
+
+	def items():
+
+		for i in range(1, 1001):
+
+			consumed.append(i)
+			yield (i, {})
+
+	results = vault.putBatchesBulk(items(), maxWorkers=5)
+	next(results)
+
+	assert len(consumed) <= 2 * 5 + 1
+
+	results.close()
@@ -0,0 +1,100 @@
+'''
+Tests for the response caches used by VaultClient.setCache().
+'''
+
+
+import json
+import time
+
+from cdd_python_sdk.ResponseCache import MemoryCache, SQLiteCache
+from cdd_python_sdk.VaultClient import VaultClient
+
+
+def test_cached_entries_are_isolated(tmp_path):
+
+	for cache in [MemoryCache(), SQLiteCache(str(tmp_path / "cache.db"))]:
+
+		entry = {"body": {"objects": [{"id": 1}]}, "storedAt": 0.0, "etag": None, "lastModified": None}
+
+		cache.set("key", entry)
+		entry["body"]["objects"].append({"id": 2}) # The caller keeps modifying the response it stored.
+
+		returned = cache.get("key")
+		returned["body"]["objects"].clear()
+
+		assert cache.get("key")["body"] == {"objects": [{"id": 1}]}
+
+
+def serveProjects(mock):
+
+	mock.override("GET", "/projects$", (200, json.dumps([{"id": 1, "name": "Project"}]).encode()))
+
+
+def test_responses_are_reused_within_ttl(mock, vault):
+
+	serveProjects(mock)
+	vault.setCache(MemoryCache(), ttls={"/projects": 60})
+
+	for _ in range(3): assert vault.getProjects(asDataFrame=False) == [{"id": 1, "name": "Project"}]
+
+	assert len(mock.getRequests("GET", "/projects$")) == 1
+
+
+def test_expired_responses_are_fetched_again(mock, vault):
+
+	serveProjects(mock)
+	vault.setCache(MemoryCache(), ttls={"/projects": 0.05})
+
+	vault.getProjects(asDataFrame=False)
+	time.sleep(0.1)
+	vault.getProjects(asDataFrame=False)
+
+	assert len(mock.getRequests("GET", "/projects$")) == 2
+
+
+def test_writes_invalidate_the_resource(mock, vault):
+
+	serveProjects(mock)
+	vault.setCache(MemoryCache(), ttls={"/projects": 60})
+
+	vault.getProjects(asDataFrame=False)
+	vault.sendPutRequest(vault.URL + "/projects/1", {"name": "Renamed"})
+	vault.getProjects(asDataFrame=False)
+
+	assert len(mock.getRequests("GET", "/projects$")) == 2
+
+
+def test_sqlite_cache_is_shared_between_clients(mock, vault, tmp_path):
+
+	serveProjects(mock)
+	path = str(tmp_path / "cache.db")
+
+	vault.setCache(SQLiteCache(path), ttls={"/projects": 60})
+	vault.getProjects(asDataFrame=False)
+
+	with VaultClient(1, "test") as other:
+
+		other.URL = mock.URL
+		other.setCache(SQLiteCache(path), ttls={"/projects": 60})
+
+		assert other.getProjects(asDataFrame=False) == [{"id": 1, "name": "Project"}]
+
+	with VaultClient(1, "another key") as other: # Responses depend on the API key's permissions.
+
+		other.URL = mock.URL
+		other.setCache(SQLiteCache(path), ttls={"/projects": 60})
+		other.getProjects(asDataFrame=False)
+
+	assert len(mock.getRequests("GET", "/projects$")) == 2
+
+
+def test_memory_cache_evicts_least_recently_used():
+
+	cache = MemoryCache(maxEntries=2)
+
+	cache.set("a", {"body": 1})
+	cache.set("b", {"body": 2})
+	cache.get("a")
+	cache.set("c", {"body": 3})
+
+	assert [cache.get(key) for key in "abc"] == [{"body": 1}, None, {"body": 3}]
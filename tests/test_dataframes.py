@@ -0,0 +1,41 @@
+'''
+Tests for building typed DataFrames from protocol data + readout rows (see readoutsToDataFrame()).
+'''
+
+
+import pytest
+
+from cdd_python_sdk.VaultClient import readoutsToDataFrame
+
+
+def test_readouts_are_flattened_into_typed_columns():
+
+	frame = readoutsToDataFrame([
+		{"id": 1, "readouts": {"101": {"value": 1.5, "outlier": True}, "102": "a", "103": {"value": ">5", "modifier": ">"}}},
+		{"id": 2, "readouts": {"101": {"value": 2}, "102": "b"}}
+	])
+
+	assert {column: str(dtype) for column, dtype in frame.dtypes.items()} == {
+		"id": "int64", "101": "float64", "101 outlier": "bool", "102": "string", "103": "string", "103 modifier": "string"}
+
+	assert frame["101"].tolist() == [1.5, 2.0]
+	assert frame["101 outlier"].tolist() == [True, False]
+
+
+@pytest.mark.mock_vault(readouts=2500)
+def test_iterProtocolDataFrames_yields_chunks(mock, vault):
+
+	frames = list(vault.iterProtocolDataFrames(1, chunkSize=1000))
+
+	assert [len(frame) for frame in frames] == [1000, 1000, 500]
+	assert [frame["id"].tolist() for frame in frames] == [list(range(1, 1001)), list(range(1001, 2001)), list(range(2001, 2501))]
+	assert all(str(frame["101"].dtype) == "float64" and str(frame["102"].dtype) == "string" for frame in frames)
+
+
+@pytest.mark.mock_vault(readouts=300)
+def test_iterReadoutRowsFrames_yields_chunks(mock, vault):
+
+	frames = list(vault.iterReadoutRowsFrames(chunkSize=100))
+
+	assert [len(frame) for frame in frames] == [100, 100, 100]
+	assert frames[0]["102"].tolist() == [f"note {i}" for i in range(1, 101)]
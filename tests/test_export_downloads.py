@@ -0,0 +1,76 @@
+'''
+Tests for streaming finished asynchronous exports to disk (see VaultClient.downloadExport()).
+'''
+
+
+import io
+
+import pytest
+
+
+def dropOnce(mock, exportID, size, resend=False):
+	"""
+	:return (callable): a mock vault override which cuts the first download of the export off after
+						'size' bytes, then answers with the full export if 'resend' is set (ignoring 
+						any Range header), or emulates the download as usual.
+	"""
+
+	calls = []
+
+	def respond(path, query, body, headers):
+
+		calls.append(path)
+		data = mock.getExport(exportID)
+
+		if len(calls) == 1: return 200, data[:size], {"Content-Length": str(len(data)), "Connection": "close"}
+
+		return (200, data) if resend else None
+
+	return respond
+
+
+@pytest.mark.mock_vault(molecules=500)
+def test_downloadExport_writes_the_export(mock, vault, tmp_path):
+
+	exportID = vault.submitAsyncExport("/molecules")
+	fileName = tmp_path / "molecules.json"
+
+	written = vault.getAsyncExport(exportID, statusUpdates=False, filePath=str(fileName))
+
+	assert fileName.read_bytes() == mock.getExport(exportID)
+	assert written == fileName.stat().st_size
+
+
+@pytest.mark.mock_vault(molecules=500)
+def test_dropped_download_is_resumed_with_range(mock, vault, tmp_path):
+
+	exportID = vault.submitAsyncExport("/molecules")
+	vault.waitForAsyncExport(exportID, statusUpdates=False)
+
+	mock.override("GET", f"/exports/{exportID}$", dropOnce(mock, exportID, 5000))
+	fileName = tmp_path / "molecules.json"
+
+	vault.downloadExport(exportID, str(fileName), chunkSize=1024)
+
+	downloads = [headers for verb, path, _, headers in mock.requests if path.endswith(f"/exports/{exportID}")]
+
+	ranges = [headers.get("Range") for headers in downloads]
+
+	# Resumes from the last whole chunk written before the connection dropped:
+
+	assert ranges[0] is None and 0 < int(ranges[1][len("bytes="):-1]) <= 5000 and len(ranges) == 2
+	assert fileName.read_bytes() == mock.getExport(exportID)
+
+
+@pytest.mark.mock_vault(molecules=500)
+def test_download_restarts_if_range_is_ignored(mock, vault):
+
+	exportID = vault.submitAsyncExport("/molecules")
+	vault.waitForAsyncExport(exportID, statusUpdates=False)
+
+	mock.override("GET", f"/exports/{exportID}$", dropOnce(mock, exportID, 5000, resend=True))
+	f = io.BytesIO()
+
+	vault.downloadExport(exportID, f, chunkSize=1024)
+
+	assert f.getvalue() == mock.getExport(exportID)
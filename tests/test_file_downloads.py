@@ -0,0 +1,96 @@
+'''
+Tests for streamed file downloads (see decodeBase64Field(), VaultClient.getFilesBulk() + 
+VaultClient.getMoleculeImagesBulk()).
+'''
+
+
+import base64
+import io
+import json
+import os
+
+import pytest
+
+from cdd_python_sdk.VaultClient import RetryPolicy, decodeBase64Field
+
+
+contents = bytes(range(256)) * 40
+
+payload = (b'{"id": 5, "name": "contents", "description": "\\"contents\\": \\"AAAA\\"", ' 
+		   b'"contents" :\n "' + base64.b64encode(contents) + b'", "size": 10240}')
+
+
+def split(data, size):
+
+	return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1000, len(payload)])
+def test_decodeBase64Field_finds_the_key_across_chunks(size):
+
+	f = io.BytesIO()
+
+	metadata = decodeBase64Field(split(payload, size), f)
+
+	assert f.getvalue() == contents
+	assert metadata == {"id": 5, "name": "contents", "description": '"contents": "AAAA"', "contents": "", "size": 10240}
+
+
+def test_decodeBase64Field_removes_escapes():
+
+	encoded = base64.encodebytes(contents).replace(b"\n", b"\\n").replace(b"/", b"\\/")
+
+	f = io.BytesIO()
+
+	decodeBase64Field(split(b'{"contents": "' + encoded + b'"}', 5), f)
+
+	assert f.getvalue() == contents
+
+
+@pytest.mark.mock_vault(fileBytes=100000)
+def test_getFilesBulk_writes_each_file(mock, vault, tmp_path):
+
+	results = sorted(vault.getFilesBulk([1, 2, 3], str(tmp_path), maxWorkers=2, chunkSize=4096))
+
+	assert results == [(i, str(tmp_path / f"file{i}.bin"), None) for i in [1, 2, 3]]
+
+	for _, path, _ in results:
+
+		assert open(path, "rb").read() == bytes(range(256)) * (100000 // 256)
+
+
+@pytest.mark.mock_vault(fileBytes=10000)
+def test_getFilesBulk_reports_failures_without_partial_files(mock, vault, tmp_path):
+
+	mock.override("GET", "/files/2$", (404, b'{"error": "Not Found"}'))
+	vault.setRetryPolicy(RetryPolicy(maxRetries=0))
+
+	results = {fileID: (path, error) for fileID, path, error in vault.getFilesBulk([1, 2, 3], str(tmp_path))}
+
+	assert results[2][0] is None and results[2][1] is not None
+	assert results[1][1] is None and results[3][1] is None
+	assert sorted(os.listdir(tmp_path)) == ["file1.bin", "file3.bin"]
+
+
+def test_getMoleculeImagesBulk_downloads_each_image(mock, vault, tmp_path):
+
+	images = {}
+
+	def startExport(path, query, body, headers):
+
+		exportID = json.loads(mock.startExport("molecules", query))["id"]
+		images[exportID] = f"PNG of molecule {path.split('/')[-2]}".encode()
+
+		return 200, json.dumps({"id": exportID, "status": "new"}).encode()
+
+	mock.override("GET", r"/molecules/\d+/image$", startExport)
+	mock.override("GET", r"/exports/\d+$", lambda path, query, body, headers: (200, images[int(path.split("/")[-1])]))
+
+	results = sorted(vault.getMoleculeImagesBulk([4, 5, 6, 7, 8], str(tmp_path), maxPending=2, interval=0.01))
+
+	assert [(molID, error) for molID, _, error in results] == [(m, None) for m in [4, 5, 6, 7, 8]]
+
+	for molID, path, _ in results:
+
+		assert path == str(tmp_path / f"{molID}.png")
+		assert open(path, "rb").read() == f"PNG of molecule {molID}".encode()
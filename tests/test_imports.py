@@ -0,0 +1,61 @@
+'''
+Tests that importing the package's modules does not import heavy optional modules, which are only
+imported once they are used.
+'''
+
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+heavyModules = ["pandas", "numpy", "pyarrow", "aiohttp"]
+
+
+def runScript(script):
+	"""
+	:return (str): the output of 'script', run in a fresh interpreter.
+	"""
+
+	env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)} # Includes the test pythonpath (see pyproject.toml).
+
+	return subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def getImportedModules(module):
+	"""
+	:return (list): the heavy modules imported by importing 'module' in a fresh interpreter.
+	"""
+
+	output = runScript(f"import sys, {module}; print(','.join(m for m in {heavyModules!r} if m in sys.modules))")
+
+	return [m for m in output.split(",") if m]
+
+
+@pytest.mark.parametrize("module", ["cdd_python_sdk.VaultClient", "cdd_python_sdk.VaultMirror", "cdd_python_sdk.Metrics",
+									"cdd_python_sdk.ResponseCache", "cdd_python_sdk.VaultDataset", "cdd_python_sdk.ReadoutStore"])
+def test_import_is_lazy(module):
+
+	assert getImportedModules(module) == []
+
+
+def test_async_client_only_imports_aiohttp():
+
+	pytest.importorskip("aiohttp")
+
+	assert getImportedModules("cdd_python_sdk.AsyncVaultClient") == ["aiohttp"]
+
+
+def test_help_docs_are_appended_on_first_access():
+
+	script = """
+from cdd_python_sdk.VaultClient import VaultClient, HelpDocMethod
+before = isinstance(VaultClient.__dict__["getMolecules"], HelpDocMethod)
+doc = VaultClient.getMolecules.__doc__
+after = isinstance(VaultClient.__dict__["getMolecules"], HelpDocMethod)
+print(before, after, ":Valid CDD Keyword Arguments:" in doc)
+"""
+
+	assert runScript(script) == "True False True"
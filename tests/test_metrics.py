@@ -0,0 +1,113 @@
+'''
+Tests for per-endpoint request metrics (see VaultClient.setMetrics() + MetricsRegistry).
+'''
+
+
+import pytest
+
+from cdd_python_sdk.Metrics import MetricsRegistry
+from cdd_python_sdk.VaultClient import RetryPolicy
+
+
+@pytest.fixture
+def registry(vault):
+
+	return vault.setMetrics(MetricsRegistry())
+
+
+@pytest.mark.mock_vault(molecules=2500)
+def test_requests_are_counted_by_endpoint(mock, vault, registry):
+
+	vault.getMolecules(asDataFrame=False)
+
+	labels = {"endpoint": "/molecules", "method": "GET", "status": 200}
+	requests = len(mock.getRequests("GET", "/molecules$"))
+
+	assert registry.getCounter("cdd_requests_total", **labels) == requests == 3
+	assert registry.getCounter("cdd_bytes_received_total", **labels) > 2500 * 200
+
+	for name in ["connect", "ttfb", "download", "request"]:
+
+		assert registry.getHistogram(f"cdd_{name}_seconds", **labels).count == requests
+
+
+@pytest.mark.mock_vault(readouts=10)
+def test_endpoints_replace_ids(vault, registry):
+
+	vault.getProtocolData(12, asDataFrame=False)
+
+	assert vault.getEndpoint(vault.URL + "/protocols/12/data?page_size=10") == "/protocols/{id}/data"
+	assert registry.getCounter("cdd_requests_total", endpoint="/protocols/{id}/data", method="GET", status=200) == 1
+
+
+@pytest.mark.mock_vault(molecules=20)
+def test_retries_and_polls_are_counted(mock, vault, registry):
+
+	failures = [(503, b'{"error": "Service Unavailable"}', {"Retry-After": "0"})]
+	mock.override("GET", "/molecules$", lambda path, query, body, headers: failures.pop() if failures else None)
+
+	vault.setRetryPolicy(RetryPolicy(maxRetries=1))
+	vault.setMaxSyncObjects(10)
+	vault.setMaxPagedObjects(0) # Forces an asynchronous export.
+
+	vault.getMolecules(asDataFrame=False)
+
+	assert registry.getCounter("cdd_retries_total", endpoint="/molecules", method="GET") == 1
+	assert registry.getCounter("cdd_requests_total", endpoint="/molecules", method="GET", status=503) == 1
+	assert registry.getCounter("cdd_polls_total", endpoint="/molecules") == vault.getPollCount() > 0 # Labelled by the exported endpoint.
+
+
+@pytest.mark.mock_vault(molecules=5)
+def test_hooks_receive_each_event(vault):
+
+	events = []
+	vault.setMetrics(hooks=[events.append])
+
+	vault.getMolecules()
+
+	assert [event["event"] for event in events] == ["request", "json", "dataframe"]
+	assert events[0]["endpoint"] == "/molecules" and events[0]["status"] == 200 and events[0]["ttfb"] >= 0
+
+
+@pytest.mark.mock_vault(molecules=5)
+def test_no_metrics_by_default(vault):
+
+	assert vault.setMetrics() is None
+
+	vault.getMolecules(asDataFrame=False) # Records nothing, without error.
+
+
+def test_toPrometheus():
+
+	registry = MetricsRegistry(buckets=(0.1, 1.0))
+
+	registry.increment("cdd_requests_total", endpoint="/molecules")
+	registry.increment("cdd_requests_total", 2, endpoint='/a"b')
+
+	for value in [0.05, 0.5, 5.0]: registry.observe("cdd_ttfb_seconds", value, endpoint="/molecules")
+
+	assert registry.toPrometheus().splitlines() == [
+		"# TYPE cdd_requests_total counter",
+		'cdd_requests_total{endpoint="/a\\"b"} 2',
+		'cdd_requests_total{endpoint="/molecules"} 1',
+		"# TYPE cdd_ttfb_seconds histogram",
+		'cdd_ttfb_seconds_bucket{endpoint="/molecules",le="0.1"} 1',
+		'cdd_ttfb_seconds_bucket{endpoint="/molecules",le="1.0"} 2',
+		'cdd_ttfb_seconds_bucket{endpoint="/molecules",le="+Inf"} 3',
+		'cdd_ttfb_seconds_sum{endpoint="/molecules"} 5.55',
+		'cdd_ttfb_seconds_count{endpoint="/molecules"} 3'
+		]
+
+
+def test_getSummary_sorts_endpoints_by_total_time():
+
+	registry = MetricsRegistry()
+
+	registry.observe("cdd_request_seconds", 0.2, endpoint="/fields")
+	registry.observe("cdd_request_seconds", 1.5, endpoint="/molecules")
+	registry.observe("cdd_request_seconds", 0.5, endpoint="/molecules")
+
+	summary = registry.getSummary("cdd_request_seconds")
+
+	assert [row["endpoint"] for row in summary] == ["/molecules", "/fields"]
+	assert summary[0]["count"] == 2 and summary[0]["mean"] == 1.0 and summary[0]["p95"] == 2.5
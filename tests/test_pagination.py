@@ -0,0 +1,40 @@
+'''
+Tests for fetching mid-sized results as concurrent offset pages (see VaultClient.setMaxPagedObjects()).
+'''
+
+
+import pytest
+
+
+@pytest.mark.mock_vault(molecules=3500)
+def test_results_up_to_maxPagedObjects_are_paged(mock, vault):
+
+	molecules = vault.getMolecules(asDataFrame=False)
+
+	queries = mock.getQueries("GET", "/molecules$")
+
+	assert [molecule["id"] for molecule in molecules] == list(range(1, 3501)) # In order, despite concurrent pages.
+	assert sorted(int(query.get("offset", ["0"])[0]) for query in queries) == [0, 1000, 2000, 3000]
+	assert all(query["page_size"] == ["1000"] for query in queries)
+	assert not mock.getRequests("GET", r"/exports/\d+$")
+
+
+@pytest.mark.mock_vault(molecules=3500)
+def test_larger_results_are_exported(mock, vault):
+
+	vault.setMaxPagedObjects(3000)
+
+	molecules = vault.getMolecules(asDataFrame=False)
+
+	assert len(molecules) == 3500
+	assert [query.get("async") for query in mock.getQueries("GET", "/molecules$")] == [None, ["true"]]
+	assert len(mock.getRequests("GET", r"/exports/\d+$")) == 1
+
+
+@pytest.mark.mock_vault(molecules=3500)
+def test_pages_are_iterated_in_order(mock, vault):
+
+	molecules = list(vault.iterMolecules())
+
+	assert [molecule["id"] for molecule in molecules] == list(range(1, 3501))
+	assert not mock.getRequests("GET", r"/exports/\d+$")
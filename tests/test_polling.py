@@ -0,0 +1,54 @@
+'''
+Tests for the polling strategies used to wait on asynchronous exports + slurps (see VaultClient.setPollingStrategy()).
+'''
+
+
+import pytest
+
+from cdd_python_sdk.VaultClient import ExponentialBackoff, FixedPolling
+
+
+def test_exponential_backoff_grows_to_cap():
+
+	strategy = ExponentialBackoff(initial=1.0, factor=2.0, maxInterval=5.0, jitter=0.0)
+
+	assert [strategy.getDelay(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_jitter_stays_within_bounds():
+
+	strategy = ExponentialBackoff(initial=1.0, jitter=0.1)
+
+	assert all(0.9 <= strategy.getDelay(1) <= 1.1 for _ in range(100))
+
+
+def test_recorded_durations_skip_ahead():
+
+	strategy = ExponentialBackoff(initial=1.0, maxInterval=60.0, jitter=0.0)
+
+	strategy.record("/molecules", 20.0, size=1000)
+
+	assert strategy.getDelay(1, elapsed=2.0, key="/molecules") == 18.0
+	assert strategy.getDelay(1, elapsed=2.0, key="/molecules", size=500) == 8.0 # Scaled by the export's size.
+	assert strategy.getDelay(1, elapsed=2.0, key="/batches") == 1.0
+
+
+@pytest.mark.mock_vault(molecules=20, exportSeconds=0.5)
+def test_backoff_polls_less_than_fixed_interval(mock, vault):
+
+	vault.setMaxSyncObjects(10)
+	vault.setMaxPagedObjects(0) # Forces an asynchronous export.
+
+	vault.setPollingStrategy(FixedPolling(0.01))
+	vault.getMolecules(asDataFrame=False)
+	fixedPolls = vault.getPollCount()
+
+	vault.setPollingStrategy(ExponentialBackoff(initial=0.01, factor=2.0, maxInterval=1.0, jitter=0.0))
+	vault.getMolecules(asDataFrame=False)
+	backoffPolls = vault.getPollCount()
+
+	vault.getMolecules(asDataFrame=False) # Waits for roughly the recorded duration of the first export.
+	learnedPolls = vault.getPollCount() - backoffPolls
+
+	assert backoffPolls < fixedPolls / 3
+	assert learnedPolls <= 3
@@ -0,0 +1,93 @@
+'''
+Tests for column projections of molecules + batches (see VaultClient.getProjection() + the 'select'
+argument of getMolecules() + getBatches()).
+'''
+
+
+import json
+
+import pytest
+
+
+fields = {"molecule": [{"name": "MW", "type": "Number"}, {"name": "Series", "type": "Text"}],
+		  "batch": [{"name": "Purity", "type": "Number"}, {"name": "Made", "type": "Date"}]}
+
+molecules = [{"id": i, "name": f"MOL-{i}", "smiles": "CCO", "molecule_fields": {"MW": str(40 + i), "Series": "A"},
+			  "batches": [{"id": 10 * i}]} for i in range(1, 4)]
+
+batches = [{"id": 10 * i, "name": f"MOL-{i}-001", "batch_fields": {"Purity": 99.5, "Made": f"2024-01-0{i}"},
+			"molecule": {"id": i, "name": f"MOL-{i}", "molecule_fields": {"MW": 40 + i}}} for i in range(1, 4)]
+
+
+@pytest.fixture
+def objects(mock):
+
+	mock.override("GET", "/fields$", (200, json.dumps(fields).encode()))
+	mock.override("GET", "/molecules$", (200, json.dumps({"count": 3, "objects": molecules}).encode()))
+	mock.override("GET", "/batches$", (200, json.dumps({"count": 3, "objects": batches}).encode()))
+
+
+def test_selecting_ids_only_requests_ids(mock, vault, objects):
+
+	frame = vault.getMolecules(select=["id"])
+
+	assert list(frame.columns) == ["id"] and list(frame["id"]) == [1, 2, 3]
+
+	assert mock.getRequests("GET", "/fields$") == [] # Not needed to select IDs.
+	assert mock.getQueries("GET", "/molecules$")[0]["only_ids"] == ["true"]
+
+
+def test_selected_molecule_fields_are_requested_and_typed(mock, vault, objects):
+
+	frame = vault.getMolecules(select=["id", "name", "MW"])
+
+	assert list(frame.columns) == ["id", "name", "MW"]
+	assert str(frame["MW"].dtype) == "float64" and list(frame["MW"]) == [41.0, 42.0, 43.0]
+
+	[query] = mock.getQueries("GET", "/molecules$")
+
+	assert query["molecule_fields[]"] == ["MW"]
+	assert query["no_structures"] == ["true"] and query["only_batch_ids"] == ["true"]
+
+
+def test_structures_and_batches_are_only_dropped_if_unselected(mock, vault, objects):
+
+	rows = vault.getMolecules(asDataFrame=False, select=["smiles", "batches"])
+
+	assert rows[0] == {"smiles": "CCO", "batches": [{"id": 10}]}
+
+	[query] = mock.getQueries("GET", "/molecules$")
+
+	assert "no_structures" not in query and "only_batch_ids" not in query
+
+
+def test_explicit_kwargs_take_precedence(mock, vault, objects):
+
+	vault.getMolecules(select=["id", "MW"], molecule_fields=["MW", "Series"], no_structures=False)
+
+	[query] = mock.getQueries("GET", "/molecules$")
+
+	assert query["molecule_fields[]"] == ["MW", "Series"] and query["no_structures"] == ["false"]
+
+
+def test_batches_select_batch_molecule_and_nested_values(mock, vault, objects):
+
+	frame = vault.getBatches(select=["id", "Purity", "Made", "MW", "molecule.name"])
+
+	assert list(frame.columns) == ["id", "Purity", "Made", "MW", "molecule.name"]
+	assert [d.day for d in frame["Made"]] == [1, 2, 3]
+	assert list(frame["molecule.name"]) == ["MOL-1", "MOL-2", "MOL-3"]
+
+	[query] = mock.getQueries("GET", "/batches$")
+
+	assert query["batch_fields[]"] == ["Purity", "Made"] and query["molecule_fields[]"] == ["MW"]
+	assert "only_molecule_ids" not in query
+
+
+def test_batches_without_molecule_columns_only_request_molecule_ids(mock, vault, objects):
+
+	vault.getBatches(select=["id", "Purity"])
+
+	[query] = mock.getQueries("GET", "/batches$")
+
+	assert query["only_molecule_ids"] == ["true"]
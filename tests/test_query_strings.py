@@ -0,0 +1,77 @@
+'''
+Tests for query string construction from typed keyword arguments (see KwargSpec + buildQueryString()).
+'''
+
+
+import datetime as dt
+
+import pytest
+
+from cdd_python_sdk.VaultClient import KwargSpec, getKwargSpec
+
+
+def test_help_docs_are_parsed_once():
+
+	spec = getKwargSpec("get_molecules.txt")
+
+	assert getKwargSpec("get_molecules.txt") is spec
+	assert {"molecules", "only_ids", "created_after", "molecule_fields"} <= spec
+
+	assert [spec.types.get(k) for k in ["molecules", "only_ids", "created_after", "molecule_fields", "structure"]] == [
+		"list", "boolean", "date", "array", None]
+
+
+def test_buildQueryString_formats_by_type(vault):
+
+	spec = getKwargSpec("get_molecules.txt")
+	kwargs = {"molecules": (1, 2), "only_ids": False, "created_after": dt.date(2024, 1, 2), "structure": "C(C)O", "color": "red"}
+
+	assert vault.buildQueryString(kwargs, spec) == "?molecules=1,2&only_ids=false&created_after=2024-01-02&structure=C%28C%29O"
+	assert "color" not in kwargs # Invalid arguments are removed.
+
+
+def test_withKeys_keeps_types():
+
+	spec = KwargSpec({"only_ids"}, {"only_ids": "boolean"}).withKeys("async")
+
+	assert isinstance(spec, KwargSpec) and spec == {"only_ids", "async"}
+	assert spec.types == {"only_ids": "boolean"}
+
+
+def test_submitAsyncExport_formats_typed_kwargs(mock, vault):
+
+	vault.submitAsyncExport("/molecules", helpDoc="get_molecules.txt", only_ids=True, molecule_fields=["MW", "Name"])
+
+	assert mock.getQueries("GET", "/molecules$") == [{"async": ["true"], "only_ids": ["true"], "molecule_fields[]": ["MW", "Name"]}]
+
+
+@pytest.mark.mock_vault(molecules=2500)
+def test_pages_after_the_first_keep_typed_kwargs(mock, vault):
+
+	molecules = vault.getMolecules(asDataFrame=False, molecule_fields=["MW", "Name"])
+
+	assert len(molecules) == 2500
+
+	queries = mock.getQueries("GET", "/molecules$")
+
+	assert sorted(int(query.get("offset", ["0"])[0]) for query in queries) == [0, 1000, 2000]
+	assert all(query["molecule_fields[]"] == ["MW", "Name"] for query in queries)
+
+
+@pytest.mark.mock_vault(molecules=5)
+def test_scalar_values_are_percent_encoded(mock, vault):
+
+	createdAfter = dt.datetime(2024, 3, 1, 9, 30, tzinfo=dt.timezone(dt.timedelta(hours=1)))
+
+	vault.getMolecules(asDataFrame=False, names="A&B=C", created_after=createdAfter, molecules=[1, 2, 3])
+
+	[queryString] = mock.getRequests("GET", "/molecules$")
+
+	assert "names=A%26B%3DC" in queryString.split("&")
+	assert "molecules=1,2,3" in queryString.split("&")
+
+	[query] = mock.getQueries("GET", "/molecules$")
+
+	assert query["names"] == ["A&B=C"]
+	assert query["created_after"] == ["2024-03-01T09:30:00+01:00"] # "+" would otherwise be decoded as a space.
+	assert query["molecules"] == ["1,2,3"]
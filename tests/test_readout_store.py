@@ -0,0 +1,56 @@
+'''
+Tests for the memory-mapped readout store (see ReadoutStore).
+'''
+
+
+import numpy as np
+import pytest
+
+from cdd_python_sdk.ReadoutStore import ReadoutStore
+
+
+@pytest.fixture
+def store(mock, vault, tmp_path):
+
+	return ReadoutStore.fromProtocolData(vault, str(tmp_path / "store"), [1], chunkSize=30)
+
+
+@pytest.mark.mock_vault(readouts=100)
+def test_store_holds_one_record_per_readout(store):
+
+	assert len(store) == 200 # 2 readout definitions per row.
+
+	assert isinstance(store.arrays["value"], np.memmap)
+	assert isinstance(store.arrays["batch.order"], np.memmap)
+
+
+@pytest.mark.mock_vault(molecules=20, readouts=100)
+def test_lookups_match_a_scan_of_the_rows(store):
+
+	readouts = store.getReadouts(run=103, definition=101)
+
+	assert sorted(readouts["row"]) == [i for i in range(1, 101) if i % 10 == 3]
+	assert set(readouts["protocol"]) == {1}
+	assert readouts["value"].notna().all()
+
+	notes = store.getReadouts(batch=50, definition=102)
+
+	assert sorted(notes["text"]) == sorted(f"note {i}" for i in range(1, 101) if 10 * (i % 20 + 1) == 50)
+	assert notes["value"].isna().all()
+
+
+@pytest.mark.mock_vault(readouts=10)
+def test_missing_keys_return_no_readouts(store):
+
+	assert len(store.getReadouts(batch=-5)) == 0
+	assert store.getReadouts(molecule=1, asDataFrame=False)["row"].size == 0 # Protocol data has no molecule IDs.
+
+
+@pytest.mark.mock_vault(readouts=10)
+def test_rebuilding_replaces_the_store(store):
+
+	rebuilt = ReadoutStore.build(store.path, [[{"id": 1, "protocol": 2, "run": 5, "readouts": {"7": 1.5}}]])
+
+	assert len(rebuilt) == 1
+	assert rebuilt.getReadouts(protocol=2, asDataFrame=False)["value"].tolist() == [1.5]
+	assert len(rebuilt.getReadouts(protocol=1)) == 0
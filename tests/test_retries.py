@@ -0,0 +1,107 @@
+'''
+Tests for retrying failed requests + client-wide rate limiting (see VaultClient.setRetryPolicy() + setRateLimit()).
+'''
+
+
+import time
+
+import pytest
+import requests
+
+from cdd_python_sdk.VaultClient import RetryPolicy, TokenBucket
+
+
+class Response(object):
+
+	def __init__(self, status, retryAfter=None):
+
+		self.status_code = status
+		self.headers = {"Retry-After": retryAfter} if retryAfter else {}
+
+
+def failTimes(count, status=503, headers=None):
+	"""
+	:return (callable): a mock vault override answering the first 'count' requests with 'status'.
+	"""
+
+	failures = []
+
+	def respond(path, query, body, headers):
+
+		if len(failures) >= count: return None
+
+		failures.append(path)
+
+		return status, b'{"error": "Service Unavailable"}', headers or {}
+
+	return respond
+
+
+def test_retryable_methods_and_statuses():
+
+	policy = RetryPolicy(maxRetries=2)
+
+	assert policy.isRetryable("GET", 1, Response(503)) and policy.isRetryable("put", 2, Response(429))
+	assert not policy.isRetryable("GET", 3, Response(503)) # Out of retries.
+	assert not policy.isRetryable("GET", 1, Response(404))
+	assert not policy.isRetryable("POST", 1, Response(503))
+
+
+def test_retry_delays():
+
+	policy = RetryPolicy(backoffFactor=1.0, maxBackoff=10.0)
+
+	assert policy.getDelay(1, Response(429, "3")) == 3.0
+	assert policy.getDelay(1, Response(429, "120")) == 10.0
+	assert policy.getDelay(1, Response(503, "Wed, 21 Oct 2015 07:28:00 GMT")) == 0.0 # In the past.
+	assert 2.0 <= policy.getDelay(3, Response(503, "not a date")) <= 4.0 # Falls back to the backoff.
+
+
+@pytest.mark.mock_vault(molecules=10)
+def test_transient_failures_are_retried(mock, vault):
+
+	mock.override("GET", "/molecules$", failTimes(2, 429, {"Retry-After": "0"}))
+
+	assert len(vault.getMolecules(asDataFrame=False)) == 10
+	assert len(mock.getRequests("GET", "/molecules$")) == 3
+
+
+@pytest.mark.mock_vault(molecules=10)
+def test_retries_are_bounded(mock, vault):
+
+	mock.override("GET", "/molecules$", failTimes(10, 503, {"Retry-After": "0"}))
+	vault.setRetryPolicy(RetryPolicy(maxRetries=2))
+
+	with pytest.raises(requests.exceptions.HTTPError): vault.getMolecules(asDataFrame=False)
+
+	assert len(mock.getRequests("GET", "/molecules$")) == 3
+
+
+def test_posts_are_not_retried(mock, vault):
+
+	mock.override("POST", "/batches$", failTimes(1, 503, {"Retry-After": "0"}))
+
+	with pytest.raises(requests.exceptions.HTTPError): vault.postBatches({"molecule": 1})
+
+	assert len(mock.getRequests("POST", "/batches$")) == 1
+
+
+def test_token_bucket_limits_rate():
+
+	bucket = TokenBucket(rate=10, capacity=2)
+
+	delays = [bucket.reserve() for _ in range(6)]
+
+	assert delays[:2] == [0.0, 0.0] # Burst.
+	assert delays[-1] == pytest.approx(0.4, abs=0.01)
+
+
+@pytest.mark.mock_vault(molecules=10)
+def test_rate_limit_spaces_requests(mock, vault):
+
+	vault.setRateLimit(20, burst=1)
+
+	start = time.perf_counter()
+	for _ in range(6): vault.getMolecules(asDataFrame=False)
+
+	assert time.perf_counter() - start >= 5 / 20 * 0.9
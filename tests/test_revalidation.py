@@ -0,0 +1,80 @@
+'''
+Tests for revalidating expired cached responses with conditional GET requests (see VaultClient.setCache()).
+'''
+
+
+import json
+
+from cdd_python_sdk.ResponseCache import MemoryCache
+
+
+def serveProjects(mock, name, validator, value):
+	"""
+	:Description: answers GET /projects with a single project + a 'validator' header ("ETag" or
+				  "Last-Modified"), or with 304 (Not Modified) if the request's matching conditional
+				  header is 'value'.
+	"""
+
+	condition = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}[validator]
+
+	def respond(path, query, body, headers):
+
+		if headers.get(condition) == value: return 304, b"", {validator: value}
+
+		return 200, json.dumps([{"id": 1, "name": name}]).encode(), {validator: value}
+
+	mock.override("GET", "/projects$", respond)
+
+
+def getConditions(mock):
+
+	return [(headers.get("If-None-Match"), headers.get("If-Modified-Since")) 
+			for verb, path, _, headers in mock.requests if path.endswith("/projects")]
+
+
+def test_unchanged_response_is_reused_with_etag(mock, vault):
+
+	serveProjects(mock, "Project", "ETag", '"v1"')
+	vault.setCache(MemoryCache(), ttls={"/projects": 0})
+
+	responses = [vault.getProjects(asDataFrame=False) for _ in range(3)]
+
+	assert responses == [[{"id": 1, "name": "Project"}]] * 3
+	assert getConditions(mock) == [(None, None), ('"v1"', None), ('"v1"', None)]
+
+
+def test_unchanged_response_is_reused_with_last_modified(mock, vault):
+
+	modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+	serveProjects(mock, "Project", "Last-Modified", modified)
+	vault.setCache(MemoryCache(), ttls={"/projects": 0})
+
+	responses = [vault.getProjects(asDataFrame=False) for _ in range(2)]
+
+	assert responses == [[{"id": 1, "name": "Project"}]] * 2
+	assert getConditions(mock) == [(None, None), (None, modified)]
+
+
+def test_changed_response_replaces_cached_one(mock, vault):
+
+	serveProjects(mock, "Project", "ETag", '"v1"')
+	vault.setCache(MemoryCache(), ttls={"/projects": 0})
+	vault.getProjects(asDataFrame=False)
+
+	serveProjects(mock, "Renamed", "ETag", '"v2"')
+
+	assert vault.getProjects(asDataFrame=False) == [{"id": 1, "name": "Renamed"}]
+	assert vault.getProjects(asDataFrame=False) == [{"id": 1, "name": "Renamed"}]
+
+	assert getConditions(mock) == [(None, None), ('"v1"', None), ('"v2"', None)]
+
+
+def test_responses_without_validators_are_not_stored_at_ttl_zero(mock, vault):
+
+	mock.override("GET", "/projects$", (200, b'[{"id": 1}]'))
+	vault.setCache(MemoryCache(), ttls={"/projects": 0})
+
+	for _ in range(2): vault.getProjects(asDataFrame=False)
+
+	assert getConditions(mock) == [(None, None), (None, None)]
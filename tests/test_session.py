@@ -0,0 +1,27 @@
+'''
+Tests for the pooled keep-alive HTTP session shared by every request of a client (see VaultClient.setSession()).
+'''
+
+
+import pytest
+
+
+@pytest.mark.mock_vault(molecules=10)
+def test_requests_reuse_one_connection(mock, vault):
+
+	for _ in range(5): vault.getMolecules(asDataFrame=False)
+
+	vault.putBatches(1, {"name": "batch"})
+
+	assert len(mock.requests) == 6
+	assert mock.connections == 1
+
+
+@pytest.mark.mock_vault(molecules=10)
+def test_keepAlive_false_opens_a_connection_per_request(mock, vault):
+
+	vault.setSession(keepAlive=False)
+
+	for _ in range(3): vault.getMolecules(asDataFrame=False)
+
+	assert mock.connections == 3
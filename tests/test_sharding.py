@@ -0,0 +1,93 @@
+'''
+Tests for splitting long ID-list query parameters into shards (see VaultClient.setIDSharding()).
+'''
+
+
+import json
+
+import pytest
+
+
+@pytest.mark.mock_vault(molecules=30)
+def test_iterMolecules_shards_long_id_lists(mock, vault):
+
+	vault.setIDSharding(maxLength=50)
+
+	molecules = list(vault.iterMolecules(molecules=list(range(1, 101))))
+
+	shards = [query["molecules"][0] for query in mock.getQueries("GET", "/molecules$")]
+
+	assert len(shards) > 1 and all(len(ids) <= 50 for ids in shards)
+	assert [molecule["id"] for molecule in molecules] == list(range(1, 31)) # Returned by every shard, de-duplicated.
+
+
+class FilteredMolecules(object):
+	"""
+	:Description: mock vault override returning 'perID' objects for each ID in the 'molecules' filter.
+	"""
+
+	def __init__(self, mock, perID=1):
+
+		self.perID = perID
+
+		mock.override("GET", "/molecules$", self.respond)
+
+
+	def respond(self, path, query, body, headers):
+
+		ids = [int(i) for i in query["molecules"].split(",")]
+		objects = [{"id": self.perID * i + n, "molecule": i} for i in ids for n in range(self.perID)]
+
+		return 200, json.dumps({"count": len(objects), "objects": objects}).encode()
+
+
+def getShards(mock):
+
+	return [[int(i) for i in query["molecules"][0].split(",")] for query in mock.getQueries("GET", "/molecules$")]
+
+
+def test_getMolecules_requests_each_id_once(mock, vault):
+
+	FilteredMolecules(mock)
+	vault.setIDSharding(maxLength=200)
+
+	molecules = vault.getMolecules(asDataFrame=False, molecules=list(range(1, 501)) + [1, 2, 3])
+
+	shards = getShards(mock)
+
+	assert len(shards) > 1 and all(len(",".join(map(str, shard))) <= 200 for shard in shards)
+	assert sorted(i for shard in shards for i in shard) == list(range(1, 501))
+	assert [molecule["id"] for molecule in molecules] == list(range(1, 501))
+
+
+def test_short_id_lists_are_not_sharded(mock, vault):
+
+	FilteredMolecules(mock)
+
+	vault.getMolecules(asDataFrame=False, molecules="1,2,3")
+
+	assert getShards(mock) == [[1, 2, 3]]
+
+
+def test_sharding_can_be_disabled(mock, vault):
+
+	FilteredMolecules(mock)
+	vault.setIDSharding(maxLength=None)
+
+	vault.getMolecules(asDataFrame=False, molecules=list(range(1, 501)))
+
+	assert getShards(mock) == [list(range(1, 501))]
+
+
+def test_shards_are_sized_by_objects_per_id(mock, vault):
+
+	FilteredMolecules(mock, perID=4)
+	vault.setMaxSyncObjects(40)
+
+	molecules = vault.getMolecules(asDataFrame=False, molecules=list(range(1, 101)))
+
+	first, *rest = getShards(mock)
+
+	assert len(first) == 40 # Sized by the # of IDs, before the # of objects per ID is known.
+	assert rest and all(len(shard) <= 8 for shard in rest) # 0.8 * 40 objects / 4 per ID.
+	assert len(molecules) == 400
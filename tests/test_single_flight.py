@@ -0,0 +1,116 @@
+'''
+Tests for coalescing identical concurrent GET requests (see SingleFlight + VaultClient.setSingleFlight()).
+'''
+
+
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from cdd_python_sdk.Metrics import MetricsRegistry
+from cdd_python_sdk.VaultClient import RetryPolicy, SingleFlight
+
+
+def runConcurrently(function, count=8):
+	"""
+	:return (list): the results of 'count' calls of function(), started together from separate threads.
+	"""
+
+	barrier = threading.Barrier(count)
+
+	def call():
+
+		barrier.wait()
+
+		return function()
+
+	with ThreadPoolExecutor(count) as executor: return [f.result() for f in [executor.submit(call) for _ in range(count)]]
+
+
+@pytest.mark.mock_vault(molecules=5, latency=0.3)
+def test_identical_requests_are_sent_once(mock, vault):
+
+	registry = vault.setMetrics(MetricsRegistry())
+
+	results = runConcurrently(lambda: vault.getMolecules(asDataFrame=False))
+
+	assert len(mock.getRequests("GET", "/molecules$")) == 1
+	assert all(result == results[0] for result in results)
+	assert registry.getCounter("cdd_coalesced_requests_total", endpoint="/molecules") == 7
+
+
+@pytest.mark.mock_vault(molecules=5, latency=0.3)
+def test_callers_receive_separate_copies(vault):
+
+	results = runConcurrently(lambda: vault.getMolecules(asDataFrame=False), count=2)
+
+	results[0][0]["name"] = "Modified"
+
+	assert results[1][0]["name"] == "MOL-1"
+
+
+@pytest.mark.mock_vault(molecules=5, latency=0.3)
+def test_different_queries_are_not_coalesced(mock, vault):
+
+	queries = iter(range(8))
+	lock = threading.Lock()
+
+	def getMolecules():
+
+		with lock: project = next(queries)
+
+		return vault.getMolecules(asDataFrame=False, projects=[project])
+
+	runConcurrently(getMolecules)
+
+	assert len(mock.getRequests("GET", "/molecules$")) == 8
+
+
+@pytest.mark.mock_vault(molecules=5, latency=0.3)
+def test_disabled_single_flight_sends_each_request(mock, vault):
+
+	assert vault.setSingleFlight(False) is None
+
+	runConcurrently(lambda: vault.getMolecules(asDataFrame=False), count=4)
+
+	assert len(mock.getRequests("GET", "/molecules$")) == 4
+
+
+@pytest.mark.mock_vault(molecules=20, latency=0.1)
+def test_waiting_threads_share_one_export(mock, vault):
+
+	vault.setMaxSyncObjects(10)
+	vault.setMaxPagedObjects(0) # Forces an asynchronous export.
+
+	results = runConcurrently(lambda: vault.getMolecules(asDataFrame=False), count=4)
+
+	assert len(mock.exports) == 1
+	assert all(len(result) == 20 for result in results)
+
+
+@pytest.mark.mock_vault(latency=0.3)
+def test_errors_are_shared(mock, vault):
+
+	mock.override("GET", "/fields$", (500, b'{"error": "Internal Server Error"}'))
+	vault.setRetryPolicy(RetryPolicy(maxRetries=0))
+
+	def getFields():
+
+		try: vault.getFields(asDataFrame=False)
+		except requests.exceptions.HTTPError as e: return e.response.status_code
+
+	assert runConcurrently(getFields, count=4) == [500] * 4
+	assert len(mock.getRequests("GET", "/fields$")) == 1
+
+
+def test_calls_after_completion_are_repeated():
+
+	singleFlight = SingleFlight()
+	calls = []
+
+	assert singleFlight.do("key", lambda: calls.append(1) or len(calls)) == (1, False)
+	assert singleFlight.do("key", lambda: calls.append(1) or len(calls)) == (2, False)
+	assert singleFlight.calls == {}
@@ -0,0 +1,108 @@
+'''
+Tests for chunked slurps imports (see VaultClient.postSlurpsDataChunked()).
+'''
+
+
+import json
+import os
+
+import pytest
+
+from cdd_python_sdk.VaultClient import RetryPolicy, splitImportFile
+
+
+def writeReadouts(folder, rows=10):
+
+	fileName = folder / "readouts.csv"
+	fileName.write_text("Molecule Name,IC50\n" + "".join(f"MOL-{i},{i}\n" for i in range(rows)))
+
+	return str(fileName)
+
+
+def test_splitImportFile_rejects_other_extensions(tmp_path):
+
+	fileName = tmp_path / "readouts.xlsx"
+	fileName.write_bytes(b"not a delimited file")
+
+	with pytest.raises(ValueError): splitImportFile(str(fileName), 5, str(tmp_path))
+
+
+def test_postSlurpsDataChunked_gives_up_on_failing_status_checks(mock, vault, tmp_path):
+
+	mock.override("GET", r"/slurps/\d+$", (500, b'{"error": "Internal Server Error"}'))
+	vault.setRetryPolicy(RetryPolicy(maxRetries=0))
+
+	report = vault.postSlurpsDataChunked(writeReadouts(tmp_path), project=1, rowsPerChunk=4, 
+										 chunkFolder=str(tmp_path / "chunks"), maxPollErrors=3)
+
+	assert [len(report[state]) for state in ["committed", "failed"]] == [0, 3]
+	assert all(chunk["pollErrors"] == 3 and "error" in chunk for chunk in report["failed"])
+
+
+def test_splitImportFile_keeps_quoted_rows_and_headers(tmp_path):
+
+	fileName = tmp_path / "readouts.csv"
+	fileName.write_bytes(b'Molecule Name,Note\r\nMOL-1,"two\r\nlines"\r\nMOL-2,plain\r\nMOL-3,"a ""quoted"" word"\r\n')
+
+	chunks = splitImportFile(str(fileName), 2, str(tmp_path))
+
+	assert [(os.path.basename(path), firstRow, rows) for path, firstRow, rows in chunks] == [
+		("readouts.part00001.csv", 0, 2), ("readouts.part00002.csv", 2, 1)]
+
+	assert open(chunks[0][0], "rb").read() == b'Molecule Name,Note\r\nMOL-1,"two\r\nlines"\r\nMOL-2,plain\r\n'
+	assert open(chunks[1][0], "rb").read() == b'Molecule Name,Note\r\nMOL-3,"a ""quoted"" word"\r\n'
+
+
+def test_splitImportFile_splits_sd_records(tmp_path):
+
+	record = "MOL-{}\n  RDKit\n\n  0  0  0  0  0  0  0  0  0  0999 V2000\nM  END\n$$$$\n"
+
+	fileName = tmp_path / "molecules.sdf"
+	fileName.write_text("".join(record.format(i) for i in range(5)))
+
+	chunks = splitImportFile(str(fileName), 2, str(tmp_path))
+
+	assert [rows for _, _, rows in chunks] == [2, 2, 1]
+	assert open(chunks[2][0]).read() == record.format(4) # No header is repeated.
+
+
+def test_postSlurpsDataChunked_commits_each_chunk(mock, vault, tmp_path):
+
+	uploads = []
+	mock.override("POST", "/slurps$", lambda path, query, body, headers: uploads.append(body))
+
+	report = vault.postSlurpsDataChunked(writeReadouts(tmp_path), project=1, rowsPerChunk=4, interval=0.01)
+
+	assert [len(report[state]) for state in ["committed", "rejected", "failed"]] == [3, 0, 0]
+	assert sorted((chunk["firstRow"], chunk["rows"]) for chunk in report["committed"]) == [(0, 4), (4, 4), (8, 2)]
+
+	assert len(uploads) == 3
+	assert all(b"Molecule Name,IC50\n" in body for body in uploads)
+
+	assert not any(os.path.exists(chunk["file"]) for chunk in report["committed"])
+	assert not os.path.exists(os.path.dirname(report["committed"][0]["file"])) # The temporary folder.
+
+
+def test_postSlurpsDataChunked_keeps_rejected_chunks(mock, vault, tmp_path):
+
+	rejected = []
+
+	def respond(path, query, body, headers):
+
+		# Rejects the first slurp polled:
+
+		slurpID = int(path.split("/")[-1])
+		if not rejected: rejected.append(slurpID)
+
+		if slurpID in rejected: return 200, json.dumps({"id": slurpID, "state": "rejected"}).encode()
+
+	mock.override("GET", r"/slurps/\d+$", respond)
+
+	report = vault.postSlurpsDataChunked(writeReadouts(tmp_path), project=1, rowsPerChunk=4, 
+										 chunkFolder=str(tmp_path / "chunks"), interval=0.01)
+
+	[chunk] = report["rejected"]
+
+	assert chunk["slurp"] == rejected[0] and chunk["response"]["state"] == "rejected"
+	assert len(report["committed"]) == 2
+	assert os.listdir(tmp_path / "chunks") == [os.path.basename(chunk["file"])] # Kept for a retry.
@@ -0,0 +1,58 @@
+'''
+Tests for the incremental JSON + base64 decoders used to stream large responses.
+'''
+
+
+import json
+
+import pytest
+
+from cdd_python_sdk.VaultClient import iterJSONObjects
+
+
+documents = [
+
+	{"count": 2.5, "objects": [1, 3.5, 2]},
+	{"objects": [-12, 1e5, 2.5E-3, True, None, "a,b", {"x": [10, 20]}], "count": 1234567},
+	[{"id": 1, "value": 0.125}, 42, False, "text"]
+]
+
+
+@pytest.mark.parametrize("document", documents)
+def test_iterJSONObjects_every_split(document):
+
+	encoded = json.dumps(document).encode("utf-8")
+	expected = document if isinstance(document, list) else document["objects"]
+
+	for split in range(len(encoded) + 1):
+
+		chunks = [encoded[:split], encoded[split:]]
+
+		assert list(iterJSONObjects(chunks)) == expected, f"split at {split}: {encoded[:split]!r}"
+
+
+def test_iterJSONObjects_single_bytes():
+
+	encoded = json.dumps(documents[1]).encode("utf-8")
+
+	assert list(iterJSONObjects(encoded[i:i + 1] for i in range(len(encoded)))) == documents[1]["objects"]
+
+
+@pytest.mark.mock_vault(molecules=2500)
+def test_iterMolecules_streams_an_export(mock, vault):
+
+	vault.setMaxPagedObjects(0) # Forces an asynchronous export.
+
+	chunks = list(vault.iterMolecules(chunkSize=1000))
+
+	assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+	assert [molecule["id"] for chunk in chunks for molecule in chunk] == list(range(1, 2501))
+	assert len(mock.getRequests("GET", r"/exports/\d+$")) == 1
+
+
+@pytest.mark.mock_vault(readouts=50)
+def test_iterProtocolData_yields_single_objects(mock, vault):
+
+	readouts = list(vault.iterProtocolData(1))
+
+	assert readouts == vault.getProtocolData(1, asDataFrame=False)
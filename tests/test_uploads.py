@@ -0,0 +1,120 @@
+'''
+Tests for multipart uploads streamed from disk (see MultipartEncoder, VaultClient.postFiles() + 
+VaultClient.postSlurpsData()).
+'''
+
+
+import email.parser
+import os
+
+import pytest
+
+from cdd_python_sdk.VaultClient import MultipartEncoder, RetryPolicy
+
+
+def parseMultipart(body, headers):
+	"""
+	:return (dict): the parts of a multipart/form-data request body, by name.
+	"""
+
+	message = email.parser.BytesParser().parsebytes(f"Content-Type: {headers['Content-Type']}\r\n\r\n".encode() + body)
+
+	return {part.get_param("name", header="content-disposition"): part for part in message.get_payload()}
+
+
+@pytest.fixture
+def upload(mock):
+	"""
+	:Description: records the request bodies + headers received by POST /files, as (body, headers) tuples.
+	"""
+
+	received = []
+
+	def record(path, query, body, headers):
+
+		received.append((body, headers))
+
+	mock.override("POST", "/files$", record)
+
+	return received
+
+
+@pytest.fixture
+def dataFile(tmp_path):
+
+	fileName = tmp_path / "data.bin"
+	fileName.write_bytes(os.urandom(300000))
+
+	return str(fileName)
+
+
+def test_postFiles_sends_the_file_and_fields(vault, upload, dataFile):
+
+	response = vault.postFiles("molecule", 7, dataFile)
+
+	assert response["size"] == len(upload[0][0])
+
+	[(body, headers)] = upload
+	parts = parseMultipart(body, headers)
+
+	assert int(headers["Content-Length"]) == len(body)
+	assert parts["file"].get_filename() == "data.bin"
+	assert parts["file"].get_payload(decode=True) == open(dataFile, "rb").read()
+	assert parts["resource_class"].get_payload() == "molecule"
+	assert parts["resource_id"].get_payload() == "7"
+
+
+def test_postFiles_reports_progress(vault, upload, dataFile):
+
+	calls = []
+
+	vault.postFiles("run", 1, dataFile, progress=lambda sent, total, rate: calls.append((sent, total)))
+
+	sent = [s for s, _ in calls]
+	total = len(upload[0][0])
+
+	assert sent == sorted(sent) and sent[-1] == total
+	assert {t for _, t in calls} == {total}
+	assert len(calls) > 1 # Reported per block, not once the upload is complete.
+
+
+def test_retried_uploads_resend_the_whole_body(mock, vault, upload, dataFile):
+
+	failures = [(503, b'{"error": "Service Unavailable"}', {"Retry-After": "0"})]
+
+	mock.override("POST", "/files$", lambda path, query, body, headers: failures.pop() if failures else None)
+	vault.setRetryPolicy(RetryPolicy(methods=("POST",)))
+
+	vault.postFiles("molecule", 7, dataFile)
+
+	assert len(upload) == 1 # The retry.
+	assert parseMultipart(*upload[0])["file"].get_payload(decode=True) == open(dataFile, "rb").read()
+
+
+def test_postSlurpsData_streams_the_import_file(mock, vault, tmp_path):
+
+	fileName = tmp_path / "readouts.csv"
+	fileName.write_text("Molecule Name,IC50\n" + "".join(f"MOL-{i},{i}\n" for i in range(1000)))
+
+	received = []
+	mock.override("POST", "/slurps$", lambda path, query, body, headers: received.append((body, headers)))
+
+	vault.postSlurpsData(str(fileName), project=1, interval=0.01)
+
+	parts = parseMultipart(*received[0])
+
+	assert parts["file"].get_payload(decode=True) == fileName.read_bytes()
+	assert '"project": 1' in parts["json"].get_payload()
+
+
+def test_encoder_closes_files_once_read(dataFile):
+
+	with MultipartEncoder([("file", ("data.bin", dataFile))], blockSize=1000) as body:
+
+		body.read(2000)
+		assert body.file is not None and not body.file.closed
+
+		body.read()
+		assert body.file is None or body.file.closed
+
+	assert body.file is None
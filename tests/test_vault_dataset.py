@@ -0,0 +1,84 @@
+'''
+Tests for writing vault data to partitioned Parquet datasets (see VaultDataset).
+'''
+
+
+import json
+import os
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from cdd_python_sdk.VaultDataset import VaultDataset
+
+
+fields = {"molecule": [{"name": "MW", "type": "Number"}, {"name": "Registered", "type": "Date"}], "batch": []}
+
+protocol = {"id": 1, "name": "Benchmark protocol",
+			"runs": [{"id": 100 + i, "run_date": f"2024-01-{1 + i % 2:02d}"} for i in range(10)],
+			"readout_definitions": [{"id": 101, "name": "IC50", "data_type": "Number"}, 
+									{"id": 102, "name": "Note", "data_type": "Text"}]}
+
+
+@pytest.fixture
+def dataset(mock, vault, tmp_path):
+
+	mock.override("GET", "/fields$", (200, json.dumps(fields).encode()))
+	mock.override("GET", "/protocols$", (200, json.dumps({"count": 1, "objects": [protocol]}).encode()))
+
+	return VaultDataset(vault, str(tmp_path / "datasets"))
+
+
+@pytest.mark.mock_vault(molecules=120)
+def test_molecules_are_written_with_declared_types(dataset):
+
+	assert dataset.writeMolecules(chunkSize=50) == 120
+
+	schema = dataset.getDataset("molecules").schema
+
+	assert schema.field("molecule_fields.MW").type == pa.float64()
+	assert schema.field("molecule_fields.Registered").type == pa.date32()
+
+	frame = dataset.read("molecules", columns=["id", "name"])
+
+	assert list(frame.columns) == ["id", "name"]
+	assert sorted(frame["id"]) == list(range(1, 121))
+
+
+@pytest.mark.mock_vault(molecules=20)
+def test_rewriting_molecules_replaces_the_dataset(dataset):
+
+	dataset.writeMolecules(chunkSize=50)
+	dataset.writeMolecules(chunkSize=50)
+
+	assert len(dataset.read("molecules")) == 20
+
+
+@pytest.mark.mock_vault(readouts=100)
+def test_protocol_data_is_partitioned_by_protocol_and_run_date(dataset):
+
+	assert dataset.writeProtocolData(1, chunkSize=30) == 100
+
+	path = dataset.getPath("protocol_data")
+
+	assert sorted(os.listdir(os.path.join(path, "protocol=1"))) == ["run_date=2024-01-01", "run_date=2024-01-02"]
+
+	schema = dataset.getDataset("protocol_data").schema
+
+	assert schema.field("101").type == pa.float64()
+	assert schema.field("102").type == pa.string()
+
+	frame = dataset.read("protocol_data", columns=["id", "run"], filters=[("run_date", "=", "2024-01-01")])
+
+	assert len(frame) == 50
+	assert set(frame["run"]) == {100, 102, 104, 106, 108}
+
+
+@pytest.mark.mock_vault(readouts=100)
+def test_rewriting_protocol_data_replaces_its_partitions(dataset):
+
+	dataset.writeProtocolData(1, chunkSize=30)
+	dataset.writeProtocolData(1, chunkSize=30)
+
+	assert len(dataset.read("protocol_data", filters=[("protocol", "=", 1)])) == 100
@@ -0,0 +1,136 @@
+'''
+Tests for incrementally syncing vault data into a local sqlite mirror (see VaultMirror).
+'''
+
+
+import datetime as dt
+import json
+import sqlite3
+
+import pytest
+import requests
+
+from cdd_python_sdk.VaultClient import RetryPolicy
+from cdd_python_sdk.VaultMirror import VaultMirror
+
+
+@pytest.fixture
+def mirror(vault, tmp_path):
+
+	with VaultMirror(vault, str(tmp_path / "mirror.db")) as mirror: yield mirror
+
+
+@pytest.mark.mock_vault(molecules=10)
+def test_watermark_is_sent_as_utc_timestamp(mock, mirror):
+
+	mirror.syncMolecules()
+	watermark = mirror.getWatermark("molecules")
+
+	mirror.syncMolecules()
+
+	first, second = mock.getQueries("GET", "/molecules$")
+
+	assert "modified_after" not in first
+	assert second["modified_after"] == [watermark.astimezone(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")]
+
+
+@pytest.mark.mock_vault(molecules=2500)
+def test_getObjects_with_more_ids_than_sqlite_variables(mock, mirror):
+
+	mirror.syncMolecules()
+	mirror.connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999) # As on older sqlite builds.
+
+	ids = list(range(2500, 0, -1)) + [1, 2]
+
+	molecules = mirror.getObjects("molecules", ids, asDataFrame=False)
+
+	assert [molecule["id"] for molecule in molecules] == list(range(1, 2501))
+
+
+class Molecules(object):
+	"""
+	:Description: molecules served by a mock vault override, honouring 'modified_after'.
+	"""
+
+	def __init__(self, mock, count):
+
+		self.molecules = {i: {"id": i, "name": f"MOL-{i}", "modified_at": "2024-01-01T00:00:00.000Z"} for i in range(1, count + 1)}
+
+		mock.override("GET", "/molecules$", self.respond)
+
+
+	def modify(self, moleculeID, name, modifiedAt):
+
+		self.molecules[moleculeID] = {"id": moleculeID, "name": name, "modified_at": modifiedAt}
+
+
+	def respond(self, path, query, body, headers):
+
+		after = query.get("modified_after", "")
+
+		objects = [m for m in self.molecules.values() if m["modified_at"][:19] > after[:19]]
+
+		return 200, json.dumps({"count": len(objects), "objects": objects}).encode()
+
+
+def test_sync_merges_only_modified_objects(mock, mirror):
+
+	molecules = Molecules(mock, 5)
+
+	assert mirror.syncMolecules() == 5
+
+	molecules.modify(3, "Renamed", "2024-02-01T12:30:00.000Z")
+
+	assert mirror.syncMolecules() == 1
+	assert mirror.syncMolecules() == 0
+
+	assert [m["name"] for m in mirror.getObjects("molecules", asDataFrame=False)] == ["MOL-1", "MOL-2", "Renamed", "MOL-4", "MOL-5"]
+	assert mirror.getWatermark("molecules") == dt.datetime(2024, 2, 1, 12, 30, tzinfo=dt.timezone.utc)
+
+
+def test_watermarks_persist_and_reset(mock, vault, mirror, tmp_path):
+
+	Molecules(mock, 5)
+	mirror.syncMolecules()
+
+	with VaultMirror(vault, mirror.path) as other:
+
+		assert other.syncMolecules() == 0 # Shares the watermark stored in the database.
+
+		other.resetWatermark("molecules")
+
+		assert other.getWatermark("molecules") is None
+		assert other.syncMolecules() == 5
+
+
+def test_watermarks_are_kept_per_query(mock, mirror):
+
+	Molecules(mock, 5)
+	mirror.syncMolecules(projects="1")
+
+	assert mirror.getWatermark("molecules", projects="1") is not None
+	assert mirror.getWatermark("molecules", projects="2") is None
+
+
+def test_failed_sync_keeps_the_watermark(mock, vault, mirror):
+
+	Molecules(mock, 5)
+	mock.override("GET", "/molecules$", (500, b'{"error": "Internal Server Error"}'))
+	vault.setRetryPolicy(RetryPolicy(maxRetries=0))
+
+	with pytest.raises(requests.exceptions.HTTPError): mirror.syncMolecules()
+
+	assert mirror.getWatermark("molecules") is None
+
+
+@pytest.mark.mock_vault(readouts=20)
+def test_protocol_data_is_filtered_by_date(mock, mirror):
+
+	assert mirror.syncProtocolData(1) == 20
+
+	mirror.syncProtocolData(1)
+
+	first, second = mock.getQueries("GET", "/readout_rows$")
+
+	assert first["protocols"] == ["1"] and "modified_after" not in first
+	assert second["modified_after"] == [mirror.getWatermark("readout_rows", protocols=1).date().isoformat()]